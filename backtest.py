@@ -1,37 +1,57 @@
 # backtest.py
 
+import functools
+import glob
 import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Mapping, Sequence, Tuple, cast
+from pathlib import Path
+from typing import Any, Dict, Hashable, Mapping, Optional, Sequence, Tuple, cast
 
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 from colorama import Back, Fore, Style, init  # type: ignore
 from tabulate import tabulate  # type: ignore
 
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - numba is an optional speedup
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """Fallback for ``numba.njit`` that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
 init(autoreset=True)
 
-# Ensure logs directory exists
 LOG_DIR = "logs"
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
-# Configure logging
-logging.basicConfig(
-    filename=os.path.join(
-        LOG_DIR,
-        f"backtest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
-    ),
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+
+
+def configure_logging() -> None:
+    """Send log records to a timestamped file under ``LOG_DIR``.
+
+    Called from ``main_backtest`` so that merely importing this module does not
+    create a log file.
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    log_file = Path(LOG_DIR) / f"backtest_{datetime.now():%Y%m%d_%H%M%S}.log"
+    logging.basicConfig(
+        filename=log_file,
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
 
 # Load configuration
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     try:
         with open("config.json", "r") as f:
@@ -63,61 +83,191 @@ min_profit_percent = config["min_profit_percent"]
 trade_amount = config["trade_amount"]
 max_trade_amount = config["max_trade_amount"]
 
-# Map symbols per exchange (if needed)
-exchange_symbol_map = {
-    "binance": symbol,
-    "kraken": symbol.replace("BTC", "XBT"),
-    "coinbase": symbol,
-    "bitfinex": symbol,
-    "huobi": symbol.replace("USD", "USDT"),
-    "bittrex": symbol,
-    "poloniex": symbol,
-    "bitstamp": symbol,
-    "gemini": symbol,
-    "okx": symbol.replace("USD", "USDT"),
-    "kucoin": symbol.replace("USD", "USDT"),
+# Parsed CSVs are cached here as parquet, keyed by source mtime and size
+CACHE_DIR = os.path.join("data", ".cache")
+
+# joblib cache for synchronized frames, keyed by source file mtimes
+SYNC_CACHE_DIR = ".hydrobot_cache"
+
+# Opt-in pyarrow CSV parser for large historical files (requires pyarrow)
+FAST_IO = os.environ.get("HYDROBOT_FAST_IO", "0") == "1"
+
+# Symbol substitutions per exchange (if needed)
+EXCHANGE_SYMBOL_REPLACEMENTS = {
+    "kraken": ("BTC", "XBT"),
+    "huobi": ("USD", "USDT"),
+    "okx": ("USD", "USDT"),
+    "kucoin": ("USD", "USDT"),
     # Add more exchanges if needed
 }
 
 
+@functools.lru_cache(maxsize=None)
+def get_ex_symbol(exchange: str, symbol: str) -> str:
+    """Return how ``exchange`` spells ``symbol``."""
+    replacement = EXCHANGE_SYMBOL_REPLACEMENTS.get(exchange)
+    if replacement is None:
+        return symbol
+    return symbol.replace(*replacement)
+
+
+def data_filename(exchange: str, symbol: str) -> str:
+    ex_symbol = get_ex_symbol(exchange, symbol)
+    return f"data/{exchange}_{ex_symbol.replace('/', '')}.csv"
+
+
+def read_price_csv(filename: str) -> pd.DataFrame:
+    if FAST_IO:
+        df = pd.read_csv(filename, engine="pyarrow", parse_dates=["timestamp"])
+    else:
+        df = pd.read_csv(filename, parse_dates=["timestamp"])
+    df.sort_values("timestamp", inplace=True)
+    # Ensure timestamps are timezone-naive, converting only when needed
+    timestamps = df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    df["timestamp"] = timestamps
+    df.set_index("timestamp", inplace=True)
+    return df
+
+
+def load_price_data(filename: str) -> pd.DataFrame:
+    """Load a price CSV, reusing the parquet cache while the file is unchanged.
+
+    Cache files are named after the CSV, so each exchange/symbol pair keeps its
+    own entry and only that file's outdated entries are purged.
+    """
+    stat = os.stat(filename)
+    name = Path(filename).stem
+    cache_path = os.path.join(
+        CACHE_DIR, f"{name}_{stat.st_mtime_ns}_{stat.st_size}.parquet"
+    )
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+    df = read_price_csv(filename)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        stale_pattern = os.path.join(CACHE_DIR, f"{glob.escape(name)}_*.parquet")
+        stale_name = re.compile(rf"{re.escape(name)}_\d+_\d+\.parquet")
+        for stale_path in glob.glob(stale_pattern):
+            if stale_name.fullmatch(os.path.basename(stale_path)):
+                os.remove(stale_path)
+        df.to_parquet(cache_path)
+    except (ImportError, OSError) as e:
+        logging.warning(f"Could not cache {filename} as parquet: {e}")
+    return df
+
+
+def _load_exchange_data(exchange: str, symbol: str) -> Optional[pd.DataFrame]:
+    filename = data_filename(exchange, symbol)
+    try:
+        df = load_price_data(filename)
+        logging.info(f"Loaded data for {exchange}")
+        return df
+    except FileNotFoundError:
+        logging.error("Data file %s not found.", filename)
+    except Exception as e:
+        logging.error(f"Error loading data from {filename}: {e}")
+    return None
+
+
 def load_historical_data(
     exchange_names: Sequence[str],
     symbol: str,
 ) -> Dict[str, pd.DataFrame]:
+    if not exchange_names:
+        return {}
+    # CSV parsing releases the GIL, so exchanges are loaded concurrently
+    results: Dict[str, Optional[pd.DataFrame]] = {}
+    with ThreadPoolExecutor(max_workers=min(32, len(exchange_names))) as executor:
+        futures = {
+            executor.submit(_load_exchange_data, exchange, symbol): exchange
+            for exchange in exchange_names
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    # Keep the requested exchange order for the merged columns
     data = {}
     for exchange in exchange_names:
-        ex_symbol = exchange_symbol_map.get(exchange, symbol)
-        filename = f"data/{exchange}_{ex_symbol.replace('/', '')}.csv"
-        try:
-            df = pd.read_csv(filename, parse_dates=["timestamp"])
-            df.sort_values("timestamp", inplace=True)
-            # Ensure timestamps are timezone-naive
-            df["timestamp"] = pd.to_datetime(df["timestamp"]).dt.tz_localize(None)
-            df.set_index("timestamp", inplace=True)
+        df = results[exchange]
+        if df is not None:
             data[exchange] = df
-            logging.info(f"Loaded data for {exchange}")
-        except FileNotFoundError:
-            logging.error("Data file %s not found.", filename)
-        except Exception as e:
-            logging.error(f"Error loading data from {filename}: {e}")
     return data
 
 
-def synchronize_data(data: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
-    # Merge on timestamp using outer join and forward fill
-    df_list = []
-    for ex_name, df in data.items():
-        df = df[["bid", "ask"]]
-        df.columns = pd.MultiIndex.from_product([[ex_name], df.columns])
-        df_list.append(df)
-    if not df_list:
+def synchronize_data(
+    data: Mapping[str, pd.DataFrame],
+    source_key: Optional[Hashable] = None,
+) -> pd.DataFrame:
+    """Merge exchange quotes on the union of timestamps and forward fill.
+
+    ``source_key`` is not used by the merge itself; it identifies the input
+    files when the call goes through ``synchronize_data_cached``.
+    """
+    if not data:
         logging.error("No data frames to merge. Exiting.")
         exit(1)
-    df_merged = pd.concat(df_list, axis=1).ffill().dropna()
+    ex_names = list(data)
+    ex_times = [df.index.values.astype("datetime64[ns]") for df in data.values()]
+    union_ts = functools.reduce(np.union1d, ex_times)
+
+    values = np.full((len(union_ts), 2 * len(ex_names)), np.nan)
+    for i, (df, times) in enumerate(zip(data.values(), ex_times)):
+        pos = np.searchsorted(union_ts, times)
+        values[pos, 2 * i] = df["bid"].to_numpy(dtype=np.float64)
+        values[pos, 2 * i + 1] = df["ask"].to_numpy(dtype=np.float64)
+
+    # Forward fill each column with the row index of its last valid value
+    valid = ~np.isnan(values)
+    last_valid = np.where(valid, np.arange(len(union_ts))[:, None], 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    values = values[last_valid, np.arange(values.shape[1])]
+
+    keep = ~np.isnan(values).any(axis=1)
+    df_merged = pd.DataFrame(
+        values[keep],
+        index=pd.DatetimeIndex(union_ts[keep], name="timestamp"),
+        columns=pd.MultiIndex.from_product([ex_names, ["bid", "ask"]]),
+    )
     logging.info("Data synchronized across exchanges")
     return df_merged
 
 
+@functools.lru_cache(maxsize=1)
+def _sync_memory() -> Optional[Any]:
+    try:
+        from joblib import Memory  # type: ignore
+    except ImportError:
+        return None
+    return Memory(SYNC_CACHE_DIR, verbose=0)
+
+
+def synchronize_data_cached(
+    data: Mapping[str, pd.DataFrame], symbol: str
+) -> pd.DataFrame:
+    """Synchronize ``data``, reusing the on-disk result while inputs are unchanged.
+
+    The cache key is the mtime and size of every source CSV, so repeated runs
+    (e.g. sweeps over ``min_profit_percent``) skip the merge entirely.
+    """
+    memory = _sync_memory()
+    if memory is None:
+        return synchronize_data(data)
+    source_key = []
+    for exchange in data:
+        stat = os.stat(data_filename(exchange, symbol))
+        source_key.append((exchange, stat.st_mtime_ns, stat.st_size))
+    cached = memory.cache(synchronize_data, ignore=["data"])
+    return cast(pd.DataFrame, cached(data, tuple(source_key)))
+
+
+@njit(cache=True, inline="always")
 def calculate_profit(
     buy_price: float,
     sell_price: float,
@@ -140,174 +290,231 @@ def calculate_profit(
     return profit_percent, profit
 
 
-def check_arbitrage_opportunities(
-    exchanges_config: Mapping[str, Mapping[str, Any]],
-    order_books: Mapping[str, Mapping[str, float]],
-    balances: Mapping[str, Mapping[str, float]],
-) -> List[Dict[str, Any]]:
-    opportunities = []
-    exchange_names = list(order_books.keys())
-    for buy_ex in exchange_names:
-        for sell_ex in exchange_names:
-            if buy_ex == sell_ex:
-                continue
-            buy_price = order_books[buy_ex]["ask"]
-            sell_price = order_books[sell_ex]["bid"]
-            if buy_price and sell_price and buy_price < sell_price:
-                buy_fee = exchanges_config[buy_ex]["fees"]["taker"]
-                sell_fee = exchanges_config[sell_ex]["fees"]["taker"]
-
-                # Calculate maximum amount based on USD balance only
-                max_amount_usd = balances[buy_ex]["USD"] / (buy_price * (1 + buy_fee))
-                max_amount = min(trade_amount, max_trade_amount, max_amount_usd)
-
-                if max_amount > 0:
-                    profit_percent, profit = calculate_profit(
-                        buy_price,
-                        sell_price,
-                        buy_fee,
-                        sell_fee,
-                        max_amount,
-                        slippage=0.0005,
-                    )
-                    logging.debug(
-                        "Evaluated opportunity: Buy on %s at %s, "
-                        "Sell on %s at %s, Profit%%: %.4f",
-                        buy_ex,
-                        buy_price,
-                        sell_ex,
-                        sell_price,
-                        profit_percent,
-                    )
-                    logging.info(
-                        "Evaluated opportunity: Buy on %s at %s, "
-                        "Sell on %s at %s, Profit%%: %.4f",
-                        buy_ex,
-                        buy_price,
-                        sell_ex,
-                        sell_price,
-                        profit_percent,
-                    )
-                    if profit_percent >= min_profit_percent:
-                        opportunity = {
-                            "buy_exchange": buy_ex,
-                            "sell_exchange": sell_ex,
-                            "buy_price": buy_price,
-                            "sell_price": sell_price,
-                            "profit_percent": profit_percent,
-                            "profit": profit,
-                            "amount": max_amount,
-                            "timestamp": None,  # To be set during backtesting
-                        }
-                        opportunities.append(opportunity)
-    return opportunities
-
-
-def simulate_trade(
-    balances: Dict[str, Dict[str, float]],
-    opportunity: Mapping[str, Any],
-    exchanges_config: Mapping[str, Mapping[str, Any]],
-) -> bool:
-    buy_ex = opportunity["buy_exchange"]
-    sell_ex = opportunity["sell_exchange"]
-    amount = opportunity["amount"]
-    buy_price = opportunity["buy_price"]
-    sell_price = opportunity["sell_price"]
-    buy_fee = exchanges_config[buy_ex]["fees"]["taker"]
-    sell_fee = exchanges_config[sell_ex]["fees"]["taker"]
-
-    cost = amount * buy_price * (1 + buy_fee)
-    revenue = amount * sell_price * (1 - sell_fee)
-
-    # Check if sufficient USD balance exists for buying
-    if balances[buy_ex]["USD"] >= cost:
-        # Execute the trade
-        balances[buy_ex]["USD"] -= cost
-        balances[sell_ex]["USD"] += revenue
-
-        # No need to adjust BTC balances because buy and sell are immediate
-
-        logging.info(
-            "Trade executed: Buy %s BTC on %s at %s, Sell on %s at %s",
-            amount,
-            buy_ex,
-            buy_price,
-            sell_ex,
-            sell_price,
-        )
-        return True
-    else:
-        logging.warning(
-            "Insufficient USD balance for trade on %s. " "Required: %s, Available: %s",
-            buy_ex,
-            cost,
-            balances[buy_ex]["USD"],
+def find_arbitrage_candidates(
+    bids: np.ndarray,
+    asks: np.ndarray,
+    taker_fees: np.ndarray,
+    slippage: float = 0.0005,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Screen every (timestamp, buy, sell) combination in one vectorized pass.
+
+    ``bids`` and ``asks`` are ``(T, N)`` price arrays and ``taker_fees`` holds the
+    taker fee of each of the ``N`` exchanges. Returns the ``(K, 3)`` array of
+    ``(t, buy_idx, sell_idx)`` rows that clear ``min_profit_percent`` (ordered by
+    timestamp, then buy exchange, then sell exchange) together with their profit
+    percentages.
+    """
+    # Effective prices after slippage and fees, computed once per (t, exchange)
+    buy_eff = asks * (1 + slippage) * (1 + taker_fees[None, :])
+    sell_eff = bids * (1 - slippage) * (1 - taker_fees[None, :])
+    # profit_pct >= min_profit_percent  <=>  sell_eff >= buy_eff * (1 + min / 100)
+    threshold = buy_eff * (1 + min_profit_percent / 100)
+    mask = (
+        (asks[:, :, None] > 0)
+        & (asks[:, :, None] < bids[:, None, :])
+        & (threshold[:, :, None] <= sell_eff[:, None, :])
+    )
+    # Buying and selling on the same exchange is not an arbitrage
+    mask &= ~np.eye(asks.shape[1], dtype=bool)[None, :, :]
+    candidates = np.argwhere(mask)
+    t_idx, buy_idx, sell_idx = candidates.T
+    profit_pct = (sell_eff[t_idx, sell_idx] / buy_eff[t_idx, buy_idx] - 1) * 100
+    return candidates, profit_pct
+
+
+@njit(cache=True)
+def _apply_trades_numba(
+    candidates: np.ndarray,
+    balances_usd: np.ndarray,
+    taker_fees: np.ndarray,
+    slippage: float,
+    trade_amount: float,
+    max_trade_amount: float,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Apply screened candidates to the USD balances in timestamp order.
+
+    Each candidate row is ``(t, buy_idx, sell_idx, buy_price, sell_price,
+    profit_percent)`` and fees are looked up by exchange position in
+    ``taker_fees``. Returns the executed trades as rows of
+    ``(t, buy_idx, sell_idx, buy_price, sell_price, amount, profit,
+    profit_percent)``, the updated balances and the number of candidates skipped
+    for lack of USD balance.
+    """
+    n = candidates.shape[0]
+    trade_log = np.empty((n, 8))
+    usd_at_t = balances_usd.copy()
+    current_t = -1.0
+    k = 0
+    skipped = 0
+    for c in range(n):
+        t = candidates[c, 0]
+        buy = int(candidates[c, 1])
+        sell = int(candidates[c, 2])
+        buy_price = candidates[c, 3]
+        sell_price = candidates[c, 4]
+        buy_fee = taker_fees[buy]
+        sell_fee = taker_fees[sell]
+
+        # Trade sizes are based on the balances at the start of each timestamp
+        if t != current_t:
+            current_t = t
+            usd_at_t[:] = balances_usd
+        max_amount_usd = usd_at_t[buy] / (buy_price * (1 + buy_fee))
+        amount = min(trade_amount, max_trade_amount, max_amount_usd)
+        if amount <= 0:
+            continue
+
+        # Check if sufficient USD balance exists for buying
+        cost = amount * buy_price * (1 + buy_fee)
+        if balances_usd[buy] < cost:
+            skipped += 1
+            continue
+        balances_usd[buy] -= cost
+        balances_usd[sell] += amount * sell_price * (1 - sell_fee)
+
+        _, profit = calculate_profit(
+            buy_price, sell_price, buy_fee, sell_fee, amount, slippage
         )
-        return False
+        trade_log[k, 0] = t
+        trade_log[k, 1] = buy
+        trade_log[k, 2] = sell
+        trade_log[k, 3] = buy_price
+        trade_log[k, 4] = sell_price
+        trade_log[k, 5] = amount
+        trade_log[k, 6] = profit
+        trade_log[k, 7] = candidates[c, 5]
+        k += 1
+    return trade_log[:k], balances_usd, skipped
 
 
 def backtest(
     df_merged: pd.DataFrame,
     exchanges_config: Mapping[str, Mapping[str, Any]],
     initial_balance: float,
-) -> Tuple[Dict[str, Dict[str, float]], List[Dict[str, Any]]]:
-    exchange_names = df_merged.columns.levels[0]
-    # Initialize balances with USD only
-    balances = {ex: {"USD": initial_balance, "BTC": 0} for ex in exchange_names}
-    trade_log = []
-
-    for timestamp, row in df_merged.iterrows():
-        order_books = {}
-        for ex in exchange_names:
-            bid = row.get((ex, "bid"), None)
-            ask = row.get((ex, "ask"), None)
-            order_books[ex] = {"bid": bid, "ask": ask}
-
-        # Check for arbitrage opportunities
-        opportunities = check_arbitrage_opportunities(
-            exchanges_config, order_books, balances
+) -> Tuple[Dict[str, Dict[str, float]], pd.DataFrame]:
+    # Column order, not the (sorted, possibly stale) MultiIndex levels
+    exchange_names = list(df_merged.columns.get_level_values(0).unique())
+
+    # Plain array access instead of per-row Series and MultiIndex lookups
+    values = df_merged.to_numpy(dtype=np.float64)
+    timestamps = df_merged.index.to_numpy()
+    bid_cols = [df_merged.columns.get_loc((ex, "bid")) for ex in exchange_names]
+    ask_cols = [df_merged.columns.get_loc((ex, "ask")) for ex in exchange_names]
+    bids = values[:, bid_cols]
+    asks = values[:, ask_cols]
+    taker_fees = np.array(
+        [exchanges_config[ex]["fees"]["taker"] for ex in exchange_names],
+        dtype=np.float64,
+    )
+    slippage = config.get("slippage", 0.0005)
+
+    # Only the profitable (timestamp, buy, sell) cells are visited in Python
+    idx, profit_pcts = find_arbitrage_candidates(bids, asks, taker_fees, slippage)
+    n_exchanges = len(exchange_names)
+    logging.info(
+        "%d pairs evaluated over %d timestamps, %d opportunities",
+        n_exchanges * (n_exchanges - 1),
+        len(df_merged),
+        len(idx),
+    )
+    t_idx, buy_idx, sell_idx = idx.T
+    candidates = np.column_stack(
+        (
+            idx.astype(np.float64),
+            asks[t_idx, buy_idx],
+            bids[t_idx, sell_idx],
+            profit_pcts,
         )
+    )
 
-        # Simulate trades
-        for opp in opportunities:
-            opp["timestamp"] = timestamp
-            success = simulate_trade(balances, opp, exchanges_config)
-            if success:
-                trade_log.append({"timestamp": timestamp, **opp})
-    return balances, trade_log
-
-
-def calculate_advanced_metrics(trade_log_df: pd.DataFrame) -> Dict[str, Any]:
-    df = trade_log_df.copy()
-
-    avg_profit_per_trade = df["profit"].mean()
-    largest_profit = df["profit"].max()
-    largest_loss = df["profit"].min()
+    # Initialize balances with USD only
+    balances_usd = np.full(len(exchange_names), initial_balance, dtype=np.float64)
+    trades, balances_usd, skipped = _apply_trades_numba(
+        candidates,
+        balances_usd,
+        taker_fees,
+        slippage,
+        float(trade_amount),
+        float(max_trade_amount),
+    )
+    if skipped:
+        logging.warning("Skipped %d trades due to insufficient USD balance.", skipped)
 
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df.loc[:, "duration"] = df["timestamp"].diff()
-    df = df.dropna(subset=["duration"])
-    df.loc[:, "duration"] = pd.to_timedelta(df["duration"])
-    avg_trade_duration = df["duration"].mean()
-    avg_trade_duration_in_minutes = avg_trade_duration.total_seconds() / 60
+    balances = {
+        ex: {"USD": float(usd), "BTC": 0}
+        for ex, usd in zip(exchange_names, balances_usd)
+    }
+    t_out = trades[:, 0].astype(np.intp)
+    buy_out = trades[:, 1].astype(np.intp)
+    sell_out = trades[:, 2].astype(np.intp)
+    trade_log_df = pd.DataFrame(
+        {
+            "timestamp": timestamps[t_out],
+            # Exchanges stay integer-coded; names are only looked up on output
+            "buy_exchange": pd.Categorical.from_codes(buy_out, exchange_names),
+            "sell_exchange": pd.Categorical.from_codes(sell_out, exchange_names),
+            "buy_price": trades[:, 3],
+            "sell_price": trades[:, 4],
+            "profit_percent": trades[:, 7],
+            "profit": trades[:, 6],
+            "amount": trades[:, 5],
+        }
+    )
+    # One record per trade; skip building them when INFO is disabled
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        for buy_ex, sell_ex, buy_price, sell_price, amount in zip(
+            trade_log_df["buy_exchange"],
+            trade_log_df["sell_exchange"],
+            trades[:, 3],
+            trades[:, 4],
+            trades[:, 5],
+        ):
+            logging.info(
+                "Trade executed: Buy %s BTC on %s at %s, Sell on %s at %s",
+                amount,
+                buy_ex,
+                buy_price,
+                sell_ex,
+                sell_price,
+            )
+    return balances, trade_log_df
 
-    trade_frequency = len(df) / len(df["timestamp"].unique())
 
-    df.loc[:, "return"] = df["profit"] / (df["buy_price"] * df["amount"])
-    total_return = df["return"].sum()
-    days = (df["timestamp"].max() - df["timestamp"].min()).days
+def calculate_advanced_metrics(trade_log_df: pd.DataFrame) -> Dict[str, Any]:
+    profits = trade_log_df["profit"].to_numpy(dtype=np.float64)
+    avg_profit_per_trade = profits.mean()
+    largest_profit = profits.max()
+    largest_loss = profits.min()
+
+    # Metrics below use every trade except the first, which has no duration
+    timestamps = trade_log_df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    ts_ns = timestamps.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    durations = np.diff(ts_ns)
+    ts_ns = ts_ns[1:]
+    avg_trade_duration_in_minutes = durations.mean() / (60 * 1e9)
+
+    trade_frequency = len(ts_ns) / len(np.unique(ts_ns))
+
+    returns = profits[1:] / (
+        trade_log_df["buy_price"].to_numpy(dtype=np.float64)[1:]
+        * trade_log_df["amount"].to_numpy(dtype=np.float64)[1:]
+    )
+    total_return = returns.sum()
+    days = int((ts_ns.max() - ts_ns.min()) // (86400 * 10**9))
     annualized_return = (1 + total_return) ** (365 / days) - 1 if days > 0 else 0
 
-    sharpe_ratio = np.sqrt(365) * df["return"].mean() / df["return"].std()
-    downside_returns = df[df["return"] < 0]["return"]
+    sharpe_ratio = np.sqrt(365) * returns.mean() / returns.std(ddof=1)
+    downside_returns = returns[returns < 0]
     sortino_ratio = (
-        np.sqrt(365) * df["return"].mean() / downside_returns.std()
+        np.sqrt(365) * returns.mean() / downside_returns.std(ddof=1)
         if len(downside_returns) > 0
         else np.inf
     )
 
-    cumulative_returns = (1 + df["return"]).cumprod()
-    peak = cumulative_returns.expanding(min_periods=1).max()
+    cumulative_returns = np.cumprod(1 + returns)
+    peak = np.maximum.accumulate(cumulative_returns)
     drawdown = cumulative_returns / peak - 1
     max_drawdown = drawdown.min()
 
@@ -340,6 +547,8 @@ def color_profit(value: str) -> str:
 
 
 def main_backtest() -> None:
+    configure_logging()
+
     # Option to run full backtest or with specific exchanges
     if len(sys.argv) > 1 and sys.argv[1] == "partial":
         # Run backtest with Coinbase and Bitfinex only
@@ -356,17 +565,14 @@ def main_backtest() -> None:
         logging.error("No data loaded. Exiting.")
         return
 
-    df_merged = synchronize_data(data)
+    df_merged = synchronize_data_cached(data, symbol)
     initial_balance = config["initial_balance"]
 
     # Run backtest
-    balances, trade_log = backtest(df_merged, exchanges_config, initial_balance)
-
-    # Convert trade_log to DataFrame
-    trade_log_df = pd.DataFrame(trade_log)
+    balances, trade_log_df = backtest(df_merged, exchanges_config, initial_balance)
 
     # Calculate performance metrics
-    total_profit = sum(trade["profit"] for trade in trade_log)
+    total_profit = trade_log_df["profit"].sum() if not trade_log_df.empty else 0.0
     logging.info(f"Total Profit: ${total_profit:.2f}")
     logging.info(f"Final Balances: {balances}")
 
@@ -374,8 +580,6 @@ def main_backtest() -> None:
     end_time = datetime.strptime("2021-01-01 03:47:00", "%Y-%m-%d %H:%M:%S")
     time_diff = end_time - start_time
 
-    total_profit = trade_log_df["profit"].sum()
-
     summary_data = [
         ["Total Profit", f"{Fore.GREEN}${total_profit:.2f}{Style.RESET_ALL}"],
         ["Number of Trades", len(trade_log_df)],
@@ -393,11 +597,6 @@ def main_backtest() -> None:
         f"{time_diff}{Style.RESET_ALL}\n"
     )
 
-    summary_data = [
-        ["Total Profit", f"{Fore.GREEN}${total_profit:.2f}{Style.RESET_ALL}"],
-        ["Number of Trades", len(trade_log_df)],
-        ["Time Frame", f"{Fore.YELLOW}{time_diff}{Style.RESET_ALL}"],
-    ]
     print(
         tabulate(
             summary_data,
@@ -476,19 +675,25 @@ def main_backtest() -> None:
     print(f"\n{Fore.CYAN}Trade Log:{Style.RESET_ALL}")
 
     if not trade_log_df.empty:
-        trade_log_df_display = trade_log_df.copy()
-        trade_log_df_display["timestamp"] = trade_log_df_display[
-            "timestamp"
-        ].dt.strftime("%Y-%m-%d %H:%M:%S")
-        trade_log_df_display["profit"] = trade_log_df_display["profit"].apply(
-            lambda x: color_profit(f"${x:.2f}")
+        # Select 3 rows with different profits, falling back to any 3 rows
+        unique_profits = trade_log_df[~trade_log_df["profit"].round(2).duplicated()]
+        if len(unique_profits) >= 3:
+            sample_rows = unique_profits.sample(n=3)
+        else:
+            sample_rows = trade_log_df.sample(n=min(3, len(trade_log_df)))
+
+        # Sort the sample rows by timestamp and format only those rows
+        sample_rows = sample_rows.sort_values("timestamp")
+        sample_rows = sample_rows.assign(
+            timestamp=sample_rows["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+            profit=sample_rows["profit"].map(lambda x: color_profit(f"${x:.2f}")),
+            **{
+                col: sample_rows[col].cat.rename_categories(
+                    lambda x: f"{Fore.YELLOW}{x}{Style.RESET_ALL}"
+                )
+                for col in ("buy_exchange", "sell_exchange")
+            },
         )
-        trade_log_df_display["buy_exchange"] = trade_log_df_display[
-            "buy_exchange"
-        ].apply(lambda x: f"{Fore.YELLOW}{x}{Style.RESET_ALL}")
-        trade_log_df_display["sell_exchange"] = trade_log_df_display[
-            "sell_exchange"
-        ].apply(lambda x: f"{Fore.YELLOW}{x}{Style.RESET_ALL}")
 
         display_columns = [
             "timestamp",
@@ -499,16 +704,6 @@ def main_backtest() -> None:
             "profit",
         ]
 
-        # Select 3 rows with different profits
-        sample_rows = trade_log_df_display.drop_duplicates("profit").sample(n=3)
-
-        # If we couldn't get 3 unique profit values, just take 3 random rows
-        if len(sample_rows) < 3:
-            sample_rows = trade_log_df_display.sample(n=3)
-
-        # Sort the sample rows by timestamp
-        sample_rows = sample_rows.sort_values("timestamp")
-
         print(
             f"\n{Fore.CYAN}{Back.BLACK}"
             f"{'SELECTED TRADES FROM LOG':^70}{Style.RESET_ALL}"
@@ -26,7 +26,9 @@ external_stylesheets = [
 app = dash.Dash(
     __name__,
     external_stylesheets=external_stylesheets,
-    suppress_callback_exceptions=True,  # Set to True if callbacks are in different files
+    # Callbacks target component ids that layouts.py does not define yet,
+    # so Dash must not validate them against the initial layout
+    suppress_callback_exceptions=True,
     title="HydroBot Dashboard",
     update_title="Updating...",
 )
@@ -35,6 +37,10 @@ server = app.server  # Expose server for potential WSGI deployment (e.g., Gunico
 # --- Define App Layout ---
 app.layout = create_layout()
 
+# --- Register Callbacks ---
+# Imported at module scope so WSGI servers (e.g. Gunicorn) register them too.
+from hydrobot.dashboard import callbacks  # noqa: E402,F401
+
 
 # --- Setup Redis Data Provider ---
 @app.before_first_request
@@ -49,9 +55,6 @@ async def setup_data_provider():
 
 # --- Run the App ---
 if __name__ == "__main__":
-    # Register Callbacks (import here to avoid circular imports)
-    from hydrobot.dashboard import callbacks  # noqa: F401
-
     # Setup basic logging for dashboard process if run directly
     # Note: If run via main.py, logging might be configured there already
     # Check if logging is already configured by root logger to avoid duplicate handlers
@@ -1,10 +1,10 @@
 """Dash callbacks for real-time dashboard updates."""
 
-from datetime import datetime  # Keep datetime as it may be used elsewhere
-from typing import List
+import functools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
 
-import pandas as pd
-import plotly.graph_objs as go
+import numpy as np
 from dash import Input, Output, callback, html
 from dash.exceptions import PreventUpdate
 import json
@@ -14,6 +14,108 @@ from hydrobot.utils.logger_setup import get_logger
 
 log = get_logger(__name__)
 
+# Figures are returned as plain dicts (serialized by Dash's plotly JSON
+# encoder), so this module does not import plotly.graph_objs or pandas.
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Static figure layouts, built once and shared by every render.
+PORTFOLIO_LAYOUT = {
+    "title": "Portfolio Value Over Time",
+    "xaxis": {"title": "Time"},
+    "yaxis": {"title": "Value (USD)"},
+    "height": 400,
+}
+TRADE_HISTORY_LAYOUT = {
+    "xaxis": {"title": "Time"},
+    "yaxis": {"title": "Price"},
+    "height": 400,
+}
+
+# Trade traces with more points than this are bucketed in time server-side.
+MAX_TRADE_POINTS = 500
+
+
+def _trade_trace(
+    trades: Any, name: str, marker: Dict[str, Any], window_ns: int
+) -> Dict[str, Any]:
+    """Build a trade marker trace, bucketing trades in time when there are many.
+
+    Each bucket is drawn at its last trade price, with error bars spanning the
+    bucket's low/high and the trade count in the hover text.
+
+    Args:
+        trades: Trade history DataFrame indexed by timestamp
+        name: Trace name
+        marker: Plotly marker style
+        window_ns: Length of the displayed time window in nanoseconds
+
+    Returns:
+        Scatter trace with at most about MAX_TRADE_POINTS points
+    """
+    prices = trades["price"].to_numpy()
+    if len(prices) <= MAX_TRADE_POINTS:
+        return {
+            "type": "scatter",
+            "x": trades.index.to_numpy(),
+            "y": prices,
+            "mode": "markers",
+            "name": name,
+            "marker": marker,
+        }
+
+    ts = trades.index.asi8
+    bucket_ns = max(1, window_ns // MAX_TRADE_POINTS)
+    bins = (ts - ts[0]) // bucket_ns
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    last = prices[np.r_[starts[1:] - 1, len(prices) - 1]]
+    high = np.maximum.reduceat(prices, starts)
+    low = np.minimum.reduceat(prices, starts)
+    counts = np.diff(np.r_[starts, len(prices)])
+    return {
+        "type": "scatter",
+        "x": (ts[0] + bins[starts] * bucket_ns).view("datetime64[ns]"),
+        "y": last,
+        "mode": "markers",
+        "name": name,
+        "marker": marker,
+        "error_y": {
+            "type": "data",
+            "symmetric": False,
+            "array": high - last,
+            "arrayminus": last - low,
+        },
+        "customdata": counts,
+        "hovertemplate": f"%{{y}} (%{{customdata}} trades)<extra>{name}</extra>",
+    }
+
+
+def _stats(values: np.ndarray) -> Tuple[float, float, float]:
+    """Compute max drawdown and mean/std of per-update returns.
+
+    Args:
+        values: Portfolio values in time order; NaN entries are ignored
+
+    Returns:
+        Tuple of (max drawdown in value units, mean return, return std)
+    """
+    if len(values) < 2:
+        return 0.0, 0.0, 0.0
+    drawdown = float(np.nanmax(np.fmax.accumulate(values) - values))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(values) / values[:-1]
+    returns = returns[np.isfinite(returns)]
+    if not len(returns):
+        return drawdown, 0.0, 0.0
+    return drawdown, float(returns.mean()), float(returns.std())
+
+
+def _format_ns(ts_ns: int) -> str:
+    """Format an epoch-nanosecond timestamp as a UTC display string."""
+    return datetime.fromtimestamp(ts_ns // 1_000_000_000, tz=timezone.utc).strftime(
+        TIME_FORMAT
+    )
+
 
 # --- Portfolio Value & PnL Updates ---
 @callback(
@@ -29,39 +131,49 @@ def update_portfolio_value(n_intervals: int, timeframe: str) -> tuple:
         log.warning("Dashboard not connected to Redis")
         raise PreventUpdate
 
+    # Idle ticks from any browser session hit the cache for this data version
+    return _build_portfolio_figure(timeframe, dashboard_data.last_update_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_portfolio_figure(timeframe: str, last_update_ns: int) -> tuple:
+    """Build the portfolio figure and stats; cached per data version."""
     # Convert timeframe to minutes
     minutes = {"1H": 60, "4H": 240, "1D": 1440, "1W": 10080}.get(timeframe, 60)
 
     # Get portfolio history
-    df = dashboard_data.get_portfolio_history(minutes=minutes)
-    if df.empty:
+    timestamps, values = dashboard_data.get_portfolio_values(minutes=minutes)
+    if not len(values):
         raise PreventUpdate
 
     # Create portfolio value figure
     figure = {
         "data": [
-            go.Scatter(
-                x=df.index, y=df["total_value"], name="Portfolio Value", fill="tozeroy"
-            )
+            {
+                "type": "scatter",
+                # Copies: the provider's arrays are views into its live buffers
+                "x": timestamps.copy(),
+                "y": values.copy(),
+                "name": "Portfolio Value",
+                "fill": "tozeroy",
+            }
         ],
-        "layout": {
-            "title": "Portfolio Value Over Time",
-            "xaxis": {"title": "Time"},
-            "yaxis": {"title": "Value (USD)"},
-            "height": 400,
-        },
+        "layout": PORTFOLIO_LAYOUT,
     }
 
     # Calculate statistics
-    start_value = df["total_value"].iloc[0] if not df.empty else 0
-    current_value = df["total_value"].iloc[-1] if not df.empty else 0
+    start_value = float(values[0])
+    current_value = float(values[-1])
     pnl = current_value - start_value
-    pnl_pct = (pnl / start_value * 100) if start_value > 0 else 0
+    pnl_pct = (pnl / start_value * 100) if start_value > 0 else 0.0
+    drawdown, mean_return, return_std = _stats(values)
 
     stats = [
         f"Current Value: ${current_value:,.2f}",
         f"Period P&L: ${pnl:,.2f} ({pnl_pct:+.2f}%)",
-        f"Last Update: {dashboard_data.last_update.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Max Drawdown: ${drawdown:,.2f}",
+        f"Return per Update: {mean_return * 100:+.3f}% (σ {return_std * 100:.3f}%)",
+        f"Last Update: {_format_ns(last_update_ns)}",
     ]
 
     return figure, stats
@@ -80,21 +192,16 @@ def update_active_positions(n_intervals: int) -> List[dict]:
     positions = dashboard_data.get_active_positions()
 
     # Format positions for DataTable
-    position_data = []
-    for symbol, pos in positions.items():
-        position_data.append(
-            {
-                "symbol": symbol,
-                "entry_price": f"${pos['entry_price']:,.2f}",
-                "quantity": f"{pos['quantity']:.8f}",
-                "entry_time": pd.to_datetime(pos["entry_time"]).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-                "current_value": f"${pos['entry_price'] * pos['quantity']:,.2f}",
-            }
-        )
-
-    return position_data
+    return [
+        {
+            "symbol": symbol,
+            "entry_price": f"${pos['entry_price']:,.2f}",
+            "quantity": f"{pos['quantity']:.8f}",
+            "entry_time": _format_ns(pos["entry_time"]),
+            "current_value": f"${pos['entry_price'] * pos['quantity']:,.2f}",
+        }
+        for symbol, pos in positions.items()
+    ]
 
 
 # --- Trade History Graph ---
@@ -111,45 +218,45 @@ def update_trade_history(n_intervals: int, symbol: str, timeframe: str) -> dict:
     if not dashboard_data.is_connected:
         raise PreventUpdate
 
+    return _build_trade_figure(symbol, timeframe, dashboard_data.last_update_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_trade_figure(symbol: str, timeframe: str, last_update_ns: int) -> dict:
+    """Build the trade history figure; cached per data version."""
     # Convert timeframe to minutes
     minutes = {"1H": 60, "4H": 240, "1D": 1440, "1W": 10080}.get(timeframe, 60)
 
     # Get trade history
-    df = dashboard_data.get_trade_history(minutes=minutes)
+    df = dashboard_data.get_trade_history(minutes=minutes, symbol=symbol)
     if df.empty:
         raise PreventUpdate
 
-    if symbol:
-        df = df[df["symbol"] == symbol]
-
     # Create scatter plot for trades
     buy_trades = df[df["trade_type"] == "BUY"]
     sell_trades = df[df["trade_type"] == "SELL"]
+    window_ns = minutes * 60_000_000_000
 
     figure = {
         "data": [
             # Buy trades
-            go.Scatter(
-                x=buy_trades.index,
-                y=buy_trades["price"],
-                mode="markers",
-                name="Buy",
-                marker=dict(symbol="triangle-up", size=10, color="green"),
+            _trade_trace(
+                buy_trades,
+                "Buy",
+                dict(symbol="triangle-up", size=10, color="green"),
+                window_ns,
             ),
             # Sell trades
-            go.Scatter(
-                x=sell_trades.index,
-                y=sell_trades["price"],
-                mode="markers",
-                name="Sell",
-                marker=dict(symbol="triangle-down", size=10, color="red"),
+            _trade_trace(
+                sell_trades,
+                "Sell",
+                dict(symbol="triangle-down", size=10, color="red"),
+                window_ns,
             ),
         ],
         "layout": {
+            **TRADE_HISTORY_LAYOUT,
             "title": f'Trade History - {symbol if symbol else "All Symbols"}',
-            "xaxis": {"title": "Time"},
-            "yaxis": {"title": "Price"},
-            "height": 400,
         },
     }
 
@@ -171,7 +278,7 @@ def update_system_events(n_intervals: int) -> List[dict]:
     # Format events for display
     event_elements = []
     for event in events:
-        event_time = pd.to_datetime(event["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        event_time = datetime.fromisoformat(event["timestamp"]).strftime(TIME_FORMAT)
         event_type = event["event_type"]
         message = event["message"]
 
@@ -211,7 +318,7 @@ def update_strategy_status(n_intervals: int) -> List[dict]:
     status_elements = []
     for strategy, state in states.items():
         status = state["state"]
-        timestamp = pd.to_datetime(state["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.fromisoformat(state["timestamp"]).strftime(TIME_FORMAT)
         details = state.get("details", {})
 
         color = {
@@ -1,42 +1,277 @@
 """Data provider for the dashboard with real-time Redis updates."""
 
 import asyncio
+import time
 from collections import deque
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 import pandas as pd
 
 from hydrobot.config.settings import settings
 from hydrobot.utils.logger_setup import get_logger
-from hydrobot.utils.redis_utils import RedisSubscriber
+from hydrobot.utils.redis_utils import RedisSubscriber, decode_message
 
 log = get_logger(__name__)
 
+MessageHandler = Callable[[Dict[str, Any], int], None]
+
+
+def to_timestamp_ns(value: Any) -> int:
+    """Normalize an incoming timestamp to nanoseconds since the epoch (UTC).
+
+    Args:
+        value: Epoch nanoseconds (int), epoch seconds (float, as returned by
+            ``time.time()``), an ISO 8601 string, a datetime or a
+            ``np.datetime64``; naive values are taken to be UTC
+
+    Returns:
+        Timestamp as int64 nanoseconds
+
+    Raises:
+        TypeError: If ``value`` is none of the above
+        ValueError: If a string or float cannot be converted
+    """
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        if not np.isfinite(value):
+            raise ValueError(f"Timestamp is not finite: {value!r}")
+        return round(float(value) * 1_000_000_000)
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[ns]").astype(np.int64))
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        raise TypeError(f"Unsupported timestamp type: {type(value).__name__}")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(value, "ns").astype(np.int64))
+
+
+def _stamp(data: Dict[str, Any], now_ns: int) -> int:
+    """Set and return ``data['timestamp_ns']``, parsing any ISO timestamp once.
+
+    A timestamp that cannot be parsed is logged and replaced by ``now_ns`` so
+    the message itself is still recorded.
+    """
+    ts_ns = data.get("timestamp_ns")
+    if ts_ns is None:
+        timestamp = data.get("timestamp")
+        ts_ns = now_ns
+        if timestamp is not None:
+            try:
+                ts_ns = to_timestamp_ns(timestamp)
+            except (TypeError, ValueError, OverflowError) as e:
+                log.warning(
+                    f"Unreadable timestamp {timestamp!r} ({e}); using arrival time"
+                )
+        data["timestamp_ns"] = ts_ns
+    return ts_ns
+
+
+def _iso_from_ns(ts_ns: int) -> str:
+    """Format epoch nanoseconds as a naive UTC ISO 8601 string."""
+    return str(np.datetime64(ts_ns, "ns").astype("datetime64[us]"))
+
+
+class ColumnarHistory:
+    """Fixed-capacity, time-ordered history stored as parallel NumPy columns.
+
+    Rows are written into arrays sized at twice the capacity. When the write
+    cursor reaches the end, the newest ``capacity - 1`` rows are moved back to
+    the front, so appends stay amortised O(1) and the live window is always a
+    single contiguous slice that can be handed to pandas without copying.
+    Timestamps are kept non-decreasing so time windows are found by binary
+    search rather than a full scan.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        float_fields: Iterable[str],
+        code_fields: Iterable[str] = (),
+    ):
+        """Initialize the column store.
+
+        Args:
+            capacity: Maximum number of rows to keep
+            float_fields: Numeric fields stored as float64 columns
+            code_fields: String fields stored as int16 codes (at most 32767
+                distinct values per field)
+        """
+        self.capacity = max(1, capacity)
+        size = 2 * self.capacity
+        self._ts = np.empty(size, dtype=np.int64)
+        self._floats = {f: np.empty(size, dtype=np.float64) for f in float_fields}
+        self._codes = {f: np.empty(size, dtype=np.int16) for f in code_fields}
+        self._categories: Dict[str, List[str]] = {f: [] for f in self._codes}
+        self._code_lookup: Dict[str, Dict[str, int]] = {f: {} for f in self._codes}
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _encode(self, field: str, value: Any) -> int:
+        """Return the integer code for ``value``, registering it if new."""
+        if value is None:
+            return -1
+        lookup = self._code_lookup[field]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self._categories[field])
+            if code > np.iinfo(np.int16).max:
+                raise ValueError(f"Too many distinct values for '{field}'")
+            lookup[value] = code
+            self._categories[field].append(value)
+        return code
+
+    def _compact(self) -> None:
+        """Move the newest rows to the front to make room for appends."""
+        keep = self.capacity - 1
+        src = slice(self._end - keep, self._end)
+        self._ts[:keep] = self._ts[src]
+        for column in (*self._floats.values(), *self._codes.values()):
+            column[:keep] = column[src]
+        self._start, self._end = 0, keep
+
+    def append(self, ts_ns: int, row: Dict[str, Any]) -> None:
+        """Append one row, evicting the oldest row when full.
+
+        Args:
+            ts_ns: Row timestamp in nanoseconds since the epoch (UTC); a row
+                older than the newest stored row is clamped to its timestamp
+            row: Mapping holding the stored fields; missing values become
+                NaN (floats) or missing categories (codes)
+        """
+        if self._end == self._ts.shape[0]:
+            self._compact()
+        i = self._end
+        self._ts[i] = ts_ns if i == self._start else max(ts_ns, self._ts[i - 1])
+        for field, column in self._floats.items():
+            value = row.get(field)
+            column[i] = np.nan if value is None else value
+        for field, column in self._codes.items():
+            column[i] = self._encode(field, row.get(field))
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def _window(self, cutoff_ns: Optional[int]) -> slice:
+        """Return the slice of stored rows at or after ``cutoff_ns``."""
+        start = self._start
+        if cutoff_ns is not None:
+            start += int(
+                np.searchsorted(self._ts[start : self._end], cutoff_ns, side="left")
+            )
+        return slice(start, self._end)
+
+    def arrays(
+        self, field: str, cutoff_ns: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the timestamps and one float column without building a frame.
+
+        The arrays are views into the store and are only valid until the next
+        append.
+
+        Args:
+            field: Float column to return
+            cutoff_ns: Optional lower bound on row timestamps (inclusive)
+
+        Returns:
+            Tuple of (datetime64[ns] timestamps, float64 values)
+        """
+        window = self._window(cutoff_ns)
+        return self._ts[window].view("datetime64[ns]"), self._floats[field][window]
+
+    def to_frame(
+        self,
+        cutoff_ns: Optional[int] = None,
+        equals: Optional[Mapping[str, Any]] = None,
+    ) -> pd.DataFrame:
+        """Build a DataFrame of the stored rows indexed by timestamp.
+
+        Args:
+            cutoff_ns: Optional lower bound on row timestamps (inclusive)
+            equals: Optional code-field values rows must match; compared as
+                integer codes before any DataFrame is built
+
+        Returns:
+            DataFrame with float columns and categorical code columns
+        """
+        rows: Any = self._window(cutoff_ns)
+        if equals:
+            mask = np.ones(rows.stop - rows.start, dtype=bool)
+            for field, value in equals.items():
+                code = self._code_lookup[field].get(value, -2)
+                mask &= self._codes[field][rows] == code
+            rows = np.flatnonzero(mask) + rows.start
+        data: Dict[str, Any] = {
+            field: column[rows] for field, column in self._floats.items()
+        }
+        for field, column in self._codes.items():
+            data[field] = pd.Categorical.from_codes(
+                column[rows], categories=self._categories[field]
+            )
+        index = pd.DatetimeIndex(
+            self._ts[rows].view("datetime64[ns]"), name="timestamp"
+        )
+        return pd.DataFrame(data, index=index)
+
 
 class DashboardDataProvider:
     """Manages data for the dashboard, including real-time updates via Redis."""
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, flush_interval: float = 0.05):
         """Initialize data provider.
 
         Args:
             max_history: Maximum number of historical data points to keep
+            flush_interval: Seconds to wait between applying batches of
+                queued Redis messages
         """
         self.max_history = max_history
+        self.flush_interval = flush_interval
         self._subscriber = RedisSubscriber()
 
         # Data storage
-        self._trade_history = deque(maxlen=max_history)
-        self._portfolio_updates = deque(maxlen=max_history)
-        self._strategy_states = {}
+        self._trade_history = ColumnarHistory(
+            max_history,
+            float_fields=("price", "quantity"),
+            code_fields=("symbol", "trade_type"),
+        )
+        self._portfolio_updates = ColumnarHistory(
+            max_history, float_fields=("total_value", "unrealized_pnl")
+        )
+        # Replaced on every update, never mutated, so Dash worker threads can
+        # iterate a snapshot while the drain task applies new messages
+        self._strategy_states: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
         self._system_events = deque(maxlen=max_history)
 
         # Latest state
         self._latest_portfolio_value = 0.0
         self._latest_pnl = 0.0
-        self._active_positions: Dict[str, Dict[str, Any]] = {}
-        self._last_update = datetime.utcnow()
+        self._active_positions: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+        self._last_update_ns = time.time_ns()
+
+        # Incoming messages, applied in batches by the drain task
+        self._inbox: "asyncio.Queue[Tuple[MessageHandler, Dict[str, Any]]]" = (
+            asyncio.Queue()
+        )
+        self._drain_task: Optional[asyncio.Task] = None
 
         # Connection state
         self._connected = False
@@ -49,19 +284,22 @@ class DashboardDataProvider:
                 # Connect to Redis and subscribe to channels
                 if await self._subscriber.connect():
                     await self._subscriber.subscribe(
-                        settings.redis.channels.trade_updates, self._handle_trade_update
+                        settings.redis.channels.trade_updates,
+                        self._enqueue(self._handle_trade_update),
                     )
                     await self._subscriber.subscribe(
                         settings.redis.channels.portfolio_updates,
-                        self._handle_portfolio_update,
+                        self._enqueue(self._handle_portfolio_update),
                     )
                     await self._subscriber.subscribe(
                         settings.redis.channels.strategy_updates,
-                        self._handle_strategy_update,
+                        self._enqueue(self._handle_strategy_update),
                     )
                     await self._subscriber.subscribe(
-                        settings.redis.channels.system_events, self._handle_system_event
+                        settings.redis.channels.system_events,
+                        self._enqueue(self._handle_system_event),
                     )
+                    self._drain_task = asyncio.create_task(self._drain_inbox())
                     await self._subscriber.start()
                     self._connected = True
                     log.info("Dashboard data provider started")
@@ -75,119 +313,161 @@ class DashboardDataProvider:
         if self._connected:
             await self._subscriber.stop()
             await self._subscriber.disconnect()
+            if self._drain_task:
+                self._drain_task.cancel()
+                try:
+                    await self._drain_task
+                except asyncio.CancelledError:
+                    pass
+                self._drain_task = None
+            self._flush_inbox()
             self._connected = False
             log.info("Dashboard data provider stopped")
 
-    def _handle_trade_update(self, data: Dict[str, Any]) -> None:
+    def _enqueue(
+        self, handler: MessageHandler
+    ) -> Callable[[Union[Dict[str, Any], str, bytes]], None]:
+        """Wrap a message handler so messages are queued for batch processing.
+
+        Raw JSON payloads are decoded here, once, before queueing.
+        """
+
+        def put(data: Union[Dict[str, Any], str, bytes]) -> None:
+            if isinstance(data, (str, bytes)):
+                data = decode_message(data)
+            self._inbox.put_nowait((handler, data))
+
+        return put
+
+    async def _drain_inbox(self) -> None:
+        """Apply queued messages in batches, at most once per flush interval."""
+        while True:
+            self._apply_batch([await self._inbox.get()])
+            self._flush_inbox()
+            await asyncio.sleep(self.flush_interval)
+
+    def _flush_inbox(self) -> None:
+        """Apply every message currently waiting in the inbox."""
+        batch = []
+        while not self._inbox.empty():
+            batch.append(self._inbox.get_nowait())
+        if batch:
+            self._apply_batch(batch)
+
+    def _apply_batch(self, batch: List[Tuple[MessageHandler, Dict[str, Any]]]) -> None:
+        """Apply a batch of messages with a single clock read.
+
+        Args:
+            batch: Queued (handler, message) pairs in arrival order
+        """
+        now_ns = time.time_ns()
+        for handler, data in batch:
+            handler(data, now_ns)
+        self._last_update_ns = now_ns
+
+    def _handle_trade_update(self, data: Dict[str, Any], now_ns: int) -> None:
         """Handle trade update messages.
 
         Args:
             data: Trade update data including trade details
+            now_ns: Batch arrival time in nanoseconds since the epoch
         """
         try:
-            # Add timestamp if not present
-            if "timestamp" not in data:
-                data["timestamp"] = datetime.utcnow().isoformat()
-
             # Store trade history
-            self._trade_history.append(data)
+            ts_ns = _stamp(data, now_ns)
+            self._trade_history.append(ts_ns, data)
 
             # Update active positions
             symbol = data.get("symbol")
             if symbol and data.get("trade_type") in ["BUY", "SELL"]:
+                positions = dict(self._active_positions)
                 if data["trade_type"] == "BUY":
-                    self._active_positions[symbol] = {
-                        "entry_price": data["price"],
-                        "quantity": data["quantity"],
-                        "entry_time": data["timestamp"],
-                    }
+                    positions[symbol] = MappingProxyType(
+                        {
+                            "entry_price": data["price"],
+                            "quantity": data["quantity"],
+                            "entry_time": ts_ns,
+                        }
+                    )
                 elif data["trade_type"] == "SELL":
-                    self._active_positions.pop(symbol, None)
-
-            self._last_update = datetime.utcnow()
+                    positions.pop(symbol, None)
+                self._active_positions = MappingProxyType(positions)
         except Exception as e:
             log.error(f"Error handling trade update: {e}")
 
-    def _handle_portfolio_update(self, data: Dict[str, Any]) -> None:
+    def _handle_portfolio_update(self, data: Dict[str, Any], now_ns: int) -> None:
         """Handle portfolio update messages.
 
         Args:
             data: Portfolio update data including value and PnL
+            now_ns: Batch arrival time in nanoseconds since the epoch
         """
         try:
-            # Add timestamp if not present
-            if "timestamp" not in data:
-                data["timestamp"] = datetime.utcnow().isoformat()
-
             # Store portfolio history
-            self._portfolio_updates.append(data)
+            self._portfolio_updates.append(_stamp(data, now_ns), data)
 
             # Update latest values
             self._latest_portfolio_value = data.get(
                 "total_value", self._latest_portfolio_value
             )
             self._latest_pnl = data.get("unrealized_pnl", self._latest_pnl)
-
-            self._last_update = datetime.utcnow()
         except Exception as e:
             log.error(f"Error handling portfolio update: {e}")
 
-    def _handle_strategy_update(self, data: Dict[str, Any]) -> None:
+    def _handle_strategy_update(self, data: Dict[str, Any], now_ns: int) -> None:
         """Handle strategy update messages.
 
         Args:
             data: Strategy update data including state changes
+            now_ns: Batch arrival time in nanoseconds since the epoch
         """
         try:
             strategy_name = data.get("strategy")
             if strategy_name:
-                self._strategy_states[strategy_name] = {
-                    "state": data.get("state"),
-                    "timestamp": data.get("timestamp", datetime.utcnow().isoformat()),
-                    "details": data.get("details", {}),
-                }
-            self._last_update = datetime.utcnow()
+                states = dict(self._strategy_states)
+                states[strategy_name] = MappingProxyType(
+                    {
+                        "state": data.get("state"),
+                        "timestamp": data.get("timestamp") or _iso_from_ns(now_ns),
+                        "details": data.get("details", {}),
+                    }
+                )
+                self._strategy_states = MappingProxyType(states)
         except Exception as e:
             log.error(f"Error handling strategy update: {e}")
 
-    def _handle_system_event(self, data: Dict[str, Any]) -> None:
+    def _handle_system_event(self, data: Dict[str, Any], now_ns: int) -> None:
         """Handle system event messages.
 
         Args:
             data: System event data including errors and warnings
+            now_ns: Batch arrival time in nanoseconds since the epoch
         """
         try:
             # Add timestamp if not present
             if "timestamp" not in data:
-                data["timestamp"] = datetime.utcnow().isoformat()
+                data["timestamp"] = _iso_from_ns(now_ns)
 
             # Store system event
             self._system_events.append(data)
-            self._last_update = datetime.utcnow()
         except Exception as e:
             log.error(f"Error handling system event: {e}")
 
-    def get_trade_history(self, minutes: Optional[int] = None) -> pd.DataFrame:
+    def get_trade_history(
+        self, minutes: Optional[int] = None, symbol: Optional[str] = None
+    ) -> pd.DataFrame:
         """Get trade history as a DataFrame.
 
         Args:
             minutes: Optional time window in minutes to filter data
+            symbol: Optional symbol to restrict the history to
 
         Returns:
             DataFrame containing trade history
         """
-        df = pd.DataFrame(self._trade_history)
-        if df.empty:
-            return df
-
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
-
-        if minutes:
-            cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-            df = df[df.index >= cutoff]
-
-        return df
+        cutoff_ns = time.time_ns() - minutes * 60_000_000_000 if minutes else None
+        equals = {"symbol": symbol} if symbol else None
+        return self._trade_history.to_frame(cutoff_ns, equals)
 
     def get_portfolio_history(self, minutes: Optional[int] = None) -> pd.DataFrame:
         """Get portfolio value history as a DataFrame.
@@ -198,34 +478,41 @@ class DashboardDataProvider:
         Returns:
             DataFrame containing portfolio history
         """
-        df = pd.DataFrame(self._portfolio_updates)
-        if df.empty:
-            return df
+        cutoff_ns = time.time_ns() - minutes * 60_000_000_000 if minutes else None
+        return self._portfolio_updates.to_frame(cutoff_ns)
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
+    def get_portfolio_values(
+        self, minutes: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get portfolio total value history as NumPy arrays.
 
-        if minutes:
-            cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-            df = df[df.index >= cutoff]
+        Args:
+            minutes: Optional time window in minutes to filter data
 
-        return df
+        Returns:
+            Tuple of (timestamps, total values); views valid until the next
+            update is applied
+        """
+        cutoff_ns = time.time_ns() - minutes * 60_000_000_000 if minutes else None
+        return self._portfolio_updates.arrays("total_value", cutoff_ns)
 
-    def get_active_positions(self) -> Dict[str, Dict[str, Any]]:
+    def get_active_positions(self) -> Mapping[str, Mapping[str, Any]]:
         """Get currently active positions.
 
         Returns:
-            Dictionary of active positions by symbol
+            Read-only snapshot of active positions by symbol; later updates
+            replace it rather than change it
         """
-        return self._active_positions.copy()
+        return self._active_positions
 
-    def get_strategy_states(self) -> Dict[str, Dict[str, Any]]:
+    def get_strategy_states(self) -> Mapping[str, Mapping[str, Any]]:
         """Get current strategy states.
 
         Returns:
-            Dictionary of strategy states by strategy name
+            Read-only snapshot of strategy states by strategy name; later
+            updates replace it rather than change it
         """
-        return self._strategy_states.copy()
+        return self._strategy_states
 
     def get_recent_events(self, count: int = 10) -> list:
         """Get recent system events.
@@ -243,9 +530,20 @@ class DashboardDataProvider:
         """Get timestamp of last data update.
 
         Returns:
-            Datetime of last update
+            Naive UTC datetime of last update
+        """
+        return datetime.fromtimestamp(
+            self._last_update_ns / 1e9, tz=timezone.utc
+        ).replace(tzinfo=None)
+
+    @property
+    def last_update_ns(self) -> int:
+        """Get timestamp of last data update.
+
+        Returns:
+            Nanoseconds since the epoch of last update
         """
-        return self._last_update
+        return self._last_update_ns
 
     @property
     def is_connected(self) -> bool:
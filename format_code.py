@@ -1,12 +1,17 @@
-"""Apply formatting and linting across the project."""
+"""Apply formatting and linting across the project.
+
+Uses ruff, which formats, sorts imports and lints in a single pass. Falls
+back to black, isort and flake8 when ruff is not installed.
+"""
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
 
 def run_command(command: List[str], description: str) -> int:
@@ -16,19 +21,66 @@ def run_command(command: List[str], description: str) -> int:
     return result.returncode
 
 
+def _worker_count() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_parallel(jobs: Sequence[List[List[str]]], description: str) -> List[int]:
+    """Run jobs concurrently, each job being commands that run in order.
+
+    At most one process per available CPU runs at a time. A job stops at its
+    first failing command.
+    """
+    print(f"\n{description} ({len(jobs)} jobs)...", flush=True)
+    pending = [list(job) for job in jobs if job]
+    running: List[tuple] = []
+    returncodes: List[int] = []
+    limit = _worker_count()
+    while pending or running:
+        while pending and len(running) < limit:
+            first, *rest = pending.pop(0)
+            running.append((subprocess.Popen(first), rest))
+        proc, rest = running.pop(0)
+        returncode = proc.wait()
+        returncodes.append(returncode)
+        if returncode == 0 and rest:
+            pending.insert(0, rest)
+    return returncodes
+
+
+def run_ruff(targets: List[str]) -> List[int]:
+    """Fix lint and import order, then format (ruff's recommended order)."""
+    ruff = [sys.executable, "-m", "ruff"]
+    return [
+        run_command([*ruff, "check", "--fix", *targets], "Running ruff check"),
+        run_command([*ruff, "format", *targets], "Running ruff format"),
+    ]
+
+
+def run_legacy(targets: List[str]) -> List[int]:
+    """Run isort then black per target in parallel, then flake8 on the result."""
+    jobs = [[["isort", target], ["black", target]] for target in targets]
+    results = run_parallel(jobs, "Running isort and Black")
+    return [*results, run_command(["flake8", *targets], "Running flake8")]
+
+
 def main() -> None:
     """Run formatting and linting tools."""
     project_dir = Path(__file__).parent
     directories = ["hydrobot", "tests", "scripts", "dashboard"]
     root_py_files = [f for f in os.listdir(project_dir) if f.endswith(".py")]
+    targets = [*directories, *root_py_files]
 
-    black_result = run_command(["black", *directories, *root_py_files], "Running Black")
-    isort_result = run_command(["isort", *directories, *root_py_files], "Running isort")
-    flake8_result = run_command(
-        ["flake8", *directories, *root_py_files], "Running flake8"
-    )
+    if importlib.util.find_spec("ruff") is not None:
+        results = run_ruff(targets)
+    else:
+        print("ruff not installed; falling back to black, isort and flake8.")
+        results = run_legacy(targets)
 
-    if black_result != 0 or isort_result != 0 or flake8_result != 0:
+    if any(results):
         print("\nWarning: Some formatting/linting checks failed.")
         sys.exit(1)
 
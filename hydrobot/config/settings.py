@@ -1,7 +1,11 @@
 """Pydantic settings and configuration loading utilities."""
 
+import functools
+import glob
+import hashlib
 import os
-from typing import Dict, List, Optional
+import pickle
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, SecretStr, validator
 
@@ -14,8 +18,19 @@ from ..strategies.strategy_settings import (
 
 try:
     import yaml
+
+    try:
+        # libyaml's C loader is several times faster than the pure-Python one
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 except ImportError:  # pragma: no cover - optional dependency
     yaml = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 import logging
 
 # Setup basic logger for config loading issues
@@ -78,6 +93,9 @@ class TradingSettings(BaseModel):
     slippage_tolerance: float = Field(
         0.001, description="Allowed slippage percentage (0.1%)."
     )  # Example
+    simulate_orders: bool = Field(
+        True, description="Simulate fills locally instead of sending orders."
+    )
 
 
 # --- Risk Management Settings ---
@@ -180,6 +198,106 @@ class AppSettings(BaseModel):
     def environment_to_lower(cls, v):
         return v.lower()
 
+    class Config:
+        # Loaded once per process and shared; section models stay mutable so
+        # strategies can still tune their own parameters at runtime.
+        frozen = True
+
+
+# --- Settings Cache ---
+# Built AppSettings objects are pickled into a per-user cache directory so
+# warm starts skip YAML parsing and validation. Files hold secrets and are
+# unpickled, so they are written owner-only and read back only while nobody
+# else could have replaced them. HYDROBOT_CACHE_DIR overrides the location.
+CONFIG_CACHE_DIR = os.getenv("HYDROBOT_CACHE_DIR") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "hydrobot",
+)
+
+# Environment variables that override file values; part of the cache key.
+# Read once at import; the process environment is fixed for a worker's life.
+_ENV_OVERRIDES = {var: os.getenv(var) for var in ("REDIS_HOST", "EXCHANGE_API_KEY")}
+
+# Directories already ensured by this process.
+_ensured_dirs: set = set()
+
+# Source files defining the settings models; edits invalidate cached objects.
+_MODEL_SOURCES = (
+    __file__,
+    os.path.join(os.path.dirname(__file__), "..", "strategies", "strategy_settings.py"),
+)
+
+
+def _config_cache_key(config_file: str, secrets_file: Optional[str]) -> str:
+    """Hash config/secrets contents, env overrides and the settings models."""
+    digest = hashlib.sha256()
+    for path in (config_file, secrets_file, *_MODEL_SOURCES):
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    for value in _ENV_OVERRIDES.values():
+        digest.update((value or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """True when the file is this user's and not writable by anyone else."""
+    if not hasattr(os, "getuid"):  # pragma: no cover - Windows profiles are per-user
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _read_private(path: str) -> bytes:
+    """Read a cache file, refusing files another user could have written."""
+    if not _is_private(os.stat(os.path.dirname(path))):
+        raise PermissionError(f"{os.path.dirname(path)} is not private to this user")
+    with open(path, "rb") as f:
+        if not _is_private(os.fstat(f.fileno())):
+            raise PermissionError(f"{path} is not private to this user")
+        return f.read()
+
+
+def _write_private(path: str, data: bytes) -> None:
+    """Atomically write an owner-only file under an owner-only directory."""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _load_cached_settings(cache_path: str) -> Optional[AppSettings]:
+    try:
+        cached = pickle.loads(_read_private(cache_path))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"Ignoring unusable settings cache {cache_path}: {e}")
+        return None
+    return cached if isinstance(cached, AppSettings) else None
+
+
+def _store_cached_settings(cache_path: str, settings: AppSettings) -> None:
+    try:
+        _write_private(
+            cache_path, pickle.dumps(settings, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+    except OSError as e:
+        log.warning(f"Could not write settings cache {cache_path}: {e}")
+
+
+def _ensure_dirs(*paths: str) -> None:
+    """Create missing directories, checking each path at most once."""
+    for path in paths:
+        if path in _ensured_dirs:
+            continue
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
 
 # --- Loading Function ---
 def load_config(
@@ -188,6 +306,10 @@ def load_config(
     """
     Loads configuration from YAML files and environment variables.
 
+    The validated settings are cached on disk, keyed by a hash of the files,
+    the environment overrides and the settings models, so unchanged
+    configurations are not re-parsed on later starts.
+
     Args:
         config_file: Path to the main configuration YAML file.
         secrets_file: Optional path to a secrets YAML file (for API keys, etc.).
@@ -195,15 +317,69 @@ def load_config(
     Returns:
         An AppSettings object populated with configuration values.
     """
+    cache_path = os.path.join(
+        CONFIG_CACHE_DIR,
+        f"config-{_config_cache_key(config_file, secrets_file)}.pkl",
+    )
+    settings = _load_cached_settings(cache_path)
+    if settings is not None:
+        log.info(f"Loaded cached configuration for: {config_file}")
+    else:
+        settings = _build_settings(config_file, secrets_file)
+        _store_cached_settings(cache_path, settings)
+    _ensure_dirs(
+        settings.paths.log_dir, settings.paths.data_dir, settings.paths.model_dir
+    )
+    return settings
+
+
+def _read_config_file(config_file: str) -> Dict[str, Any]:
+    """Read the main config file, preferring a JSON mirror of the same content.
+
+    With orjson installed, each YAML parse also writes a JSON mirror of the
+    file into ``CONFIG_CACHE_DIR``, named after the SHA-256 of the YAML bytes;
+    later loads of identical bytes read that mirror instead. Keying on content
+    rather than mtime means a file replaced by an older copy is still reparsed.
+    """
+    with open(config_file, "rb") as f:
+        raw = f.read()
+    path_hash = hashlib.sha256(os.path.abspath(config_file).encode()).hexdigest()
+    mirror_prefix = f"mirror-{path_hash[:16]}-"
+    mirror = os.path.join(
+        CONFIG_CACHE_DIR, f"{mirror_prefix}{hashlib.sha256(raw).hexdigest()}.json"
+    )
+    if orjson is not None:
+        try:
+            return orjson.loads(_read_private(mirror))
+        except (OSError, ValueError):
+            pass
+
+    if yaml is None:
+        raise RuntimeError(
+            "PyYAML is required to load configuration files. Please install it."
+        )
+    config_data = yaml.load(raw, Loader=_YamlLoader) or {}
+
+    if orjson is not None:
+        try:
+            # Mirrors of this file's earlier contents are never read again
+            stale_pattern = os.path.join(
+                glob.escape(CONFIG_CACHE_DIR), f"{mirror_prefix}*.json"
+            )
+            for stale in glob.glob(stale_pattern):
+                os.remove(stale)
+            _write_private(mirror, orjson.dumps(config_data))
+        except (OSError, TypeError) as e:
+            log.debug(f"Not writing JSON mirror of {config_file}: {e}")
+    return config_data
+
+
+def _build_settings(config_file: str, secrets_file: Optional[str]) -> AppSettings:
+    """Parse the YAML files, apply environment overrides and validate."""
     config_data = {}
     if os.path.exists(config_file):
-        if yaml is None:
-            raise RuntimeError(
-                "PyYAML is required to load configuration files. Please install it."
-            )
         log.info(f"Loading configuration from: {config_file}")
-        with open(config_file, "r") as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = _read_config_file(config_file)
     else:
         log.warning(f"Configuration file not found: {config_file}. Using defaults.")
 
@@ -220,7 +396,7 @@ def load_config(
             )
         log.info(f"Loading secrets from: {secrets_file}")
         with open(secrets_file, "r") as f:
-            secrets_data = yaml.safe_load(f) or {}
+            secrets_data = yaml.load(f, Loader=_YamlLoader) or {}
             # --- Start FIX ---
             # Safely merge secrets only if the section exists in secrets_data
             if "exchange" in secrets_data and isinstance(
@@ -248,12 +424,12 @@ def load_config(
         log.warning(f"Secrets file specified but not found: {secrets_file}")
 
     # --- Environment Variable Overrides ---
-    redis_host_env = os.getenv("REDIS_HOST")
+    redis_host_env = _ENV_OVERRIDES["REDIS_HOST"]
     if redis_host_env:
         log.info("Overriding Redis host from environment variable REDIS_HOST.")
         config_data["redis"]["host"] = redis_host_env  # Assumes redis dict exists
 
-    api_key_env = os.getenv("EXCHANGE_API_KEY")
+    api_key_env = _ENV_OVERRIDES["EXCHANGE_API_KEY"]
     if api_key_env:
         log.info(
             "Overriding Exchange API key from environment variable EXCHANGE_API_KEY."
@@ -263,11 +439,7 @@ def load_config(
     # ... (rest of the overrides)
 
     try:
-        settings = AppSettings(**config_data)
-        os.makedirs(settings.paths.log_dir, exist_ok=True)
-        os.makedirs(settings.paths.data_dir, exist_ok=True)
-        os.makedirs(settings.paths.model_dir, exist_ok=True)
-        return settings
+        return AppSettings(**config_data)
     except Exception as e:
         log.exception(f"Error loading or validating configuration: {e}")
         raise
@@ -300,6 +472,7 @@ except Exception:
 
 
 # --- Helper function to get config ---
+@functools.lru_cache(maxsize=1)
 def get_config() -> AppSettings:
     """Returns the globally loaded configuration object."""
     if CONFIG is None:
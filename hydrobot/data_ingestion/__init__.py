@@ -1,17 +1,32 @@
-"""Market data ingestion utilities."""
-
-try:
-    from .market_data_stream import MarketDataStream, OrderBook
-except Exception:  # pragma: no cover - optional deps
-    OrderBook = MarketDataStream = None
-
-try:
-    from .data_loader import HistoricalDataLoader
-except Exception:  # pragma: no cover - optional deps
-    HistoricalDataLoader = None
-
-__all__ = [
-    "OrderBook",
-    "MarketDataStream",
-    "HistoricalDataLoader",
-]
+"""Market data ingestion utilities.
+
+Public names are imported lazily (PEP 562) so importing the package does not
+pull in ccxt, pandas or pandas_ta until a class is actually used.
+"""
+
+import importlib
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    "OrderBook": (".market_data_stream", "OrderBook"),
+    "MarketDataStream": (".market_data_stream", "MarketDataStream"),
+    "HistoricalDataLoader": (".data_loader", "HistoricalDataLoader"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY[name]
+    try:
+        value = getattr(importlib.import_module(module, __name__), attr)
+    except ImportError:  # pragma: no cover - optional deps
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
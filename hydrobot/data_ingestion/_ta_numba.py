@@ -0,0 +1,70 @@
+"""Numba-compiled indicator kernels.
+
+Single-pass implementations of EMA, RSI and MACD on raw float64 arrays, used
+by ``calculate_indicators`` on the live path where pandas_ta's per-call
+overhead dominates. Each kernel reproduces pandas_ta's own algorithm, so
+models trained on batch features see the same inputs live. Leading values
+that cannot be computed yet are NaN, matching pandas_ta's output layout.
+"""
+
+import numpy as np
+
+from ..utils.numba_compat import njit
+
+# fastmath minus "nnan"/"ninf": the NaN checks in ema() must survive
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def ema(x, period):
+    """Exponential moving average seeded with the SMA of the first window."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    # Skip leading NaNs so chained EMAs (MACD signal) line up correctly
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if n - start < period:
+        return out
+    acc = 0.0
+    for i in range(start, start + period):
+        acc += x[i]
+    prev = acc / period
+    out[start + period - 1] = prev
+    alpha = 2.0 / (period + 1)
+    for i in range(start + period, n):
+        prev = alpha * x[i] + (1.0 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def rsi(close, period):
+    """Relative strength index as pandas_ta computes it.
+
+    pandas_ta smooths gains and losses with ``rma``, an adjusted EWM with
+    ``alpha = 1 / period``, rather than Wilder's SMA-seeded recurrence. Both
+    averages share the same EWM weights, so the ratio only needs the running
+    weighted sums.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / period
+    gains = 0.0
+    losses = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        # A NaN change adds nothing but still ages earlier bars, as in pandas
+        gains = decay * gains + (change if change > 0 else 0.0)
+        losses = decay * losses + (-change if change < 0 else 0.0)
+        if i >= period and gains + losses > 0.0:
+            out[i] = 100.0 * gains / (gains + losses)
+    return out
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def macd(close, fast, slow, signal):
+    """MACD line, signal line and histogram."""
+    line = ema(close, fast) - ema(close, slow)
+    sig = ema(line, signal)
+    return line, sig, line - sig
@@ -2,24 +2,104 @@
 
 Provides functions for calculating technical indicators from OHLCV data
 using pandas_ta. Indicators are configurable through central settings.
+Live ticks can be folded in one bar at a time with
+``update_indicators_incremental`` instead of recomputing the whole series.
 """
 
+import functools
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
 import pandas as pd
 import pandas_ta as ta
 
 from hydrobot.config.settings import settings
+from hydrobot.data_ingestion import _ta_numba
 from hydrobot.utils.logger_setup import get_logger
 
 logger = get_logger(__name__)
 
+REQUIRED_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _indicator_params(ind_settings) -> Tuple[int, ...]:
+    """Flatten indicator settings into a hashable cache key."""
+    return (
+        ind_settings.sma.fast_period,
+        ind_settings.sma.slow_period,
+        ind_settings.ema.fast_period,
+        ind_settings.ema.slow_period,
+        ind_settings.rsi.period,
+        ind_settings.macd.fast_period,
+        ind_settings.macd.slow_period,
+        ind_settings.macd.signal_period,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_strategy(params: Tuple[int, ...]) -> "ta.Strategy":
+    """Build (once per settings tuple) the pandas_ta strategy."""
+    sma_fast, sma_slow, ema_fast, ema_slow, rsi, macd_fast, macd_slow, signal = params
+    return ta.Strategy(
+        name="HFT Indicators",
+        description="SMA, EMA, RSI, MACD based on settings",
+        ta=[
+            {"kind": "sma", "length": sma_fast},
+            {"kind": "sma", "length": sma_slow},
+            {"kind": "ema", "length": ema_fast},
+            {"kind": "ema", "length": ema_slow},
+            {"kind": "rsi", "length": rsi},
+            {
+                "kind": "macd",
+                "fast": macd_fast,
+                "slow": macd_slow,
+                "signal": signal,
+            },
+        ],
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _rename_map(params: Tuple[int, ...]) -> Dict[str, str]:
+    """Map pandas_ta's generated column names onto the planned schema."""
+    sma_fast, sma_slow, ema_fast, ema_slow, rsi, macd_fast, macd_slow, signal = params
+    macd_suffix = f"{macd_fast}_{macd_slow}_{signal}"
+    return {
+        f"sma_{sma_fast}": "sma_fast",
+        f"sma_{sma_slow}": "sma_slow",
+        f"ema_{ema_fast}": "ema_fast",
+        f"ema_{ema_slow}": "ema_slow",
+        f"rsi_{rsi}": "rsi_value",
+        f"macd_{macd_suffix}": "macd_line",
+        f"macdh_{macd_suffix}": "macd_hist",
+        f"macds_{macd_suffix}": "macd_signal",
+    }
+
 
-def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
+def _apply_numba_indicators(df: pd.DataFrame, params: Tuple[int, ...]) -> None:
+    """Compute the indicator columns with the numba kernels, in place."""
+    sma_fast, sma_slow, ema_fast, ema_slow, rsi, macd_fast, macd_slow, signal = params
+    close = df["close"].to_numpy(dtype="float64")
+    df["sma_fast"] = df["close"].rolling(sma_fast).mean()
+    df["sma_slow"] = df["close"].rolling(sma_slow).mean()
+    df["ema_fast"] = _ta_numba.ema(close, ema_fast)
+    df["ema_slow"] = _ta_numba.ema(close, ema_slow)
+    df["rsi_value"] = _ta_numba.rsi(close, rsi)
+    line, sig, hist = _ta_numba.macd(close, macd_fast, macd_slow, signal)
+    df["macd_line"] = line
+    df["macd_signal"] = sig
+    df["macd_hist"] = hist
+
+
+def calculate_indicators(df: pd.DataFrame, live: bool = False) -> pd.DataFrame:
     """
     Calculates technical indicators using pandas_ta and appends them to the DataFrame.
 
     Args:
         df (pd.DataFrame): DataFrame with OHLCV data. Must contain columns named
                            'open', 'high', 'low', 'close', 'volume' (case-insensitive).
+        live (bool): Per-tick path. Bypasses pandas_ta and runs the numba
+                     kernels directly on the close prices.
 
     Returns:
         pd.DataFrame: Original DataFrame with appended indicator columns, or the
@@ -30,16 +110,15 @@ def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Ensure required columns exist (case-insensitive check)
-    required_cols = ["open", "high", "low", "close", "volume"]
     df_cols_lower = [col.lower() for col in df.columns]
-    if not all(col in df_cols_lower for col in required_cols):
+    if not set(REQUIRED_COLUMNS).issubset(df_cols_lower):
         logger.error(
-            f"Input DataFrame missing required columns ({required_cols}). Found: {df.columns}"
+            f"Input DataFrame missing required columns ({list(REQUIRED_COLUMNS)}). Found: {df.columns}"
         )
         return df
 
     # Standardize column names to lowercase for pandas_ta compatibility
-    df.columns = df.columns.str.lower()
+    df.columns = df_cols_lower
 
     logger.debug(f"Calculating indicators for DataFrame with {len(df)} rows...")
 
@@ -47,45 +126,21 @@ def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
         # Get indicator settings from central configuration
         ind_settings = settings.indicators
 
-        # Create a custom strategy for pandas_ta using settings
-        custom_strategy = ta.Strategy(
-            name="HFT Indicators",
-            description="SMA, EMA, RSI, MACD based on settings",
-            ta=[
-                {"kind": "sma", "length": ind_settings.sma.fast_period},
-                {"kind": "sma", "length": ind_settings.sma.slow_period},
-                {"kind": "ema", "length": ind_settings.ema.fast_period},
-                {"kind": "ema", "length": ind_settings.ema.slow_period},
-                {"kind": "rsi", "length": ind_settings.rsi.period},
-                {
-                    "kind": "macd",
-                    "fast": ind_settings.macd.fast_period,
-                    "slow": ind_settings.macd.slow_period,
-                    "signal": ind_settings.macd.signal_period,
-                },
-            ],
-        )
+        params = _indicator_params(ind_settings)
+
+        if live:
+            _apply_numba_indicators(df, params)
+            return df
+
+        # Strategy objects are cached per distinct settings tuple
+        custom_strategy = _build_strategy(params)
 
         # Apply the strategy to the DataFrame
         df.ta.strategy(custom_strategy)
 
         # --- Rename columns for consistency with planned schema ---
-        rename_map = {
-            f"sma_{ind_settings.sma.fast_period}": "sma_fast",
-            f"sma_{ind_settings.sma.slow_period}": "sma_slow",
-            f"ema_{ind_settings.ema.fast_period}": "ema_fast",
-            f"ema_{ind_settings.ema.slow_period}": "ema_slow",
-            f"rsi_{ind_settings.rsi.period}": "rsi_value",
-            f"macd_{ind_settings.macd.fast_period}_{ind_settings.macd.slow_period}_{ind_settings.macd.signal_period}": "macd_line",
-            f"macdh_{ind_settings.macd.fast_period}_{ind_settings.macd.slow_period}_{ind_settings.macd.signal_period}": "macd_hist",
-            f"macds_{ind_settings.macd.fast_period}_{ind_settings.macd.slow_period}_{ind_settings.macd.signal_period}": "macd_signal",
-        }
-        # Only rename columns that actually exist after calculation
-        existing_cols = df.columns
-        effective_rename_map = {
-            old: new for old, new in rename_map.items() if old in existing_cols
-        }
-        df.rename(columns=effective_rename_map, inplace=True)
+        # Columns missing after calculation are skipped by errors="ignore"
+        df.rename(columns=_rename_map(params), inplace=True, errors="ignore")
 
         logger.debug(f"Successfully calculated indicators. DataFrame shape: {df.shape}")
 
@@ -97,6 +152,112 @@ def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _ema_step(ema: Dict[str, float], price: float, period: int) -> Optional[float]:
+    """Advance an EMA by one bar, seeding it with the SMA of the first bars.
+
+    ``ema`` holds ``n``/``total`` while seeding and ``value`` afterwards.
+    """
+    if "value" in ema:
+        alpha = 2.0 / (period + 1)
+        ema["value"] = alpha * price + (1.0 - alpha) * ema["value"]
+        return ema["value"]
+    ema["n"] += 1
+    ema["total"] += price
+    if ema["n"] < period:
+        return None
+    ema["value"] = ema["total"] / period
+    return ema["value"]
+
+
+def update_indicators_incremental(
+    state: Dict[str, Any], row: Dict[str, float]
+) -> Dict[str, Optional[float]]:
+    """
+    Folds one new bar into running indicator state in O(1).
+
+    Produces the same column names and values as
+    ``calculate_indicators(live=True)`` so live and batch paths are
+    interchangeable. Values are None until enough bars have been seen to fill
+    the respective window.
+
+    Args:
+        state (Dict[str, Any]): Mutable per-symbol state. Pass an empty dict
+                                for the first bar and reuse it afterwards.
+        row (Dict[str, float]): The new bar; only 'close' (any case) is used.
+
+    Returns:
+        Dict[str, Optional[float]]: Latest indicator values.
+    """
+    close = row.get("close", row.get("Close"))
+    if close is None:
+        raise ValueError("row must contain a 'close' price")
+    price = float(close)
+
+    if not state:
+        params = _indicator_params(settings.indicators)
+        state.update(
+            params=params,
+            # Window contents plus their running sum
+            sma={
+                "sma_fast": [deque(maxlen=params[0]), 0.0],
+                "sma_slow": [deque(maxlen=params[1]), 0.0],
+            },
+            ema={
+                k: {"n": 0, "total": 0.0}
+                for k in ("ema_fast", "ema_slow", "macd_fast", "macd_slow", "signal")
+            },
+            prev_close=None,
+            rsi_seen=0,
+            gains=0.0,
+            losses=0.0,
+        )
+    _, _, ema_fast, ema_slow, rsi_period, macd_fast, macd_slow, signal = state["params"]
+    ema = state["ema"]
+    out: Dict[str, Optional[float]] = {}
+
+    # SMA over fixed-size windows: add the new bar, drop the evicted one
+    for key, entry in state["sma"].items():
+        window = entry[0]
+        if len(window) == window.maxlen:
+            entry[1] -= window[0]
+        window.append(price)
+        entry[1] += price
+        out[key] = entry[1] / window.maxlen if len(window) == window.maxlen else None
+
+    # EMA recurrences: ema_t = alpha * price + (1 - alpha) * ema_{t-1}
+    out["ema_fast"] = _ema_step(ema["ema_fast"], price, ema_fast)
+    out["ema_slow"] = _ema_step(ema["ema_slow"], price, ema_slow)
+    fast = _ema_step(ema["macd_fast"], price, macd_fast)
+    slow = _ema_step(ema["macd_slow"], price, macd_slow)
+
+    # MACD is the fast/slow EMA spread smoothed by a signal EMA
+    out["macd_line"] = out["macd_signal"] = out["macd_hist"] = None
+    if fast is not None and slow is not None:
+        line = fast - slow
+        out["macd_line"] = line
+        sig = _ema_step(ema["signal"], line, signal)
+        if sig is not None:
+            out["macd_signal"] = sig
+            out["macd_hist"] = line - sig
+
+    # RSI as pandas_ta computes it: gains and losses smoothed by an adjusted
+    # EWM with alpha = 1 / n, whose shared normaliser cancels in the ratio
+    out["rsi_value"] = None
+    prev_close = state["prev_close"]
+    state["prev_close"] = price
+    if prev_close is not None:
+        change = price - prev_close
+        decay = 1.0 - 1.0 / rsi_period
+        state["gains"] = decay * state["gains"] + max(change, 0.0)
+        state["losses"] = decay * state["losses"] + max(-change, 0.0)
+        state["rsi_seen"] += 1
+        total = state["gains"] + state["losses"]
+        if state["rsi_seen"] >= rsi_period and total > 0.0:
+            out["rsi_value"] = 100.0 * state["gains"] / total
+
+    return out
+
+
 # --- Example Usage (for testing) ---
 if __name__ == "__main__":
     from hydrobot.utils.logger_setup import setup_logging
@@ -1,25 +1,43 @@
-"""Database utilities and ORM models for HydroBot."""
-
-from .db_utils import (
-    bulk_insert_data,
-    get_open_positions,
-    get_session,
-    init_db,
-    log_model_prediction,
-    update_symbol_metrics,
-)
-from .models import Base, ModelPrediction, Position, SymbolMetrics, Trade
-
-__all__ = [
-    "init_db",
-    "get_session",
-    "bulk_insert_data",
-    "get_open_positions",
-    "log_model_prediction",
-    "update_symbol_metrics",
-    "Base",
-    "Trade",
-    "Position",
-    "SymbolMetrics",
-    "ModelPrediction",
-]
+"""Database utilities and ORM models for HydroBot.
+
+Public names are imported lazily (PEP 562) so importing the package does not
+load SQLAlchemy or touch the database until a helper is actually used.
+"""
+
+import importlib
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    "init_db": (".db_utils", "init_db"),
+    "get_engine": (".db_utils", "get_engine"),
+    "get_session": (".db_utils", "get_session"),
+    "transaction": (".db_utils", "transaction"),
+    "bulk_insert_data": (".db_utils", "bulk_insert_data"),
+    "get_open_positions": (".db_utils", "get_open_positions"),
+    "log_model_prediction": (".db_utils", "log_model_prediction"),
+    "log_predictions": (".db_utils", "log_predictions"),
+    "PredictionLogger": (".db_utils", "PredictionLogger"),
+    "update_position": (".db_utils", "update_position"),
+    "update_symbol_metrics": (".db_utils", "update_symbol_metrics"),
+    "Base": (".models", "Base"),
+    "Trade": (".models", "Trade"),
+    "Position": (".models", "Position"),
+    "SymbolMetrics": (".models", "SymbolMetrics"),
+    "ModelPrediction": (".models", "ModelPrediction"),
+    "FeatureBlob": (".models", "FeatureBlob"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
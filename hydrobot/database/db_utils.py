@@ -1,16 +1,23 @@
 """Database utilities for HydroBot."""
 
+import asyncio
+import functools
+import hashlib
 import json
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import case, create_engine, event, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from hydrobot.config.settings import settings
 from hydrobot.database.models import (
     Base,
+    FeatureBlob,
     ModelPrediction,
     Position,
     SymbolMetrics,
@@ -18,19 +25,82 @@ from hydrobot.database.models import (
 )
 from hydrobot.utils.logger_setup import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 log = get_logger(__name__)
 
-# Create database engine and session factory
-engine = create_engine(
-    settings.database.URL, echo=settings.database.ECHO, pool_pre_ping=True
-)
-SessionLocal = sessionmaker(bind=engine)
+
+def _sqlite_pragmas(dbapi_conn, _) -> None:
+    """Trade per-commit fsyncs for WAL durability on SQLite."""
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.close()
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode NumPy scalars and arrays (anything with ``tolist``) as JSON."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Create the database engine on first use.
+
+    Returns:
+        SQLAlchemy engine for ``settings.database.URL``
+    """
+    url = make_url(settings.database.URL)
+    kwargs: Dict[str, Any] = {}
+    if url.get_backend_name() != "sqlite":
+        # The default pool of 5 starves concurrent tick handlers
+        kwargs.update(pool_size=20, max_overflow=40, pool_recycle=1800)
+    if orjson is not None:
+        kwargs.update(
+            json_serializer=lambda obj: orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode(),
+            json_deserializer=orjson.loads,
+        )
+    else:
+        kwargs.update(
+            json_serializer=functools.partial(json.dumps, default=_json_default)
+        )
+    engine = create_engine(
+        url,
+        echo=settings.database.ECHO,
+        pool_pre_ping=True,
+        # Rows per multi-VALUES INSERT when executing many parameter sets
+        insertmanyvalues_page_size=1000,
+        **kwargs,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _sqlite_pragmas)
+    return engine
+
+
+@functools.lru_cache(maxsize=1)
+def _sessionmaker() -> sessionmaker:
+    """Session factory bound to the lazily created engine."""
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+
+# One session per thread, reused across helper calls; nothing connects until
+# the first session is requested
+SessionLocal = scoped_session(lambda: _sessionmaker()())
 
 
 def init_db() -> None:
     """Initialize database schema."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         log.info("Database initialized")
     except SQLAlchemyError as e:
         log.error("Database initialization failed", error=str(e))
@@ -38,7 +108,7 @@ def init_db() -> None:
 
 
 def get_session() -> Session:
-    """Get a database session.
+    """Get the current thread's database session.
 
     Returns:
         SQLAlchemy session
@@ -46,86 +116,174 @@ def get_session() -> Session:
     return SessionLocal()
 
 
-def bulk_insert_data(records: List[Dict[str, Any]], model: Any) -> bool:
+@contextmanager
+def transaction(session: Optional[Session] = None) -> Iterator[Session]:
+    """Run a unit of work in one transaction.
+
+    Commits once on exit and rolls back on error. When ``session`` is given
+    the work joins the caller's transaction instead, so several helper calls
+    in one tick can share a single commit::
+
+        with transaction() as session:
+            for symbol, qty, price in fills:
+                update_position(symbol, qty, price, session=session)
+
+    Args:
+        session: Optional session whose transaction the caller manages
+
+    Yields:
+        SQLAlchemy session
+    """
+    if session is not None:
+        yield session
+        return
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+
+
+# Dialect INSERT constructs supporting ON CONFLICT ... DO UPDATE
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def _dialect_insert(session: Session, model: Any) -> Any:
+    """Build a dialect ``INSERT`` that supports ``ON CONFLICT`` clauses.
+
+    Args:
+        session: Session whose bind decides the dialect
+        model: SQLAlchemy model class
+
+    Returns:
+        Dialect insert statement
+    """
+    dialect = session.get_bind().dialect.name
+    try:
+        return _UPSERT_INSERTS[dialect](model)
+    except KeyError:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+
+def _upsert(session: Session, model: Any, values: Dict[str, Any]) -> Any:
+    """Build an ``INSERT ... ON CONFLICT`` statement for the session's dialect.
+
+    Args:
+        session: Session whose bind decides the dialect
+        model: SQLAlchemy model class
+        values: Column values to insert
+
+    Returns:
+        Dialect insert statement, ready for ``on_conflict_do_update``
+    """
+    return _dialect_insert(session, model).values(**values)
+
+
+def bulk_insert_data(
+    records: List[Dict[str, Any]], model: Any, session: Optional[Session] = None
+) -> bool:
     """Insert multiple records into database.
 
+    The records are sent as one executemany INSERT in a single transaction,
+    which SQLAlchemy batches into multi-VALUES statements.
+
     Args:
         records: List of dictionaries containing record data
         model: SQLAlchemy model class
+        session: Optional session to join (see ``transaction``)
 
     Returns:
         True if successful
     """
+    if not records:
+        return True
     try:
-        with get_session() as session:
-            session.bulk_insert_mappings(model, records)
-            session.commit()
+        with transaction(session) as s:
+            s.execute(insert(model), records)
         return True
     except SQLAlchemyError as e:
         log.error("Bulk insert failed", error=str(e))
         return False
 
 
-def get_open_positions() -> List[Dict[str, Any]]:
+def get_open_positions(session: Optional[Session] = None) -> List[Dict[str, Any]]:
     """Get currently open positions.
 
+    Args:
+        session: Optional session to join (see ``transaction``)
+
     Returns:
         List of position dictionaries
     """
     try:
-        with get_session() as session:
-            positions = session.query(Position).all()
-            return [
-                {
-                    "symbol": p.symbol,
-                    "quantity": p.quantity,
-                    "entry_price": p.entry_price,
-                    "current_price": p.current_price,
-                    "unrealized_pnl": p.unrealized_pnl,
-                    "last_update": p.last_update.isoformat(),
-                }
-                for p in positions
-            ]
+        with transaction(session) as s:
+            # Plain column rows: no ORM objects or identity map to build
+            rows = s.execute(
+                select(
+                    Position.symbol,
+                    Position.quantity,
+                    Position.entry_price,
+                    Position.current_price,
+                    Position.unrealized_pnl,
+                    Position.last_update,
+                ).execution_options(yield_per=1000)
+            )
+            positions = []
+            for row in rows:
+                position = row._asdict()
+                position["last_update"] = row.last_update.isoformat()
+                positions.append(position)
+            return positions
     except SQLAlchemyError as e:
         log.error("Failed to get positions", error=str(e))
         return []
 
 
 def update_position(
-    symbol: str, quantity: float, price: float, pnl: Optional[float] = None
+    symbol: str,
+    quantity: float,
+    price: float,
+    pnl: Optional[float] = None,
+    session: Optional[Session] = None,
 ) -> bool:
-    """Update or create position record.
+    """Update or create position record in a single upsert statement.
 
     Args:
         symbol: Trading pair symbol
         quantity: Position size
         price: Current price
         pnl: Optional unrealized PnL
+        session: Optional session to join (see ``transaction``)
 
     Returns:
         True if successful
     """
     try:
-        with get_session() as session:
-            position = session.query(Position).filter_by(symbol=symbol).first()
-
-            if position:
-                position.quantity = quantity
-                position.current_price = price
-                if pnl is not None:
-                    position.unrealized_pnl = pnl
-                position.last_update = datetime.utcnow()
-            else:
-                position = Position(
+        with transaction(session) as s:
+            stmt = _upsert(
+                s,
+                Position,
+                dict(
                     symbol=symbol,
                     quantity=quantity,
                     entry_price=price,
                     current_price=price,
-                    unrealized_pnl=0.0,
-                )
-                session.add(position)
-
-            session.commit()
+                    unrealized_pnl=pnl if pnl is not None else 0.0,
+                ),
+            )
+            # set_ bypasses column onupdate hooks, so stamp it explicitly
+            update = {
+                "quantity": stmt.excluded.quantity,
+                "current_price": stmt.excluded.current_price,
+                "last_update": func.now(),
+            }
+            if pnl is not None:
+                update["unrealized_pnl"] = stmt.excluded.unrealized_pnl
+            s.execute(
+                stmt.on_conflict_do_update(index_elements=["symbol"], set_=update)
+            )
             return True
 
     except SQLAlchemyError as e:
@@ -133,12 +291,94 @@ def update_position(
         return False
 
 
+def _feature_hash(features: Dict[str, Any]) -> bytes:
+    """SHA-256 of the canonical (sorted-key) JSON encoding of ``features``.
+
+    NumPy values hash like the equal Python numbers they are stored as.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(
+            features,
+            default=_json_default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    else:
+        encoded = json.dumps(
+            features,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_json_default,
+        ).encode()
+    return hashlib.sha256(encoded).digest()
+
+
+def _feature_ids(session: Session, feature_sets: List[Dict[str, Any]]) -> List[int]:
+    """Store each distinct feature set once and return their blob ids.
+
+    Args:
+        session: Session to run in
+        feature_sets: Feature dictionaries, duplicates allowed
+
+    Returns:
+        Blob id for each entry of ``feature_sets``
+    """
+    hashes = [_feature_hash(f) for f in feature_sets]
+    blobs = dict(zip(hashes, feature_sets))
+    session.execute(
+        _dialect_insert(session, FeatureBlob).on_conflict_do_nothing(
+            index_elements=["sha256"]
+        ),
+        [{"sha256": h, "payload": f} for h, f in blobs.items()],
+    )
+    ids = dict(
+        session.execute(
+            select(FeatureBlob.sha256, FeatureBlob.id).where(
+                FeatureBlob.sha256.in_(list(blobs))
+            )
+        ).all()
+    )
+    return [ids[h] for h in hashes]
+
+
+def log_predictions(
+    predictions: List[Dict[str, Any]], session: Optional[Session] = None
+) -> bool:
+    """Log several model predictions in one transaction.
+
+    Each distinct ``features`` dict is stored once in ``feature_blobs`` and
+    referenced from the prediction by ``features_id``.
+
+    Args:
+        predictions: Dictionaries with the ``log_model_prediction`` arguments
+        session: Optional session to join (see ``transaction``)
+
+    Returns:
+        True if successful
+    """
+    if not predictions:
+        return True
+    try:
+        with transaction(session) as s:
+            rows = [dict(p) for p in predictions]
+            features = [row.pop("features") for row in rows]
+            for row, features_id in zip(rows, _feature_ids(s, features)):
+                row["features_id"] = features_id
+            s.execute(insert(ModelPrediction), rows)
+            return True
+
+    except SQLAlchemyError as e:
+        log.error("Failed to log prediction", error=str(e))
+        return False
+
+
 def log_model_prediction(
     model_name: str,
     symbol: str,
     prediction: int,
     confidence: float,
     features: Dict[str, Any],
+    session: Optional[Session] = None,
 ) -> bool:
     """Log model prediction for later analysis.
 
@@ -148,65 +388,189 @@ def log_model_prediction(
         prediction: Model prediction (0=SELL, 1=BUY)
         confidence: Prediction confidence score
         features: Input features used
+        session: Optional session to join (see ``transaction``)
 
     Returns:
         True if successful
     """
-    try:
-        with get_session() as session:
-            pred = ModelPrediction(
-                model_name=model_name,
-                symbol=symbol,
-                timestamp=datetime.utcnow(),
-                prediction=prediction,
-                confidence=confidence,
-                features=json.dumps(features),
-            )
-            session.add(pred)
-            session.commit()
-            return True
-
-    except SQLAlchemyError as e:
-        log.error("Failed to log prediction", error=str(e))
-        return False
+    return log_predictions(
+        [
+            {
+                "model_name": model_name,
+                "symbol": symbol,
+                "prediction": prediction,
+                "confidence": confidence,
+                "features": features,
+            }
+        ],
+        session=session,
+    )
 
 
 def update_symbol_metrics(
-    symbol: str, trade_won: bool, pnl: float, drawdown: Optional[float] = None
+    symbol: str,
+    trade_won: bool,
+    pnl: float,
+    drawdown: Optional[float] = None,
+    session: Optional[Session] = None,
 ) -> bool:
     """Update trading metrics for symbol.
 
+    Counters are incremented in SQL by a single upsert, so concurrent
+    updates cannot lose counts.
+
     Args:
         symbol: Trading pair symbol
         trade_won: Whether trade was profitable
         pnl: Realized profit/loss
         drawdown: Optional maximum drawdown
+        session: Optional session to join (see ``transaction``)
 
     Returns:
         True if successful
     """
     try:
-        with get_session() as session:
-            metrics = session.query(SymbolMetrics).filter_by(symbol=symbol).first()
-
-            if not metrics:
-                metrics = SymbolMetrics(symbol=symbol)
-                session.add(metrics)
-
-            metrics.total_trades += 1
-            if trade_won:
-                metrics.winning_trades += 1
-            metrics.total_pnl += pnl
-
+        with transaction(session) as s:
+            won = 1 if trade_won else 0
+            stmt = _upsert(
+                s,
+                SymbolMetrics,
+                dict(
+                    symbol=symbol,
+                    total_trades=1,
+                    winning_trades=won,
+                    total_pnl=pnl,
+                    max_drawdown=drawdown,
+                    last_trade_time=func.now(),
+                ),
+            )
+            update = {
+                "total_trades": func.coalesce(SymbolMetrics.total_trades, 0) + 1,
+                "winning_trades": func.coalesce(SymbolMetrics.winning_trades, 0) + won,
+                "total_pnl": func.coalesce(SymbolMetrics.total_pnl, 0.0) + pnl,
+                "last_trade_time": stmt.excluded.last_trade_time,
+            }
             if drawdown is not None:
-                metrics.max_drawdown = min(
-                    metrics.max_drawdown or float("inf"), drawdown
+                update["max_drawdown"] = case(
+                    (
+                        or_(
+                            SymbolMetrics.max_drawdown.is_(None),
+                            SymbolMetrics.max_drawdown > drawdown,
+                        ),
+                        drawdown,
+                    ),
+                    else_=SymbolMetrics.max_drawdown,
                 )
-
-            metrics.last_trade_time = datetime.utcnow()
-            session.commit()
+            s.execute(
+                stmt.on_conflict_do_update(index_elements=["symbol"], set_=update)
+            )
             return True
 
     except SQLAlchemyError as e:
         log.error("Failed to update metrics", error=str(e))
         return False
+
+
+class PredictionLogger:
+    """Buffers model predictions and writes them in batches.
+
+    ``log`` only enqueues; a background task flushes the queue through
+    ``log_predictions`` every ``flush_interval`` seconds or as soon as
+    ``batch_size`` rows are waiting, so one commit covers many predictions.
+    Timestamps are filled in by the database at flush time. ``TradingManager``
+    starts and stops it with the trading loop.
+    """
+
+    def __init__(self, flush_interval: float = 0.2, batch_size: int = 500):
+        """Initialize prediction logger.
+
+        Args:
+            flush_interval: Maximum seconds a prediction waits before writing
+            batch_size: Rows that trigger an immediate flush
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        # Rows taken off the queue but not yet handed to a flush
+        self._pending: List[Dict[str, Any]] = []
+
+    def log(
+        self,
+        model_name: str,
+        symbol: str,
+        prediction: int,
+        confidence: float,
+        features: Dict[str, Any],
+    ) -> None:
+        """Queue a prediction; see ``log_model_prediction`` for arguments."""
+        self._queue.put_nowait(
+            {
+                "model_name": model_name,
+                "symbol": symbol,
+                "prediction": prediction,
+                "confidence": confidence,
+                "features": features,
+            }
+        )
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        batch, self._pending = self._pending, []
+        while batch or not self._queue.empty():
+            await self._flush(batch + self._drain())
+            batch = []
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Take up to ``batch_size`` queued rows without waiting."""
+        batch = []
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        """Collect rows until the batch fills or the interval elapses."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._pending
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._pending = []
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch off the event loop.
+
+        A batch that cannot be written is logged and dropped, so one bad row
+        does not stop the logger.
+        """
+        if not batch:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            ok = await loop.run_in_executor(None, log_predictions, batch)
+        except Exception as e:
+            log.error("Dropped prediction batch of %d rows: %s", len(batch), e)
+            return
+        if not ok:
+            log.error("Dropped prediction batch of %d rows", len(batch))
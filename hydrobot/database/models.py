@@ -1,24 +1,24 @@
 """SQLAlchemy models for HydroBot database."""
 
-from datetime import datetime
-from typing import Optional
-
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
     Index,
     Integer,
-    MetaData,
+    JSON,
+    LargeBinary,
+    SmallInteger,
     String,
-    Table,
+    func,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
-metadata = MetaData()
 
 
 class Trade(Base):
@@ -27,9 +27,28 @@ class Trade(Base):
     __tablename__ = "trade_log"
 
     id = Column(Integer, primary_key=True)
-    symbol = Column(String, nullable=False, index=True)
-    trade_type = Column(String, nullable=False)  # BUY/SELL
-    status = Column(String, nullable=False)
+    symbol = Column(String, nullable=False)
+    # Stored as VARCHAR + CHECK (native_enum=False), portable across backends
+    trade_type = Column(
+        Enum(
+            "BUY", "SELL", name="trade_type", native_enum=False, create_constraint=True
+        ),
+        nullable=False,
+    )
+    # ccxt order statuses
+    status = Column(
+        Enum(
+            "open",
+            "closed",
+            "canceled",
+            "expired",
+            "rejected",
+            name="trade_status",
+            native_enum=False,
+            create_constraint=True,
+        ),
+        nullable=False,
+    )
     binance_order_id = Column(String)
     price = Column(Float, nullable=False)
     quantity = Column(Float, nullable=False)
@@ -39,7 +58,7 @@ class Trade(Base):
     signal_confidence = Column(Float)
     trigger_reason = Column(String, nullable=False)
     trading_mode = Column(String, nullable=False)  # LIVE/PAPER
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, nullable=False, server_default=func.now())
 
 
 class Position(Base):
@@ -53,7 +72,7 @@ class Position(Base):
     entry_price = Column(Float, nullable=False)
     current_price = Column(Float)
     unrealized_pnl = Column(Float)
-    last_update = Column(DateTime, default=datetime.utcnow)
+    last_update = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class SymbolMetrics(Base):
@@ -70,6 +89,16 @@ class SymbolMetrics(Base):
     last_trade_time = Column(DateTime)
 
 
+class FeatureBlob(Base):
+    """Distinct model input feature sets, shared by predictions."""
+
+    __tablename__ = "feature_blobs"
+
+    id = Column(Integer, primary_key=True)
+    sha256 = Column(LargeBinary(32), nullable=False, unique=True, index=True)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+
+
 class ModelPrediction(Base):
     """ML model predictions and performance tracking."""
 
@@ -78,18 +107,28 @@ class ModelPrediction(Base):
     id = Column(Integer, primary_key=True)
     model_name = Column(String, nullable=False)
     symbol = Column(String, nullable=False)
-    timestamp = Column(DateTime, nullable=False)
-    prediction = Column(Integer, nullable=False)  # 0=SELL, 1=BUY
+    timestamp = Column(DateTime, nullable=False, server_default=func.now())
+    prediction = Column(SmallInteger, nullable=False)  # 0=SELL, 1=BUY
     confidence = Column(Float, nullable=False)
-    features = Column(String)  # JSON string of input features
+    features_id = Column(Integer, ForeignKey("feature_blobs.id"))  # Input features
     was_profitable = Column(Boolean)  # Set after position closes
     actual_pnl = Column(Float)  # Set after position closes
 
 
 # Create indices
+# Leftmost prefix also serves symbol-only lookups, so symbol has no own index
 Trade.__table__.append_constraint(
     Index("idx_trade_symbol_time", Trade.symbol, Trade.timestamp)
 )
 ModelPrediction.__table__.append_constraint(
     Index("idx_pred_symbol_time", ModelPrediction.symbol, ModelPrediction.timestamp)
 )
+ModelPrediction.__table__.append_constraint(
+    Index(
+        "idx_pred_model_symbol_time",
+        ModelPrediction.model_name,
+        ModelPrediction.symbol,
+        ModelPrediction.timestamp,
+    )
+)
+Position.__table__.append_constraint(Index("idx_pos_last_update", Position.last_update))
@@ -151,10 +151,6 @@ def generate_features_for_symbol(
     ) != datetime.timedelta(0):
         log.error("end_time_utc must be timezone-aware UTC.")
         return None
-    if db_utils.engine is None:
-        log.error("Feature Generation: DB engine not configured.")
-        return None
-
     start_time_utc = end_time_utc - history_duration
     interval = "5m"  # Assuming 5-minute interval based on config fetch interval
 
@@ -167,7 +163,7 @@ def generate_features_for_symbol(
     sentiment_df = None
     try:
         # Use the engine directly for pd.read_sql when passing SQLAlchemy selectables
-        engine = db_utils.engine  # Get the engine instance
+        engine = db_utils.get_engine()  # Get the engine instance
 
         # Fetch Price Data
         price_query = (
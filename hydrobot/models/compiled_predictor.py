@@ -0,0 +1,106 @@
+"""Native-code inference for the Random Forest via treelite.
+
+The forest is compiled once, after training, into a shared library that sits
+next to the joblib model. Its tree walk runs as straight-line C code, not
+through sklearn's Python wrappers. With ``quantize`` the float64 split
+thresholds are replaced by small integer bin indices, shrinking the data each
+comparison touches. The predictor uses the library when it is present and
+newer than the model, and otherwise falls back to the joblib model.
+"""
+
+import argparse
+import logging
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+try:
+    import treelite
+    import treelite_runtime
+except ImportError:  # pragma: no cover - optional dependency
+    treelite = None
+    treelite_runtime = None
+
+log = logging.getLogger(__name__)
+
+COMPILED_MODEL_FILENAME = "rf.so"
+
+
+def compiled_path_for(model_path: str) -> str:
+    """Location of the compiled library belonging to ``model_path``."""
+    return os.path.join(os.path.dirname(model_path), COMPILED_MODEL_FILENAME)
+
+
+def is_current(libpath: str, model_path: str) -> bool:
+    """True when ``libpath`` was compiled after ``model_path`` was last written.
+
+    A retrained model makes the library stale; serving it would silently
+    keep predicting with the previous forest.
+    """
+    return os.stat(libpath).st_mtime >= os.stat(model_path).st_mtime
+
+
+class CompiledForest:
+    """Drop-in for the sklearn classifier's ``predict_proba``/``classes_``."""
+
+    def __init__(self, predictor: Any, classes: np.ndarray):
+        self._predictor = predictor
+        self.classes_ = classes
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        scores = self._predictor.predict(treelite_runtime.DMatrix(X))
+        if scores.ndim == 1:
+            # Binary forests return only the probability of classes_[1]
+            return np.column_stack((1.0 - scores, scores))
+        return scores
+
+
+def compile_forest(
+    model: Any, libpath: str, parallel_comp: int = 8, quantize: bool = False
+) -> bool:
+    """Compile a fitted sklearn forest to ``libpath``. Needs gcc.
+
+    ``quantize`` maps each feature's thresholds to integer bins. Predictions
+    are unchanged, since only comparisons against the same split points are
+    made, but leave it off where the compiled output must be bit-for-bit
+    auditable against sklearn.
+    """
+    if treelite is None:
+        log.error("treelite is not installed. Cannot compile model.")
+        return False
+    tl_model = treelite.sklearn.import_model(model)
+    params = {"parallel_comp": parallel_comp}
+    if quantize:
+        params["quantize"] = 1
+    tl_model.export_lib(toolchain="gcc", libpath=libpath, params=params)
+    log.info("Compiled model written to: %s", libpath)
+    return True
+
+
+def load_compiled(libpath: str, classes: np.ndarray) -> Optional[CompiledForest]:
+    """Load a compiled forest, or None when treelite_runtime is unavailable."""
+    if treelite_runtime is None:
+        log.warning("treelite_runtime not installed. Ignoring %s.", libpath)
+        return None
+    log.info("Loading compiled model from: %s", libpath)
+    return CompiledForest(treelite_runtime.Predictor(libpath), classes)
+
+
+if __name__ == "__main__":
+    import joblib
+
+    parser = argparse.ArgumentParser(description="Compile a trained forest.")
+    parser.add_argument("model_path", help="joblib or pickle file of the model")
+    parser.add_argument(
+        "--quantize", action="store_true", help="quantize split thresholds"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    ok = compile_forest(
+        joblib.load(args.model_path),
+        compiled_path_for(args.model_path),
+        quantize=args.quantize,
+    )
+    raise SystemExit(0 if ok else 1)
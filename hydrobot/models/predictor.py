@@ -1,11 +1,11 @@
 """Core ML prediction utilities."""
 
+import asyncio
 import json
 import logging
 import os
-import datetime
-import pytz
-from typing import Any, Dict, Optional, Tuple
+import pickle
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import joblib
 import numpy as np
@@ -14,6 +14,11 @@ from feature_engineering.feature_generator import preprocess_backfill_data
 
 # Use absolute imports assuming 'cyclonev2' is the project root added to PYTHONPATH
 from hydrobot import config
+from hydrobot.models.compiled_predictor import (
+    compiled_path_for,
+    is_current,
+    load_compiled,
+)
 from hydrobot.models.trainer import (  # Import constants
     MODEL_DIR,
     MODEL_FILENAME,
@@ -22,52 +27,132 @@ from hydrobot.models.trainer import (  # Import constants
 
 log = logging.getLogger(__name__)
 
+# Rows per model.predict call when scoring a whole backfill; bounds the
+# per-tree probability matrices sklearn allocates for each call
+PREDICT_CHUNK_ROWS = 50_000
+
 # --- Model Loading ---
-_loaded_model = None
-_model_metadata = None
+# (absolute path, mtime) -> deserialized file contents. A changed mtime
+# invalidates the entry, so retrained models are picked up without restarts.
+_MODEL_CACHE: Dict[Tuple[str, float], Any] = {}
+# Compiled libraries already reported as older than their model
+_STALE_COMPILED: Set[Tuple[str, float]] = set()
 
 
-def load_model_and_metadata() -> Optional[Tuple[Any, Dict]]:
-    """Load the saved model and its metadata if not already loaded."""
+def _load_cached(path: str, loader: Callable[[str], Any]) -> Any:
+    """Return ``loader(path)``, reusing the result while the file is unchanged."""
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime)
+    try:
+        return _MODEL_CACHE[key]
+    except KeyError:
+        pass
+    for stale in [k for k in _MODEL_CACHE if k[0] == path]:
+        del _MODEL_CACHE[stale]
+    value = _MODEL_CACHE[key] = loader(path)
+    return value
+
+
+def _prefetch(path: str) -> None:
+    """Hint the kernel to read the whole file into the page cache."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
 
-    global _loaded_model, _model_metadata
-    if _loaded_model is None:
-        model_path = os.path.join(MODEL_DIR, MODEL_FILENAME)
-        metadata_path = os.path.join(MODEL_DIR, MODEL_METADATA_FILENAME)
 
-        if not os.path.exists(model_path) or not os.path.exists(metadata_path):
-            log.error(
-                "Model file '%s' or metadata file '%s' not found. Cannot load model.",
-                model_path,
-                metadata_path,
-            )
-            return None
+def _load_fast(path: str) -> Any:
+    """Unpickle ``path`` directly, falling back to joblib for joblib dumps.
 
-        try:
-            log.info("Loading model from: %s", model_path)
-            _loaded_model = joblib.load(model_path)
-            log.info("Model loaded successfully.")
-
-            log.info("Loading metadata from: %s", metadata_path)
-            with open(metadata_path, "r") as f:
-                _model_metadata = json.load(f)
-            log.info(
-                "Metadata loaded successfully. Model trained on %s features.",
-                len(_model_metadata.get("feature_names", [])),
-            )
+    Files written with ``pickle.dump(model, f, protocol=5)`` skip joblib's
+    array wrappers and load several times faster. Joblib dumps are not plain
+    pickles and raise UnpicklingError on the first opcode, so they go through
+    ``joblib.load`` with their numpy arrays memory-mapped read-only: forked
+    workers then share the tree arrays through the page cache. Memory-mapping
+    needs an uncompressed dump (``joblib.dump(model, path, compress=0)``).
+    """
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except pickle.UnpicklingError:
+        return joblib.load(path, mmap_mode="r")
+
+
+def _read_model(path: str) -> Any:
+    log.info("Loading model from: %s", path)
+    _prefetch(path)
+    model = _load_fast(path)
+    log.info("Model loaded successfully.")
+    return model
+
+
+def _read_metadata(path: str) -> Dict:
+    log.info("Loading metadata from: %s", path)
+    with open(path, "r") as f:
+        metadata = json.load(f)
+    # Pre-built column selector so predictions skip the list -> Index step
+    metadata["feature_index"] = pd.Index(metadata.get("feature_names", []))
+    log.info(
+        "Metadata loaded successfully. Model trained on %s features.",
+        len(metadata["feature_index"]),
+    )
+    return metadata
 
-        except Exception as e:
-            log.error("Error loading model or metadata: %s", e, exc_info=True)
-            _loaded_model = None
-            _model_metadata = None
 
-    return _loaded_model, _model_metadata
+def load_model_and_metadata() -> Optional[Tuple[Any, Dict]]:
+    """Load the saved model and its metadata, cached until the files change.
+
+    A compiled forest (see ``compiled_predictor``) next to the joblib model
+    replaces it for inference when it is newer than the model and
+    treelite_runtime can load it.
+    """
+
+    model_path = os.path.join(MODEL_DIR, MODEL_FILENAME)
+    metadata_path = os.path.join(MODEL_DIR, MODEL_METADATA_FILENAME)
+
+    if not os.path.exists(model_path) or not os.path.exists(metadata_path):
+        log.error(
+            "Model file '%s' or metadata file '%s' not found. Cannot load model.",
+            model_path,
+            metadata_path,
+        )
+        return None
+
+    try:
+        model = _load_cached(model_path, _read_model)
+        libpath = compiled_path_for(model_path)
+        if os.path.exists(libpath) and not is_current(libpath, model_path):
+            stale = (libpath, os.stat(libpath).st_mtime)
+            if stale not in _STALE_COMPILED:
+                _STALE_COMPILED.add(stale)
+                log.warning(
+                    "Compiled model %s is older than %s; ignoring it. Recompile "
+                    "with 'python -m hydrobot.models.compiled_predictor %s'.",
+                    libpath,
+                    model_path,
+                    model_path,
+                )
+        elif os.path.exists(libpath):
+            compiled = _load_cached(
+                libpath, lambda path: load_compiled(path, model.classes_)
+            )
+            if compiled is not None:
+                model = compiled
+        return model, _load_cached(metadata_path, _read_metadata)
+    except Exception as e:
+        log.error("Error loading model or metadata: %s", e, exc_info=True)
+        return None
 
 
 def load_model(model_path="trained_models/random_forest_model.joblib"):
     """
     Load the trained model from the specified path.
 
+    Repeated calls return the cached model until the file changes.
+
     Args:
         model_path (str): Path to the trained model file.
 
@@ -75,7 +160,7 @@ def load_model(model_path="trained_models/random_forest_model.joblib"):
         model: The loaded model.
     """
     try:
-        model = joblib.load(model_path)
+        model = _load_cached(model_path, _read_model)
         print(f"Model loaded from {model_path}")
         return model
     except Exception as e:
@@ -86,20 +171,37 @@ def load_model(model_path="trained_models/random_forest_model.joblib"):
 # --- Prediction Function ---
 
 
-def make_prediction(latest_features_df: pd.DataFrame) -> Optional[Tuple[int, float]]:
+def _predict_rows(model: Any, X: np.ndarray) -> List[Tuple[int, float]]:
+    """Predict every row of a float32 feature matrix with NaNs already imputed."""
+    # One traversal of the forest for all rows: shape [n_samples, n_classes].
+    # model.predict is exactly classes_[argmax(predict_proba)], so derive the
+    # class here instead of traversing the forest a second time.
+    probabilities = model.predict_proba(X)
+    predictions = model.classes_.take(probabilities.argmax(axis=1))
+
+    # Probability of class 1 (assuming class 1 is 'UP')
+    return [
+        (int(pred), prob)
+        for pred, prob in zip(predictions.tolist(), probabilities[:, 1].tolist())
+    ]
+
+
+def make_predictions_batch(
+    features_df: Union[pd.DataFrame, np.ndarray],
+) -> Optional[List[Tuple[int, float]]]:
     """
-    Makes a prediction using the loaded model on the latest feature data.
+    Makes predictions for every row of ``features_df`` in one model call.
 
     Args:
-        latest_features_df (pd.DataFrame): A DataFrame containing the most recent
-                                           feature set for a single timestamp/symbol.
-                                           Must contain the columns the model was trained on.
+        features_df (pd.DataFrame | np.ndarray): One row per symbol/timestamp. A
+                                    DataFrame must contain the columns the model
+                                    was trained on; an array must already hold
+                                    them in ``feature_names`` order.
 
     Returns:
-        Optional[Tuple[int, float]]: A tuple containing:
-                                     - prediction (int): The predicted class (0 or 1).
-                                     - confidence (float): The probability of the predicted class 1.
-                                     Returns None if prediction fails.
+        Optional[List[Tuple[int, float]]]: One (prediction, probability of class 1)
+                                           tuple per input row, in order.
+                                           Returns None if prediction fails.
     """
     model_info = load_model_and_metadata()
     if not model_info:
@@ -107,69 +209,248 @@ def make_prediction(latest_features_df: pd.DataFrame) -> Optional[Tuple[int, flo
         return None
 
     model, metadata = model_info
-    required_features = metadata.get("feature_names")
+    required_features = metadata.get("feature_index")
 
-    if not required_features:
+    if required_features is None or required_features.empty:
         log.error(
             "Model metadata does not contain feature names. Cannot ensure feature consistency."
         )
         return None
 
-    if latest_features_df.empty:
+    if len(features_df) == 0:
         log.error("Received empty DataFrame for prediction.")
         return None
 
-    # Ensure input DataFrame has the correct features in the correct order
+    # Ensure input has the correct features in the correct order. The forest
+    # works in float32 internally, so convert once here; missing values get the
+    # training imputation (0) on a copy, leaving the caller's data intact.
     try:
-        # Select only the required features
-        features_for_prediction = latest_features_df[required_features]
-
-        # Check for NaNs in the input features for this prediction step
-        if features_for_prediction.isnull().values.any():
-            nan_cols = features_for_prediction.columns[
-                features_for_prediction.isnull().any()
-            ].tolist()
-            log.warning(
-                f"NaN values detected in features for prediction: {nan_cols}. Attempting imputation with 0."
-            )
-            # Apply the same imputation used during training (assuming 0 for simplicity)
-            features_for_prediction = features_for_prediction.fillna(0)
-            # If a different imputation was used in training, apply that here.
-
-        # Ensure only one row is passed for prediction
-        if len(features_for_prediction) > 1:
-            log.warning(
-                f"Prediction input DataFrame has {len(features_for_prediction)} rows. Using the last row."
+        if isinstance(features_df, np.ndarray):
+            if features_df.ndim != 2 or features_df.shape[1] != len(required_features):
+                log.error(
+                    f"Feature array has shape {features_df.shape}, expected "
+                    f"(n, {len(required_features)})."
+                )
+                return None
+            X = features_df.astype(np.float32, copy=True)
+            np.nan_to_num(X, copy=False, nan=0.0)
+        else:
+            # Resolve the required features to column positions in one
+            # Index-to-Index hash lookup; -1 marks a missing feature
+            positions = features_df.columns.get_indexer(required_features)
+            if (positions < 0).any():
+                raise KeyError(required_features[positions < 0].tolist())
+            # na_value fuses the imputation into the float32 conversion
+            X = features_df.iloc[:, positions].to_numpy(dtype=np.float32, na_value=0.0)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Making {len(X)} prediction(s) on features: {required_features.tolist()}"
             )
-            features_for_prediction = features_for_prediction.tail(1)
+        return _predict_rows(model, X)
 
-        log.debug(
-            f"Making prediction on features: {features_for_prediction.columns.tolist()}"
+    except KeyError as e:
+        log.error(
+            f"Feature mismatch during prediction. Missing feature: {e}. Required: {required_features.tolist()}",
+            exc_info=True,
         )
+        return None
+    except Exception as e:
+        log.error(f"Error during prediction: {e}", exc_info=True)
+        return None
 
-        # Predict probability (returns array of shape [n_samples, n_classes])
-        probabilities = model.predict_proba(features_for_prediction)
 
-        # Probability of class 1 (assuming class 1 is 'UP')
-        prob_class_1 = probabilities[0, 1]
+def make_prediction(
+    latest_features_df: Union[pd.DataFrame, np.ndarray],
+) -> Optional[Tuple[int, float]]:
+    """
+    Makes a prediction using the loaded model on the latest feature data.
 
-        # Get predicted class (0 or 1)
-        prediction = int(model.predict(features_for_prediction)[0])
+    Args:
+        latest_features_df (pd.DataFrame | np.ndarray): The most recent feature
+                                           set for a single timestamp/symbol, in
+                                           either form ``make_predictions_batch``
+                                           accepts.
 
-        log.info(
-            f"Prediction successful. Class: {prediction}, Probability(Class 1): {prob_class_1:.4f}"
+    Returns:
+        Optional[Tuple[int, float]]: A tuple containing:
+                                     - prediction (int): The predicted class (0 or 1).
+                                     - confidence (float): The probability of the predicted class 1.
+                                     Returns None if prediction fails.
+    """
+    # Ensure only one row is passed for prediction
+    if len(latest_features_df) > 1:
+        log.warning(
+            f"Prediction input DataFrame has {len(latest_features_df)} rows. Using the last row."
         )
-        return prediction, prob_class_1
+        latest_features_df = latest_features_df[-1:]
 
-    except KeyError as e:
-        log.error(
-            f"Feature mismatch during prediction. Missing feature: {e}. Required: {required_features}",
-            exc_info=True,
-        )
+    results = make_predictions_batch(latest_features_df)
+    if not results:
         return None
-    except Exception as e:
-        log.error(f"Error during prediction: {e}", exc_info=True)
+    prediction, prob_class_1 = results[0]
+    log.info(
+        f"Prediction successful. Class: {prediction}, Probability(Class 1): {prob_class_1:.4f}"
+    )
+    return prediction, prob_class_1
+
+
+def _feature_row(
+    features: Union[np.ndarray, Mapping[str, float]], required_features: pd.Index
+) -> Optional[np.ndarray]:
+    """Return ``features`` as a float32 row in model order, or None on mismatch."""
+    if isinstance(features, Mapping):
+        if any(name not in features for name in required_features):
+            return None
+        values = [features[name] for name in required_features]
+        row = np.array(values, dtype=np.float32, ndmin=2)
+    else:
+        row = np.asarray(features, dtype=np.float32).reshape(1, -1)
+    if row.shape[1] != len(required_features):
         return None
+    return row
+
+
+class PredictorService:
+    """Micro-batches prediction requests from many symbols into one model call.
+
+    ``predict`` only enqueues and awaits its result; a background task stacks
+    the rows queued within ``flush_interval`` seconds (or as soon as
+    ``batch_size`` are waiting) and runs a single ``predict_proba`` on them in
+    an executor, so the event loop stays free while the forest is walked.
+    ``TradingManager`` starts and stops it with the trading loop.
+    """
+
+    model_name = os.path.splitext(MODEL_FILENAME)[0]
+
+    def __init__(self, flush_interval: float = 0.005, batch_size: int = 64):
+        """Initialize predictor service.
+
+        Args:
+            flush_interval: Maximum seconds a request waits for others to join
+            batch_size: Rows that trigger an immediate model call
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "asyncio.Queue[Tuple[str, Any, asyncio.Future]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def predict(
+        self, symbol: str, features: Union[np.ndarray, Mapping[str, float]]
+    ) -> Optional[Tuple[int, float]]:
+        """Predict one feature row.
+
+        ``features`` is either an array ordered as the model's
+        ``feature_names`` or a mapping from feature name to value. Returns the
+        same (prediction, probability of class 1) tuple as ``make_prediction``,
+        or None if the row or its batch failed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((symbol, features, future))
+        return await future
+
+    async def start(self) -> None:
+        """Start the background batching task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching task and answer anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            await self._flush(self._drain())
+
+    def _drain(self) -> List[Tuple[str, Any, asyncio.Future]]:
+        """Take up to ``batch_size`` queued requests without waiting."""
+        batch = []
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        """Collect requests until the batch fills or the interval elapses."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[str, Any, asyncio.Future]]) -> None:
+        """Run one model call for the batch and resolve each request.
+
+        Every request is answered, with None if its prediction failed, so a
+        bad batch never leaves callers waiting or stops the service.
+        """
+        if not batch:
+            return
+        results: List[Optional[Tuple[int, float]]] = [None] * len(batch)
+        try:
+            await self._predict_batch(batch, results)
+        except Exception as e:
+            log.error(
+                "Error during batch prediction for %s: %s",
+                [symbol for symbol, _, _ in batch],
+                e,
+                exc_info=True,
+            )
+        finally:
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _predict_batch(
+        self,
+        batch: List[Tuple[str, Any, asyncio.Future]],
+        results: List[Optional[Tuple[int, float]]],
+    ) -> None:
+        """Fill ``results`` for the requests whose features fit the model."""
+        loop = asyncio.get_running_loop()
+        # Loading may read the model from disk; keep it off the event loop
+        model_info = await loop.run_in_executor(None, load_model_and_metadata)
+        if not model_info:
+            log.error("Model not loaded. Cannot make prediction.")
+            return
+        model, metadata = model_info
+        required_features = metadata["feature_index"]
+        # Requests whose features do not fit the model resolve to None
+        valid: List[int] = []
+        rows: List[np.ndarray] = []
+        for i, (symbol, features, _) in enumerate(batch):
+            try:
+                row = _feature_row(features, required_features)
+            except (TypeError, ValueError) as e:
+                log.error("Unusable features for %s: %s", symbol, e)
+                continue
+            if row is None:
+                log.error(
+                    "Features for %s do not match the model's %d features.",
+                    symbol,
+                    len(required_features),
+                )
+                continue
+            valid.append(i)
+            rows.append(row)
+        if not rows:
+            return
+        X = np.vstack(rows)
+        np.nan_to_num(X, copy=False, nan=0.0)
+        predicted = await loop.run_in_executor(None, _predict_rows, model, X)
+        for i, result in zip(valid, predicted):
+            results[i] = result
 
 
 def make_predictions():
@@ -188,8 +469,13 @@ def make_predictions():
     if "target" in data.columns:
         data = data.drop(columns=["target"])
 
-    # Make predictions
-    predictions = model.predict(data)
+    # Make predictions chunk by chunk so peak memory does not grow with the
+    # backfill; the threading backend runs each chunk's trees in parallel
+    predictions = np.empty(len(data), dtype=model.classes_.dtype)
+    with joblib.parallel_backend("threading", n_jobs=os.cpu_count()):
+        for start in range(0, len(data), PREDICT_CHUNK_ROWS):
+            stop = start + PREDICT_CHUNK_ROWS
+            predictions[start:stop] = model.predict(data.iloc[start:stop])
     print("Predictions:")
     print(predictions)
 
@@ -221,11 +507,10 @@ if __name__ == "__main__":
         print("\nGenerating sample features for prediction (using latest data)...")
         from feature_engineering import feature_generator  # Import here for testing
         import datetime
-        import pytz
 
         test_symbol = "BTCUSDT"  # Use a symbol likely trained on
         # Use current time to get the very latest features possible
-        pred_time = datetime.datetime.now(pytz.utc)
+        pred_time = datetime.datetime.now(datetime.timezone.utc)
         # Need enough history to calculate lags/rolling features for the *single* prediction point
         hist_for_pred = pd.Timedelta(
             days=3
@@ -1,9 +1,50 @@
-"""Trading strategy implementations."""
+"""Trading strategy implementations.
 
-from .base_strategy import Signal, Strategy
+Public names are imported lazily (PEP 562) so a process only loads the
+strategy modules it actually references.
+"""
 
-__all__ = [
-    "Strategy",
-    "Signal",
-    "StrategyManager",
-]
+import importlib
+
+# Strategies selectable through strategy_manager.regime_mapping, by class name
+_STRATEGY_MODULES = {
+    "ScalpingStrategy": ".impl_scalping",
+    "MomentumStrategy": ".impl_momentum",
+    "MeanReversionStrategy": ".impl_mean_reversion",
+    "VWAPStrategy": ".impl_vwap",
+}
+
+# AppSettings attribute holding each registered strategy's configuration
+STRATEGY_CONFIG_KEYS = {
+    "ScalpingStrategy": "scalping_strategy",
+    "MomentumStrategy": "momentum_strategy",
+    "MeanReversionStrategy": "mean_reversion_strategy",
+    "VWAPStrategy": "vwap_strategy",
+}
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    "Strategy": (".base_strategy", "Strategy"),
+    "Signal": (".base_strategy", "Signal"),
+    "StrategyManager": (".strategy_manager", "StrategyManager"),
+    **{name: (module, name) for name, module in _STRATEGY_MODULES.items()},
+}
+
+__all__ = [*_LAZY, "STRATEGY_REGISTRY", "STRATEGY_CONFIG_KEYS"]
+
+
+def __getattr__(name):
+    if name == "STRATEGY_REGISTRY":
+        # Resolving the registry imports every registered strategy
+        value = {strategy: __getattr__(strategy) for strategy in _STRATEGY_MODULES}
+    elif name in _LAZY:
+        module, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,160 @@
+"""Numba-compiled per-tick kernels for the rolling-window strategies.
+
+Each strategy keeps a float64 ring buffer plus a small float64 ``state``
+array that the kernels update in place, so a tick costs one native call
+instead of a series of interpreted float operations. Action codes are
+``BUY``/``SELL``/``HOLD`` below.
+"""
+
+import math
+
+from ..utils.numba_compat import njit
+
+HOLD = 0
+BUY = 1
+SELL = -1
+
+# (Signal action, order book side to price from), indexed by action code
+ORDER_SIDE = (None, ("BUY", "asks"), ("SELL", "bids"))
+
+# state slots shared by every kernel
+IDX = 0
+COUNT = 1
+
+
+@njit(cache=True, fastmath=True)
+def welford_push(buf, state, x):
+    """Push ``x``; state is ``[idx, count, mean, m2]`` over ``len(buf)``."""
+    n = buf.shape[0]
+    idx = int(state[IDX])
+    count = int(state[COUNT])
+    mean = state[2]
+    m2 = state[3]
+    if count < n:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+    else:
+        # Sliding Welford update: swap the evicted price for the new one
+        old = buf[idx]
+        old_mean = mean
+        mean += (x - old) / n
+        m2 += (x - old) * (x - mean + old - old_mean)
+    buf[idx] = x
+    idx = (idx + 1) % n
+    if idx == 0:
+        # Recompute once per lap so rounding error cannot accumulate
+        mean = 0.0
+        for i in range(count):
+            mean += buf[i]
+        mean /= count
+        m2 = 0.0
+        for i in range(count):
+            m2 += (buf[i] - mean) ** 2
+    state[IDX] = idx
+    state[COUNT] = count
+    state[2] = mean
+    state[3] = m2
+
+
+@njit(cache=True, fastmath=True)
+def mean_reversion_signal(state, window, k, price):
+    """Return ``(action, mean, std, upper, lower)`` for a z-score band."""
+    mean = state[2]
+    std = math.sqrt(max(state[3] / window, 0.0))
+    upper = mean + k * std
+    lower = mean - k * std
+    action = HOLD
+    if price > upper:
+        action = SELL
+    elif price < lower:
+        action = BUY
+    return action, mean, std, upper, lower
+
+
+@njit(cache=True, fastmath=True)
+def sum_push(buf, state, x):
+    """Push ``x``; state is ``[idx, count, sum]`` over ``len(buf)``."""
+    n = buf.shape[0]
+    idx = int(state[IDX])
+    count = int(state[COUNT])
+    total = state[2]
+    if count < n:
+        count += 1
+    else:
+        total -= buf[idx]
+    buf[idx] = x
+    total += x
+    idx = (idx + 1) % n
+    if idx == 0:
+        # Resum once per lap so rounding error cannot accumulate
+        total = 0.0
+        for i in range(count):
+            total += buf[i]
+    state[IDX] = idx
+    state[COUNT] = count
+    state[2] = total
+
+
+@njit(cache=True, fastmath=True)
+def vwap_signal(state, threshold, price):
+    """Return ``(action, vwap, deviation)``; trades are equally weighted for now."""
+    vwap = state[2] / state[COUNT]
+    deviation = (price - vwap) / vwap
+    action = HOLD
+    if deviation <= -threshold:
+        action = BUY
+    elif deviation >= threshold:
+        action = SELL
+    return action, vwap, deviation
+
+
+@njit(cache=True, fastmath=True)
+def _tail_sum(buf, idx, count, window):
+    n = buf.shape[0]
+    total = 0.0
+    for i in range(min(window, count)):
+        total += buf[(idx - 1 - i) % n]
+    return total
+
+
+@njit(cache=True, fastmath=True)
+def dual_sum_push(buf, state, x, short, long):
+    """Push ``x``; state is ``[idx, count, short_sum, long_sum]``.
+
+    ``len(buf)`` must be ``max(short, long)``.
+    """
+    n = buf.shape[0]
+    idx = int(state[IDX])
+    count = int(state[COUNT])
+    # Drop the price leaving each window before its slot can be reused
+    if count >= short:
+        state[2] -= buf[(idx - short) % n]
+    if count >= long:
+        state[3] -= buf[(idx - long) % n]
+    buf[idx] = x
+    state[2] += x
+    state[3] += x
+    idx = (idx + 1) % n
+    if count < n:
+        count += 1
+    if idx == 0:
+        # Resum once per lap so rounding error cannot accumulate
+        state[2] = _tail_sum(buf, idx, count, short)
+        state[3] = _tail_sum(buf, idx, count, long)
+    state[IDX] = idx
+    state[COUNT] = count
+
+
+@njit(cache=True, fastmath=True)
+def crossover_signal(state, short, long):
+    """Return ``(action, short_ma, long_ma)`` for a moving average crossover."""
+    short_ma = state[2] / short
+    long_ma = state[3] / long
+    action = HOLD
+    if short_ma > long_ma:
+        action = BUY
+    elif short_ma < long_ma:
+        action = SELL
+    return action, short_ma, long_ma
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Literal, Optional
 
+from hydrobot.utils.dataclass_compat import add_slots
 from hydrobot.utils.logger_setup import get_logger
 
 # Get the application logger
@@ -15,6 +16,7 @@ SignalAction = Literal["BUY", "SELL", "HOLD", "CLOSE"]
 OrderType = Literal["MARKET", "LIMIT"]  # Matching common exchange types
 
 
+@add_slots
 @dataclass
 class Signal:
     """
@@ -109,12 +111,16 @@ class Strategy(ABC):
         self.config = strategy_config
         self.global_config = global_config
         self.symbol = None  # Will be set by the TradingManager usually
+        # Shared HOLD signal for the no-action paths of generate_signal; callers
+        # must not mutate it
+        self._no_action_signal = Signal(strategy_name=self.strategy_name)
         log.info(f"Initialized strategy: {self.strategy_name}")
         log.debug(f"Strategy '{self.strategy_name}' config: {self.config}")
 
     def set_symbol(self, symbol: str):
         """Sets the specific symbol this instance of the strategy will trade."""
         self.symbol = symbol
+        self._no_action_signal = Signal(symbol=symbol, strategy_name=self.strategy_name)
         log.info(f"Strategy '{self.strategy_name}' assigned to symbol: {symbol}")
 
     @abstractmethod
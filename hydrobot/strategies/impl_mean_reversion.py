@@ -1,9 +1,12 @@
 """Simple mean reversion strategy using rolling mean and standard deviation."""
 
-from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from logging import DEBUG
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
 
 from ..utils.logger_setup import get_logger
+from . import _kernels
 from .base_strategy import Signal, Strategy
 from .strategy_settings import MeanReversionStrategySettings
 
@@ -24,7 +27,10 @@ class MeanReversionStrategy(Strategy):
         super().__init__(strategy_config, global_config)
         self.window_size = int(strategy_config.get("window_size", 20))
         self.std_dev_threshold = float(strategy_config.get("std_dev_threshold", 1.5))
-        self.prices: Deque[float] = deque(maxlen=self.window_size)
+        # Ring buffer of the last window_size prices and the Welford state
+        # [idx, count, mean, m2] updated in place by the numba kernels
+        self._buf = np.zeros(self.window_size, dtype=np.float64)
+        self._state = np.zeros(4, dtype=np.float64)
         log.info(
             f"MeanReversion strategy initialized: window_size={self.window_size}, "
             f"std_dev_threshold={self.std_dev_threshold}"
@@ -33,43 +39,38 @@ class MeanReversionStrategy(Strategy):
     def on_market_update(self, market_data: Dict[str, Any]):
         price = market_data.get("last_trade")
         if price is not None:
-            self.prices.append(float(price))
-
-    def _calculate_stats(self) -> Optional[tuple[float, float]]:
-        if len(self.prices) < self.window_size:
-            return None
-        mean = sum(self.prices) / len(self.prices)
-        variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-        std = variance**0.5
-        return mean, std
+            _kernels.welford_push(self._buf, self._state, float(price))
 
     def generate_signal(
         self,
         market_data: Dict[str, Any],
         model_prediction: Optional[Any] = None,
     ) -> Signal:
-        signal = Signal(symbol=self.symbol, strategy_name=self.strategy_name)
-        stats = self._calculate_stats()
-        if stats is None:
-            log.debug(f"[{self.symbol}] Not enough data for mean calculation")
-            return signal
-        mean, std = stats
+        # Checked once per call: f-strings are formatted even when the record
+        # is then dropped, and this runs on every tick
+        debug = log.isEnabledFor(DEBUG)
+        window = self.window_size
+        if self._state[_kernels.COUNT] < window:
+            if debug:
+                log.debug(f"[{self.symbol}] Not enough data for mean calculation")
+            return self._no_action_signal
         price = float(market_data.get("last_trade"))
-        upper = mean + self.std_dev_threshold * std
-        lower = mean - self.std_dev_threshold * std
-        log.debug(
-            f"[{self.symbol}] price={price:.4f}, mean={mean:.4f}, std={std:.4f}, upper={upper:.4f}, lower={lower:.4f}"
+        action, mean, std, upper, lower = _kernels.mean_reversion_signal(
+            self._state, window, self.std_dev_threshold, price
         )
-        if price > upper:
-            signal.action = "SELL"
-            signal.price = market_data.get("bids", [[price]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
+        if debug:
+            log.debug(
+                f"[{self.symbol}] price={price:.4f}, mean={mean:.4f}, std={std:.4f}, upper={upper:.4f}, lower={lower:.4f}"
             )
-        elif price < lower:
-            signal.action = "BUY"
-            signal.price = market_data.get("asks", [[price]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
-            )
-        return signal
+        if action == _kernels.HOLD:
+            return self._no_action_signal
+        side, book_side = _kernels.ORDER_SIDE[action]
+        book = market_data.get(book_side)
+        order_price = book[0][0] if book else price
+        return Signal(
+            action=side,
+            symbol=self.symbol,
+            price=order_price,
+            quantity=self.global_config.trading.default_trade_amount_usd / order_price,
+            strategy_name=self.strategy_name,
+        )
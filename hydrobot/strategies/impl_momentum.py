@@ -1,9 +1,12 @@
 """Simple momentum strategy using moving average crossover."""
 
-from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from logging import DEBUG
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
 
 from ..utils.logger_setup import get_logger
+from . import _kernels
 from .base_strategy import Signal, Strategy
 from .strategy_settings import MomentumStrategySettings
 
@@ -22,9 +25,11 @@ class MomentumStrategy(Strategy):
         super().__init__(strategy_config, global_config)
         self.short_window = int(strategy_config.get("short_window", 10))
         self.long_window = int(strategy_config.get("long_window", 30))
-        self.prices: Deque[float] = deque(
-            maxlen=max(self.long_window, self.short_window)
-        )
+        # One ring buffer sized for the longer window and the state
+        # [idx, count, short_sum, long_sum] updated in place by the numba kernels
+        self._size = max(self.long_window, self.short_window)
+        self._buf = np.zeros(self._size, dtype=np.float64)
+        self._state = np.zeros(4, dtype=np.float64)
         log.info(
             f"Momentum strategy initialized: short_window={self.short_window}, long_window={self.long_window}"
         )
@@ -32,34 +37,41 @@ class MomentumStrategy(Strategy):
     def on_market_update(self, market_data: Dict[str, Any]):
         price = market_data.get("last_trade")
         if price is not None:
-            self.prices.append(float(price))
-
-    def _calculate_ma(self, window: int) -> Optional[float]:
-        if len(self.prices) < window:
-            return None
-        return sum(list(self.prices)[-window:]) / window
+            _kernels.dual_sum_push(
+                self._buf,
+                self._state,
+                float(price),
+                self.short_window,
+                self.long_window,
+            )
 
     def generate_signal(
         self, market_data: Dict[str, Any], model_prediction: Optional[Any] = None
     ) -> Signal:
-        signal = Signal(symbol=self.symbol, strategy_name=self.strategy_name)
-        short_ma = self._calculate_ma(self.short_window)
-        long_ma = self._calculate_ma(self.long_window)
-        if short_ma is None or long_ma is None:
-            log.debug(f"[{self.symbol}] Not enough data for MA calculation")
-            return signal
+        debug = log.isEnabledFor(DEBUG)
+        if self._state[_kernels.COUNT] < self._size:
+            if debug:
+                log.debug(f"[{self.symbol}] Not enough data for MA calculation")
+            return self._no_action_signal
+        action, short_ma, long_ma = _kernels.crossover_signal(
+            self._state, self.short_window, self.long_window
+        )
 
-        log.debug(f"[{self.symbol}] short_ma={short_ma:.4f}, long_ma={long_ma:.4f}")
-        if short_ma > long_ma:
-            signal.action = "BUY"
-            signal.price = market_data.get("asks", [[None]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
-            )
-        elif short_ma < long_ma:
-            signal.action = "SELL"
-            signal.price = market_data.get("bids", [[None]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
-            )
-        return signal
+        if debug:
+            log.debug(f"[{self.symbol}] short_ma={short_ma:.4f}, long_ma={long_ma:.4f}")
+        if action == _kernels.HOLD:
+            return self._no_action_signal
+        side, book_side = _kernels.ORDER_SIDE[action]
+        book = market_data.get(book_side)
+        # Empty or missing book: price from the last trade, as the other
+        # strategies do; without any price the order cannot be sized
+        order_price = book[0][0] if book else market_data.get("last_trade")
+        if not order_price:
+            return self._no_action_signal
+        return Signal(
+            action=side,
+            symbol=self.symbol,
+            price=order_price,
+            quantity=self.global_config.trading.default_trade_amount_usd / order_price,
+            strategy_name=self.strategy_name,
+        )
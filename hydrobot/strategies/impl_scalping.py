@@ -24,7 +24,7 @@ class ScalpingStrategy(Strategy):
     """
 
     def __init__(
-        self, strategy_config: ScalpingStrategySettings, global_config: AppSettings
+        self, strategy_config: ScalpingStrategySettings, global_config: "AppSettings"
     ):
         """Initializes the ScalpingStrategy."""
         super().__init__(strategy_config, global_config)
@@ -1,9 +1,12 @@
 """VWAP based trading strategy."""
 
-from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+from logging import DEBUG
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
 
 from ..utils.logger_setup import get_logger
+from . import _kernels
 from .base_strategy import Signal, Strategy
 from .strategy_settings import VWAPStrategySettings
 
@@ -24,7 +27,10 @@ class VWAPStrategy(Strategy):
         self.deviation_threshold = float(
             strategy_config.get("deviation_threshold", 0.002)
         )
-        self.prices: Deque[float] = deque(maxlen=self.window_size)
+        # Ring buffer of recent prices and the state [idx, count, sum]
+        # updated in place by the numba kernels
+        self._buf = np.zeros(self.window_size, dtype=np.float64)
+        self._state = np.zeros(3, dtype=np.float64)
         log.info(
             f"VWAP strategy initialized: window_size={self.window_size}, deviation_threshold={self.deviation_threshold}"
         )
@@ -32,40 +38,35 @@ class VWAPStrategy(Strategy):
     def on_market_update(self, market_data: Dict[str, Any]):
         price = market_data.get("last_trade")
         if price is not None:
-            self.prices.append(float(price))
-
-    def _calculate_vwap(self) -> Optional[float]:
-        if not self.prices:
-            return None
-        # For now assume each trade has equal volume
-        return sum(self.prices) / len(self.prices)
+            _kernels.sum_push(self._buf, self._state, float(price))
 
     def generate_signal(
         self, market_data: Dict[str, Any], model_prediction: Optional[Any] = None
     ) -> Signal:
-        signal = Signal(symbol=self.symbol, strategy_name=self.strategy_name)
+        debug = log.isEnabledFor(DEBUG)
         current_price = market_data.get("last_trade")
-        vwap = self._calculate_vwap()
-        if current_price is None or vwap is None:
-            log.debug(f"[{self.symbol}] VWAP or current price unavailable")
-            return signal
+        if current_price is None or not self._state[_kernels.COUNT]:
+            if debug:
+                log.debug(f"[{self.symbol}] VWAP or current price unavailable")
+            return self._no_action_signal
 
-        deviation = (current_price - vwap) / vwap
-        log.debug(
-            f"[{self.symbol}] price={current_price:.4f}, vwap={vwap:.4f}, deviation={deviation:.4f}"
+        action, vwap, deviation = _kernels.vwap_signal(
+            self._state, self.deviation_threshold, float(current_price)
         )
-
-        if deviation <= -self.deviation_threshold:
-            signal.action = "BUY"
-            signal.price = market_data.get("asks", [[current_price]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
-            )
-        elif deviation >= self.deviation_threshold:
-            signal.action = "SELL"
-            signal.price = market_data.get("bids", [[current_price]])[0][0]
-            signal.quantity = (
-                self.global_config.trading.default_trade_amount_usd / signal.price
+        if debug:
+            log.debug(
+                f"[{self.symbol}] price={current_price:.4f}, vwap={vwap:.4f}, deviation={deviation:.4f}"
             )
 
-        return signal
+        if action == _kernels.HOLD:
+            return self._no_action_signal
+        side, book_side = _kernels.ORDER_SIDE[action]
+        book = market_data.get(book_side)
+        order_price = book[0][0] if book else current_price
+        return Signal(
+            action=side,
+            symbol=self.symbol,
+            price=order_price,
+            quantity=self.global_config.trading.default_trade_amount_usd / order_price,
+            strategy_name=self.strategy_name,
+        )
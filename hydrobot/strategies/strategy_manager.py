@@ -1,5 +1,7 @@
 """Strategy discovery and lifecycle management."""
 
+from __future__ import annotations
+
 import importlib
 import inspect
 import os
@@ -7,20 +9,18 @@ import pkgutil
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from ..utils.logger_setup import get_logger
-
-# --- FIX: Use relative imports ---
-# Import the base class and specific strategies to ensure they are recognized
+from . import STRATEGY_CONFIG_KEYS, STRATEGY_REGISTRY
 from .base_strategy import Strategy
-from .impl_mean_reversion import MeanReversionStrategy
-from .impl_momentum import MomentumStrategy
-from .impl_scalping import ScalpingStrategy
-from .impl_vwap import VWAPStrategy
 
 if TYPE_CHECKING:
     from ..config.settings import AppSettings, StrategyManagerSettings
 
 log = get_logger()
 
+# Set to 1 during development to scan the package for Strategy subclasses
+# instead of using STRATEGY_REGISTRY
+DYNAMIC_STRATEGIES_ENV = "HYDROBOT_DYNAMIC_STRATEGIES"
+
 
 class StrategyManager:
     """
@@ -35,6 +35,7 @@ class StrategyManager:
             self._discover_strategies()
         )
         self.active_strategy_instances: Dict[str, Strategy] = {}
+        self._config_cache: Dict[str, Any] = {}
         log.info("StrategyManager initialized.")
         log.info(
             f"Available strategy classes found: {list(self.available_strategies.keys())}"
@@ -42,6 +43,12 @@ class StrategyManager:
         log.info(f"Regime to Strategy mapping: {self.manager_config.regime_mapping}")
 
     def _discover_strategies(self) -> Dict[str, Type[Strategy]]:
+        """Returns the available strategy classes keyed by class name."""
+        if os.environ.get(DYNAMIC_STRATEGIES_ENV) == "1":
+            return self._scan_strategy_modules()
+        return dict(STRATEGY_REGISTRY)
+
+    def _scan_strategy_modules(self) -> Dict[str, Type[Strategy]]:
         """Dynamically discovers all Strategy subclasses within the 'strategies' module."""
         strategies = {}
         # Use relative path '.' to refer to the current package (strategies)
@@ -68,19 +75,9 @@ class StrategyManager:
                     f"Failed to import or inspect module {modname}: {e}", exc_info=True
                 )
 
-        # Ensure explicitly imported strategies are included
-        if "ScalpingStrategy" not in strategies and ScalpingStrategy:
-            strategies["ScalpingStrategy"] = ScalpingStrategy
-            log.debug("Explicitly added ScalpingStrategy.")
-        if "MomentumStrategy" not in strategies and MomentumStrategy:
-            strategies["MomentumStrategy"] = MomentumStrategy
-            log.debug("Explicitly added MomentumStrategy.")
-        if "MeanReversionStrategy" not in strategies and MeanReversionStrategy:
-            strategies["MeanReversionStrategy"] = MeanReversionStrategy
-            log.debug("Explicitly added MeanReversionStrategy.")
-        if "VWAPStrategy" not in strategies and VWAPStrategy:
-            strategies["VWAPStrategy"] = VWAPStrategy
-            log.debug("Explicitly added VWAPStrategy.")
+        # Ensure registered strategies are included
+        for name, strategy_class in STRATEGY_REGISTRY.items():
+            strategies.setdefault(name, strategy_class)
 
         if not strategies:
             log.warning("No strategy classes were automatically discovered!")
@@ -113,20 +110,26 @@ class StrategyManager:
         self, strategy_class_name: str
     ) -> Optional[Dict[str, Any]]:
         """Retrieves the specific configuration section for a given strategy name."""
-        config_key = strategy_class_name[0].lower() + strategy_class_name[1:].replace(
-            "Strategy", "_strategy"
-        )
-        if hasattr(self.global_config, config_key):
-            strategy_conf = getattr(self.global_config, config_key)
+        if strategy_class_name in self._config_cache:
+            return self._config_cache[strategy_class_name]
+
+        config_key = STRATEGY_CONFIG_KEYS.get(strategy_class_name)
+        if config_key is None:
+            # Dynamically discovered strategies fall back to the naming convention
+            config_key = strategy_class_name[0].lower() + strategy_class_name[
+                1:
+            ].replace("Strategy", "_strategy")
+        strategy_conf = getattr(self.global_config, config_key, None)
+        if strategy_conf is not None:
             log.debug(
                 f"Found config for '{strategy_class_name}' under key '{config_key}'."
             )
-            return strategy_conf
         else:
             log.warning(
                 f"No specific config found for '{strategy_class_name}' (key: '{config_key}')."
             )
-            return None
+        self._config_cache[strategy_class_name] = strategy_conf
+        return strategy_conf
 
     def get_strategy_for_symbol(
         self, symbol: str, market_regime: str = "default"
@@ -32,13 +32,23 @@ class TradingManager:
         position_manager: PositionManager,
         risk_controller: RiskController,
         order_executor: OrderExecutor,
+        predictor: Optional[Any] = None,
+        prediction_logger: Optional[Any] = None,
     ):  # Removed market_data_stream for now
-        """Initializes the TradingManager."""
+        """Initializes the TradingManager.
+
+        ``predictor`` is an optional ``PredictorService``; when set, market data
+        carrying a ``features`` mapping is scored before the strategy runs.
+        ``prediction_logger`` is an optional ``PredictionLogger`` that records
+        those predictions in batches.
+        """
         self.config = config
         self.strategy_manager = strategy_manager
         self.position_manager = position_manager
         self.risk_controller = risk_controller
         self.order_executor = order_executor
+        self.predictor = predictor
+        self.prediction_logger = prediction_logger
         self.trading_symbols = config.trading.symbols
         self.is_running = False
         self._tasks: Dict[str, asyncio.Task] = {}
@@ -110,7 +120,7 @@ class TradingManager:
             log.error(f"[{symbol}] No strategy found. Skipping.")
             return
 
-        model_prediction = None  # Placeholder
+        model_prediction = await self._predict(symbol, market_data)
         try:
             signal = strategy.generate_signal(market_data, model_prediction)
             log.info(f"[{symbol}] Strategy '{strategy.get_name()}' signal: {signal}")
@@ -201,6 +211,32 @@ class TradingManager:
 
         log.debug(f"--- Finished trade cycle for {symbol} ---")
 
+    async def _predict(
+        self, symbol: str, market_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Scores the update's features with the predictor, if both are present."""
+        features = market_data.get("features")
+        if self.predictor is None or not features:
+            return None
+        try:
+            result = await self.predictor.predict(symbol, features)
+        except Exception as e:
+            log.exception(f"[{symbol}] Prediction error: {e}")
+            return None
+        if result is None:
+            return None
+        prediction, confidence = result
+        if self.prediction_logger:
+            self.prediction_logger.log(
+                self.predictor.model_name,
+                symbol,
+                prediction,
+                confidence,
+                dict(features),
+            )
+        log.debug(f"[{symbol}] Model prediction: {prediction} ({confidence:.4f})")
+        return {"prediction": prediction, "confidence": confidence}
+
     async def start(self):
         """Starts the TradingManager."""
         if self.is_running:
@@ -209,6 +245,11 @@ class TradingManager:
         log.info("Starting TradingManager...")
         self.is_running = True
         try:
+            await self.position_manager.start()
+            if self.predictor:
+                await self.predictor.start()
+            if self.prediction_logger:
+                await self.prediction_logger.start()
             # Initialize executor (connects to exchange)
             await self.order_executor.initialize_exchange()  # Use renamed public method
             if not self.order_executor.is_initialized:
@@ -275,5 +316,10 @@ class TradingManager:
 
         if self.order_executor:
             await self.order_executor.close()
+        if self.predictor:
+            await self.predictor.stop()
+        if self.prediction_logger:
+            await self.prediction_logger.stop()
+        await self.position_manager.stop()
         self._tasks.clear()
         log.info("TradingManager stopped.")
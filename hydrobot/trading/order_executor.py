@@ -1,12 +1,23 @@
 """Abstraction for placing and managing orders on an exchange."""
 
 import asyncio
+import functools
+import itertools
+import logging
 import math
+import ssl
 import time
-from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import aiohttp
 import ccxt.async_support as ccxt  # Use the async version of ccxt
+import certifi
+
+try:
+    import ccxt.pro as ccxtpro  # WebSocket-capable subclasses of the above
+except ImportError:  # pragma: no cover - optional dependency
+    ccxtpro = None
 
 # --- FIX: Use relative imports ---
 from ..config.settings import AppSettings
@@ -16,6 +27,24 @@ from .position_manager import PositionManager  # To notify about fills
 
 log = get_logger()
 
+# Terminal order ids remembered so repeated final updates are not re-applied
+CLOSED_ORDER_HISTORY = 10_000
+
+
+@functools.lru_cache(maxsize=1)
+def _iso8601_second(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _iso8601(timestamp: int) -> str:
+    """ccxt-style ISO 8601 string for epoch milliseconds.
+
+    Orders within the same second share the formatted date and time, so
+    only the millisecond suffix is built per call.
+    """
+    seconds, millis = divmod(timestamp, 1000)
+    return f"{_iso8601_second(seconds)}.{millis:03d}Z"
+
 
 class OrderExecutionError(Exception):
     """Custom exception for errors during order placement or management."""
@@ -27,7 +56,11 @@ class OrderExecutor:
     """Handles interaction with the exchange API to execute trades."""
 
     def __init__(self, config: AppSettings, position_manager: PositionManager):
-        """Initializes the OrderExecutor."""
+        """Initializes the OrderExecutor.
+
+        Use as ``async with OrderExecutor(...) as executor:`` to connect once at
+        startup and release the connection pool on exit.
+        """
         self.config = config
         self.position_manager = position_manager
         self.exchange_name = config.exchange.name
@@ -49,8 +82,45 @@ class OrderExecutor:
             if config.exchange.api_passphrase
             else None
         )
-        self.last_order_time = 0
         self.min_order_interval = 0.5  # Seconds
+        self.max_concurrent_orders = 8
+        self._order_slots = asyncio.Semaphore(self.max_concurrent_orders)
+        # Token bucket: bursts of up to max_concurrent_orders, refilled at one
+        # order per min_order_interval
+        self._tokens = float(self.max_concurrent_orders)
+        self._tokens_at = time.monotonic()
+        self.simulate_orders = config.trading.simulate_orders
+        # HTTP session shared by every request for the executor's lifetime
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Background task consuming the exchange's order stream (live mode only)
+        self._fills_task: Optional[asyncio.Task] = None
+        # Live order id -> (symbol, quantity already applied to the position
+        # manager), until the order reaches a terminal state
+        self._applied_fills: Dict[str, Tuple[str, float]] = {}
+        # Ids of orders whose final fill was applied, oldest first
+        self._closed_orders: "OrderedDict[str, None]" = OrderedDict()
+        # Refetches of terminal orders that arrived without a fill price
+        self._refetch_tasks: set = set()
+        # Suffix keeping simulated order ids unique within the same millisecond
+        self._sim_seq = itertools.count(1)
+
+    async def __aenter__(self) -> "OrderExecutor":
+        await self.initialize_exchange()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session so orders reuse warm TCP+TLS connections."""
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit=64,
+            keepalive_timeout=90,
+            force_close=False,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(connector=connector)
 
     async def initialize_exchange(
         self,
@@ -59,15 +129,22 @@ class OrderExecutor:
         if self.is_initialized:
             return
         log.info(f"Initializing exchange '{self.exchange_name}'...")
-        # ... (Rest of initialization logic remains the same) ...
-        exchange_class = getattr(ccxt, self.exchange_name, None)
+        # Prefer the ccxt.pro class: it keeps the REST API and adds order
+        # placement and fill streaming over one persistent WebSocket
+        exchange_class = getattr(ccxtpro, self.exchange_name, None) or getattr(
+            ccxt, self.exchange_name, None
+        )
         if not exchange_class:
             raise OrderExecutionError(f"Unsupported exchange: {self.exchange_name}")
 
+        self._session = self._create_session()
         exchange_config = {
             "apiKey": self.api_key,
             "secret": self.api_secret,
             "enableRateLimit": True,
+            # ccxt leaves a session it did not create open on close();
+            # close() below owns it
+            "session": self._session,
         }
         if self.api_passphrase:
             exchange_config["password"] = self.api_passphrase
@@ -89,6 +166,8 @@ class OrderExecutor:
             await self.exchange.load_markets()
             log.info(f"Exchange '{self.exchange_name}' initialized successfully.")
             self.is_initialized = True
+            if not self.simulate_orders and self.exchange.has.get("watchOrders"):
+                self._fills_task = asyncio.create_task(self._watch_fills())
         except ccxt.AuthenticationError as e:
             log.critical(f"Exchange authentication failed: {e}")
             await self.close()  # Close connection on critical failure
@@ -98,10 +177,42 @@ class OrderExecutor:
             await self.close()
             raise OrderExecutionError(f"Initialization failed: {e}") from e
 
+    async def execute_signals_batch(
+        self, signals: List[Signal], current_prices: Dict[str, float]
+    ) -> List[Union[Optional[Dict[str, Any]], BaseException]]:
+        """Executes independent signals concurrently.
+
+        Results are in signal order; a failed signal's exception is returned
+        in its place instead of cancelling the others.
+        """
+        return await asyncio.gather(
+            *(self.execute_signal(signal, current_prices) for signal in signals),
+            return_exceptions=True,
+        )
+
     async def execute_signal(
         self, signal: Signal, current_prices: Dict[str, float]
     ) -> Optional[Dict[str, Any]]:
         """Attempts to execute a trade based on the provided signal."""
+        async with self._order_slots:
+            return await self._execute_signal(signal, current_prices)
+
+    async def _throttle(self) -> None:
+        """Waits for an order token, so concurrent orders respect the rate limit."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_concurrent_orders),
+            self._tokens + (now - self._tokens_at) / self.min_order_interval,
+        )
+        self._tokens_at = now
+        # A negative balance reserves a future token for this caller
+        self._tokens -= 1.0
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens * self.min_order_interval)
+
+    async def _execute_signal(
+        self, signal: Signal, current_prices: Dict[str, float]
+    ) -> Optional[Dict[str, Any]]:
         if not self.is_initialized or not self.exchange:
             log.error("Cannot execute signal: Exchange not initialized.")
             # Try to re-initialize? Risky if called repeatedly.
@@ -114,34 +225,51 @@ class OrderExecutor:
             or signal.quantity <= 0
             or signal.symbol is None
         ):
-            log.debug(f"[{signal.symbol}] No execution for signal: {signal.action}")
+            log.debug("[%s] No execution for signal: %s", signal.symbol, signal.action)
             return None
 
-        # --- Rate Limiting & Param Validation ---
-        current_time = asyncio.get_event_loop().time()
-        # ... (rate limit check) ...
-        self.last_order_time = current_time
-
+        # --- Param Validation ---
         symbol = signal.symbol
         side = "buy" if signal.action == "BUY" else "sell"
         amount = signal.quantity
         order_type = signal.order_type.lower()
         price = signal.price if order_type == "limit" else None
 
-        if (
-            math.isnan(amount)
-            or math.isinf(amount)
-            or (price is not None and (math.isnan(price) or math.isinf(price)))
-        ):
+        if not (math.isfinite(amount) and (price is None or math.isfinite(price))):
             log.error(
                 f"[{symbol}] Invalid order parameters: Qty={amount}, Price={price}. Rejecting."
             )
             raise OrderExecutionError("Invalid numeric parameters in signal.")
 
         log.info(
-            f"[{symbol}] Placing {side} {order_type} order: Qty={amount:.8f}, Price={price}"
+            "[%s] Placing %s %s order: Qty=%.8f, Price=%s",
+            symbol,
+            side,
+            order_type,
+            amount,
+            price,
         )
 
+        await self._throttle()
+
+        if not self.simulate_orders:
+            try:
+                order_result = await self._submit_order(
+                    symbol, order_type, side, amount, price
+                )
+            except Exception as e:
+                self._raise_order_error(symbol, e)
+            log.info(
+                "[%s] Order placed: ID=%s, Status=%s",
+                symbol,
+                order_result.get("id"),
+                order_result.get("status"),
+            )
+            # The order is accepted; bookkeeping errors must not read as a
+            # failed placement. Fills already seen on the stream are skipped.
+            self._apply_fill(order_result, track=True)
+            return order_result
+
         # --- Place Order (Simulated) ---
         try:
             order_result = None
@@ -151,8 +279,9 @@ class OrderExecutor:
 
             # --- !!! SIMULATION LOGIC START !!! ---
             log.warning("!!! SIMULATING ORDER PLACEMENT (No actual trade) !!!")
-            order_id = f"sim_{int(time.time()*1000)}"
-            timestamp = int(time.time() * 1000)
+            # One clock read per order, as integer epoch milliseconds
+            timestamp = time.time_ns() // 1_000_000
+            order_id = f"sim_{timestamp}_{next(self._sim_seq)}"
             current_price = current_prices.get(symbol)
 
             if order_type == "limit":
@@ -187,7 +316,7 @@ class OrderExecutor:
             order_result = {
                 "id": order_id,
                 "timestamp": timestamp,
-                "datetime": datetime.utcnow().isoformat(),
+                "datetime": _iso8601(timestamp),
                 "symbol": symbol,
                 "type": order_type,
                 "side": side,
@@ -201,63 +330,169 @@ class OrderExecutor:
             await asyncio.sleep(0.1)  # Simulate latency
             # --- !!! SIMULATION LOGIC END !!! ---
 
-            # Replace above simulation block with actual ccxt calls:
-            # if order_type == 'limit':
-            #     order_result = await self.exchange.create_limit_order(symbol, side, amount, price)
-            # elif order_type == 'market':
-            #     order_result = await self.exchange.create_market_order(symbol, side, amount)
-            # else:
-            #     raise OrderExecutionError(f"Unsupported order type: {order_type}")
-
             log.info(
-                f"[{symbol}] Order placement attempted (Simulated): ID={order_result.get('id')}, Status={order_result.get('status')}"
+                "[%s] Order placement attempted (Simulated): ID=%s, Status=%s",
+                symbol,
+                order_id,
+                simulated_status,
             )
-            log.debug(f"Order Result: {order_result}")
-
-            # --- Process Fill (Simulated) ---
-            if (
-                order_result
-                and order_result.get("status") == "closed"
-                and order_result.get("filled", 0) > 0
-            ):
-                fill_qty = order_result.get("filled")
-                fill_price = order_result.get(
-                    "average", order_result.get("price")
-                )  # Use average if available
-                fill_timestamp = (
-                    order_result.get("timestamp", time.time() * 1000) / 1000
-                )
-                position_update_qty = fill_qty if side == "buy" else -fill_qty
-                log.info(
-                    f"[{symbol}] Simulated Fill. Updating position: Qty={position_update_qty:.8f}, Price={fill_price:.2f}"
-                )
-                self.position_manager.update_position_on_fill(
-                    symbol, position_update_qty, fill_price, fill_timestamp
-                )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Order Result: %s", order_result)
 
-            return order_result
+        except Exception as e:
+            self._raise_order_error(symbol, e)
 
-        # --- Error Handling (remains the same) ---
-        except ccxt.InsufficientFunds as e:  # ... etc
+        # --- Process Fill (Simulated) ---
+        self._apply_fill(order_result)
+
+        return order_result
+
+    async def _submit_order(
+        self,
+        symbol: str,
+        order_type: str,
+        side: str,
+        amount: float,
+        price: Optional[float],
+    ) -> Dict[str, Any]:
+        """Sends an order, over the WebSocket trade channel when supported."""
+        if order_type not in ("limit", "market"):
+            raise OrderExecutionError(f"Unsupported order type: {order_type}")
+        if self.exchange.has.get("createOrderWs"):
+            return await self.exchange.create_order_ws(
+                symbol, order_type, side, amount, price
+            )
+        return await self.exchange.create_order(symbol, order_type, side, amount, price)
+
+    def _raise_order_error(self, symbol: str, e: Exception) -> None:
+        """Logs a ccxt order failure and re-raises it as OrderExecutionError."""
+        if isinstance(e, ccxt.InsufficientFunds):
             log.error(f"[{symbol}] Order failed: Insufficient funds. {e}")
             raise OrderExecutionError(f"InsufficientFunds: {e}") from e
-        except ccxt.InvalidOrder as e:
+        if isinstance(e, ccxt.InvalidOrder):
             log.error(f"[{symbol}] Order failed: Invalid order parameters. {e}")
             raise OrderExecutionError(f"InvalidOrder: {e}") from e
-        except ccxt.NetworkError as e:
+        if isinstance(e, ccxt.NetworkError):
             log.error(f"[{symbol}] Order failed: Network error. {e}")
             raise OrderExecutionError(f"NetworkError: {e}") from e
-        except ccxt.ExchangeError as e:
+        if isinstance(e, ccxt.ExchangeError):
             log.error(f"[{symbol}] Order failed: Exchange error. {e}")
             raise OrderExecutionError(f"ExchangeError: {e}") from e
+        log.exception(f"[{symbol}] Unexpected error during order execution: {e}")
+        raise OrderExecutionError(f"Unexpected error: {e}") from e
+
+    def _apply_fill(self, order: Dict[str, Any], track: bool = False) -> None:
+        """Passes any newly filled quantity of ``order`` to the position manager.
+
+        ``filled`` is cumulative, so the same order can be reported any number
+        of times (REST result, stream updates, reconciliation) and only the
+        quantity not yet applied is passed on. ``track`` keeps an open order
+        on record, even unfilled, so it is reconciled after a stream outage.
+        """
+        order_id = order.get("id")
+        if order_id in self._closed_orders:
+            return
+        symbol = order["symbol"]
+        filled = order.get("filled") or 0.0
+        applied = self._applied_fills.get(order_id, (symbol, 0.0))[1]
+        new_qty = filled - applied
+        terminal = order.get("status") not in ("open", None)
+
+        if new_qty > 0:
+            fill_price = order.get("average") or order.get("price")
+            if fill_price is None and order.get("cost"):
+                fill_price = order["cost"] / filled
+            if fill_price is None:
+                # Streamed market-order updates can omit the price. A later
+                # update carries the same cumulative fill; a final one is
+                # fetched again so its fill is not lost.
+                log.debug("[%s] Fill for %s has no price yet.", symbol, order_id)
+                self._applied_fills[order_id] = (symbol, applied)
+                if terminal:
+                    self._schedule_refetch(order_id, symbol)
+                return
+            fill_timestamp = (order.get("timestamp") or time.time() * 1000) / 1000
+            position_update_qty = new_qty if order["side"] == "buy" else -new_qty
+            log.info(
+                "[%s] Fill. Updating position: Qty=%.8f, Price=%.2f",
+                symbol,
+                position_update_qty,
+                fill_price,
+            )
+            self.position_manager.update_position_on_fill(
+                symbol, position_update_qty, fill_price, fill_timestamp
+            )
+
+        if terminal:
+            self._applied_fills.pop(order_id, None)
+            self._closed_orders[order_id] = None
+            if len(self._closed_orders) > CLOSED_ORDER_HISTORY:
+                self._closed_orders.popitem(last=False)
+        elif track or filled or order_id in self._applied_fills:
+            self._applied_fills[order_id] = (symbol, max(filled, applied))
+
+    def _schedule_refetch(self, order_id: str, symbol: str) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._refetch_order(order_id, symbol)
+        )
+        self._refetch_tasks.add(task)
+        task.add_done_callback(self._refetch_tasks.discard)
+
+    async def _refetch_order(self, order_id: str, symbol: str) -> None:
+        """Reads an order back over REST and applies any fill not yet seen."""
+        try:
+            order = await self.exchange.fetch_order(order_id, symbol)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            log.exception(f"[{symbol}] Unexpected error during order execution: {e}")
-            raise OrderExecutionError(f"Unexpected error: {e}") from e
+            log.warning(f"[{symbol}] Could not fetch order {order_id}: {e}")
+            return
+        if order.get("average") or order.get("price") or order.get("cost"):
+            self._apply_fill(order)
+
+    async def _reconcile_orders(self) -> None:
+        """Applies fills of tracked orders that the stream may have missed."""
+        for order_id, (symbol, _) in list(self._applied_fills.items()):
+            await self._refetch_order(order_id, symbol)
+
+    async def _watch_fills(self):
+        """Applies fills pushed over the exchange's order stream."""
+        resubscribed = False
+        while True:
+            watch = asyncio.ensure_future(self.exchange.watch_orders())
+            try:
+                if resubscribed:
+                    # Updates sent while the stream was down are not replayed.
+                    # Subscribe first, then read tracked orders back over REST.
+                    await asyncio.sleep(0)
+                    await self._reconcile_orders()
+                    resubscribed = False
+                orders = await watch
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error(f"Order stream error: {e}. Resubscribing.")
+                await asyncio.sleep(1)
+                resubscribed = True
+                continue
+            finally:
+                watch.cancel()
+            for order in orders:
+                self._apply_fill(order)
 
     # ... (cancel_order, fetch_order_status remain largely the same, ensure they check self.is_initialized) ...
 
     async def close(self):
         """Closes the exchange connection."""
+        if self._fills_task is not None:
+            self._fills_task.cancel()
+            try:
+                await self._fills_task
+            except asyncio.CancelledError:
+                pass
+            self._fills_task = None
+        for task in list(self._refetch_tasks):
+            task.cancel()
         if self.exchange:
             log.info(f"Closing exchange '{self.exchange_name}' connection...")
             try:
@@ -268,6 +503,9 @@ class OrderExecutor:
                 self.exchange = None
                 self.is_initialized = False
                 log.info("Exchange connection closed.")
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # Placeholder methods for cancel/fetch
     async def cancel_order(
@@ -1,11 +1,14 @@
 """Portfolio management for tracking positions and capital."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from ..config.settings import settings
 from ..utils.logger_setup import get_logger
 from . import trading_utils
+from .position_manager import Position
 
 log = get_logger(__name__)
 
@@ -21,7 +24,16 @@ class PortfolioManager:
         """
         self.initial_capital = initial_capital
         self.available_capital = initial_capital
-        self.positions: Dict[str, Dict[str, Any]] = {}
+        # Positions as parallel arrays, one row per symbol, so valuation is
+        # a single vectorized pass instead of a loop over records
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._qty = np.zeros(0)
+        self._entry = np.zeros(0)
+        self._price = np.zeros(0)
+        self._unrealized = np.zeros(0)
+        # Last update as integer epoch nanoseconds
+        self._updated_ns = np.zeros(0, dtype=np.int64)
         self.current_drawdown = 0.0
         self.max_drawdown = 0.0
         self.halt_trading_flag = False
@@ -37,15 +49,15 @@ class PortfolioManager:
         """
         return self.available_capital
 
-    def get_all_positions(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_positions(self) -> Dict[str, Position]:
         """Get all open positions.
 
         Returns:
             Dictionary of position details by symbol
         """
-        return self.positions.copy()
+        return {symbol: self._position(i) for symbol, i in self._index.items()}
 
-    def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def get_position(self, symbol: str) -> Optional[Position]:
         """Get position details for symbol.
 
         Args:
@@ -54,7 +66,19 @@ class PortfolioManager:
         Returns:
             Position details or None if no position
         """
-        return self.positions.get(symbol)
+        i = self._index.get(symbol)
+        return None if i is None else self._position(i)
+
+    def _position(self, i: int) -> Position:
+        """Snapshot of row ``i`` as a Position record."""
+        return Position(
+            symbol=self._symbols[i],
+            entry_price=float(self._entry[i]),
+            current_price=float(self._price[i]),
+            quantity=float(self._qty[i]),
+            last_update_time=int(self._updated_ns[i]) / 1e9,
+            unrealized_pnl=float(self._unrealized[i]),
+        )
 
     def initialize_symbol(self, symbol: str) -> None:
         """Initialize tracking for new symbol.
@@ -62,14 +86,14 @@ class PortfolioManager:
         Args:
             symbol: Trading pair symbol
         """
-        if symbol not in self.positions:
-            self.positions[symbol] = {
-                "quantity": 0.0,
-                "entry_price": 0.0,
-                "current_price": 0.0,
-                "unrealized_pnl": 0.0,
-                "last_update": datetime.utcnow(),
-            }
+        if symbol not in self._index:
+            self._index[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+            self._qty = np.append(self._qty, 0.0)
+            self._entry = np.append(self._entry, 0.0)
+            self._price = np.append(self._price, 0.0)
+            self._unrealized = np.append(self._unrealized, 0.0)
+            self._updated_ns = np.append(self._updated_ns, time.time_ns())
 
     def update_position(
         self,
@@ -84,25 +108,26 @@ class PortfolioManager:
             symbol: Trading pair symbol
             quantity_change: Change in position size
             price: Execution price
-            timestamp: Optional trade timestamp
+            timestamp: Optional trade timestamp in epoch milliseconds
         """
-        if symbol not in self.positions:
+        if symbol not in self._index:
             self.initialize_symbol(symbol)
 
-        position = self.positions[symbol]
-        old_quantity = position["quantity"]
+        i = self._index[symbol]
+        old_quantity = float(self._qty[i])
+        entry_price = float(self._entry[i])
         new_quantity = old_quantity + quantity_change
 
         # Handle position entry
         if old_quantity == 0 and new_quantity > 0:
-            position["entry_price"] = price
+            self._entry[i] = price
             self.available_capital -= price * new_quantity
 
         # Handle position exit
         elif new_quantity == 0:
-            realized_pnl = (price - position["entry_price"]) * old_quantity
+            realized_pnl = (price - entry_price) * old_quantity
             self.available_capital += price * abs(quantity_change)
-            position["unrealized_pnl"] = 0
+            self._unrealized[i] = 0.0
             self.realized_pnl += realized_pnl
             self.total_trades += 1
             if realized_pnl > 0:
@@ -112,26 +137,23 @@ class PortfolioManager:
         else:
             # Calculate weighted average entry for adds
             if quantity_change > 0:
-                total_value = (
-                    old_quantity * position["entry_price"] + quantity_change * price
-                )
-                position["entry_price"] = total_value / new_quantity
+                total_value = old_quantity * entry_price + quantity_change * price
+                self._entry[i] = total_value / new_quantity
                 self.available_capital -= price * quantity_change
             # Handle partial exits
             else:
-                realized_pnl = (price - position["entry_price"]) * abs(quantity_change)
+                realized_pnl = (price - entry_price) * abs(quantity_change)
                 self.available_capital += price * abs(quantity_change)
                 self.realized_pnl += realized_pnl
                 self.total_trades += 1
                 if realized_pnl > 0:
                     self.winning_trades += 1
 
-        position["quantity"] = new_quantity
-        position["current_price"] = price
-        if timestamp:
-            position["last_update"] = datetime.fromtimestamp(timestamp / 1000)
-        else:
-            position["last_update"] = datetime.utcnow()
+        self._qty[i] = new_quantity
+        self._price[i] = price
+        self._updated_ns[i] = (
+            int(timestamp * 1_000_000) if timestamp else time.time_ns()
+        )
 
     def get_trade_quantity(
         self, symbol: str, current_price: float, capital_percentage: float
@@ -174,33 +196,24 @@ class PortfolioManager:
         """Calculate total portfolio value.
 
         Args:
-            current_prices: Optional dictionary of current prices
+            current_prices: Optional dictionary of current prices. Symbols
+                missing from it are valued at their last known price.
 
         Returns:
             Total portfolio value in USD
         """
-        total_value = self.available_capital
-
-        for symbol, position in self.positions.items():
-            if position["quantity"] == 0:
-                continue
-
-            price = (
-                current_prices.get(symbol)
-                if current_prices
-                else position["current_price"]
+        prices = self._price
+        if current_prices:
+            override = np.fromiter(
+                (current_prices.get(symbol, np.nan) for symbol in self._symbols),
+                dtype=np.float64,
+                count=len(self._symbols),
             )
+            prices = np.where(np.isnan(override), prices, override)
+            self._price = prices
 
-            if price:
-                position_value = position["quantity"] * price
-                unrealized_pnl = position["quantity"] * (
-                    price - position["entry_price"]
-                )
-                position["current_price"] = price
-                position["unrealized_pnl"] = unrealized_pnl
-                total_value += position_value
-
-        return total_value
+        self._unrealized = self._qty * (prices - self._entry)
+        return self.available_capital + float(self._qty @ prices)
 
     def check_drawdown_and_halt(self) -> bool:
         """Check if drawdown exceeds limit and halt trading.
@@ -247,7 +260,5 @@ class PortfolioManager:
             "total_trades": self.total_trades,
             "winning_trades": self.winning_trades,
             "win_rate": win_rate,
-            "open_positions": len(
-                [p for p in self.positions.values() if p["quantity"] > 0]
-            ),
+            "open_positions": int(np.count_nonzero(self._qty > 0)),
         }
@@ -1,18 +1,27 @@
 """Tracks open positions and portfolio state."""
 
+import asyncio
 import json
-import math  # For isnan
+import math  # For isfinite
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 try:
     import redis  # type: ignore
+    import redis.asyncio as aioredis  # type: ignore
 except ImportError:  # pragma: no cover
     redis = None
+    aioredis = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # --- FIX: Use relative imports ---
+from ..utils.dataclass_compat import add_slots
 from ..utils.logger_setup import get_logger
 
 if TYPE_CHECKING:
@@ -21,6 +30,7 @@ if TYPE_CHECKING:
 log = get_logger()
 
 
+@add_slots
 @dataclass
 class Position:
     """Represents the bot's position in a single trading symbol."""
@@ -32,25 +42,24 @@ class Position:
     quantity: float = 0.0  # Keep for backward compatibility
     average_entry_price: float = 0.0  # Keep for backward compatibility
     last_update_time: float = 0.0
+    unrealized_pnl: float = 0.0
 
     def update_position(
         self, fill_quantity: float, fill_price: float, timestamp: float
     ):
         """Updates the position based on a trade fill."""
         # Add validation for NaN/Inf values
-        if (
-            math.isnan(fill_quantity)
-            or math.isnan(fill_price)
-            or math.isinf(fill_quantity)
-            or math.isinf(fill_price)
-        ):
+        if not (math.isfinite(fill_quantity) and math.isfinite(fill_price)):
             log.error(
                 f"[{self.symbol}] Invalid fill data: Qty={fill_quantity}, Price={fill_price}. Ignoring update."
             )
             return
 
-        log.info(
-            f"[{self.symbol}] Updating position: Qty={fill_quantity:.8f} @ Price={fill_price:.2f}"
+        log.debug(
+            "[%s] Updating position: Qty=%.8f @ Price=%.2f",
+            self.symbol,
+            fill_quantity,
+            fill_price,
         )
 
         # If closing out the position exactly
@@ -70,8 +79,11 @@ class Position:
                 (old_value + new_value) / new_quantity if new_quantity != 0 else 0.0
             )
             self.quantity = new_quantity
-            log.info(
-                f"[{self.symbol}] Position updated: New Qty={self.quantity:.8f}, Avg Price={self.average_entry_price:.2f}"
+            log.debug(
+                "[%s] Position updated: New Qty=%.8f, Avg Price=%.2f",
+                self.symbol,
+                self.quantity,
+                self.average_entry_price,
             )
         # If reducing or flipping position
         else:
@@ -89,8 +101,11 @@ class Position:
                 log.info(f"[{self.symbol}] Position reduced.")
                 # Keep old average_entry_price
             self.quantity = new_quantity
-            log.info(
-                f"[{self.symbol}] Position updated: New Qty={self.quantity:.8f}, Avg Price={self.average_entry_price:.2f}"
+            log.debug(
+                "[%s] Position updated: New Qty=%.8f, Avg Price=%.2f",
+                self.symbol,
+                self.quantity,
+                self.average_entry_price,
             )
 
         self.last_update_time = timestamp
@@ -102,8 +117,7 @@ class Position:
         if (
             self.quantity == 0
             or self.average_entry_price == 0
-            or math.isnan(current_price)
-            or math.isinf(current_price)
+            or not math.isfinite(current_price)
         ):
             return None
         pnl_absolute = (current_price - self.average_entry_price) * self.quantity
@@ -124,29 +138,40 @@ class PositionManager:
         self.positions: Dict[str, Position] = {}
         self.redis_client: Optional[redis.Redis] = None
         self.redis_key_prefix = f"{config.app_name or 'hydrobot'}:position:"  # Use default if app_name missing
+        # Write-behind persistence, active between start() and stop(): fills
+        # only mark their position dirty and a background task writes the
+        # latest state of every dirty position in one MSET per flush_interval
+        self.flush_interval = 0.1  # Seconds
+        self._dirty: Dict[str, Position] = {}
+        self._async_redis: Optional["aioredis.Redis"] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self._connect_redis()
         if self.redis_client:
             self._load_positions_from_redis()
         log.info("PositionManager initialized.")
         # ... (rest of PositionManager methods remain the same) ...
 
+    def _redis_kwargs(self) -> Dict[str, Any]:
+        """Connection parameters shared by the sync and asyncio clients."""
+        return {
+            "host": self.config.redis.host,
+            "port": self.config.redis.port,
+            "db": self.config.redis.db,
+            "password": (
+                self.config.redis.password.get_secret_value()
+                if self.config.redis.password
+                else None
+            ),
+            "decode_responses": True,
+            "socket_timeout": 5,
+            "socket_connect_timeout": 5,
+        }
+
     def _connect_redis(self):
         """Establishes connection to the Redis server."""
         if self.config.redis and redis is not None:
             try:
-                self.redis_client = redis.Redis(
-                    host=self.config.redis.host,
-                    port=self.config.redis.port,
-                    db=self.config.redis.db,
-                    password=(
-                        self.config.redis.password.get_secret_value()
-                        if self.config.redis.password
-                        else None
-                    ),
-                    decode_responses=True,
-                    socket_timeout=5,
-                    socket_connect_timeout=5,
-                )
+                self.redis_client = redis.Redis(**self._redis_kwargs())
                 self.redis_client.ping()
                 log.info(
                     f"Successfully connected to Redis: {self.config.redis.host}:{self.config.redis.port}"
@@ -162,26 +187,78 @@ class PositionManager:
             if redis is None:
                 log.warning("Redis package not installed. Persistence disabled.")
 
+    def _serialize_position(self, position: Position) -> Union[bytes, str]:
+        """Serializes a position to JSON for Redis, storing NaN/Inf as null."""
+        if orjson is not None:
+            # Dataclasses serialize natively and non-finite floats become null
+            return orjson.dumps(position)
+        return json.dumps(
+            {
+                k: None if isinstance(v, float) and not math.isfinite(v) else v
+                for k, v in asdict(position).items()
+            }
+        )
+
     def _save_position_to_redis(self, position: Position):
         """Saves a single position object to Redis."""
+        if self._writer_task is not None:
+            # Coalesced: only the latest state per symbol is written
+            self._dirty[position.symbol] = position
+            return
         if not self.redis_client:
             return
         try:
             key = f"{self.redis_key_prefix}{position.symbol}"
-            # Ensure data is serializable (handle NaN/Inf if necessary)
-            pos_dict = position.__dict__
-            for k, v in pos_dict.items():
-                if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-                    log.warning(
-                        f"[{position.symbol}] Cannot save NaN/Inf value for '{k}' to Redis. Storing as None."
-                    )
-                    pos_dict[k] = None  # Store as None or string representation
-            value = json.dumps(pos_dict)
-            self.redis_client.set(key, value)
-            log.debug(f"Saved position {position.symbol} to Redis.")
+            self.redis_client.set(key, self._serialize_position(position))
+            log.debug("Saved position %s to Redis.", position.symbol)
         except Exception as e:
             log.exception(f"Failed to save position {position.symbol} to Redis: {e}")
 
+    async def start(self) -> None:
+        """Moves Redis writes off the fill path into a background task."""
+        if self._writer_task is not None or not self.redis_client or aioredis is None:
+            return
+        self._async_redis = aioredis.Redis(**self._redis_kwargs())
+        self._writer_task = asyncio.create_task(self._run_writer())
+
+    async def stop(self) -> None:
+        """Stops the writer task and writes any positions still pending."""
+        if self._writer_task is None:
+            return
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+        await self._flush_positions()
+        await self._async_redis.aclose()
+        self._async_redis = None
+
+    async def _run_writer(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_positions()
+
+    async def _flush_positions(self) -> None:
+        """Writes every dirty position in one round trip."""
+        if not self._dirty:
+            return
+        batch, self._dirty = self._dirty, {}
+        try:
+            await self._async_redis.mset(
+                {
+                    f"{self.redis_key_prefix}{symbol}": self._serialize_position(pos)
+                    for symbol, pos in batch.items()
+                }
+            )
+            log.debug("Saved %d position(s) to Redis.", len(batch))
+        except Exception as e:
+            log.exception(f"Failed to save positions to Redis: {e}")
+            # Retry next flush unless a newer state is already pending
+            for symbol, pos in batch.items():
+                self._dirty.setdefault(symbol, pos)
+
     def _load_positions_from_redis(self):
         """Loads all positions managed by this instance from Redis on startup."""
         if not self.redis_client:
@@ -192,14 +269,17 @@ class PositionManager:
             cursor = "0"
             while cursor != 0:
                 cursor, keys = self.redis_client.scan(
-                    cursor=cursor, match=f"{self.redis_key_prefix}*", count=100
+                    cursor=cursor, match=f"{self.redis_key_prefix}*", count=500
                 )
-                for key in keys:
+                if not keys:
+                    continue
+                # One round trip for every key in this scan batch
+                values = self.redis_client.mget(keys)
+                for key, value in zip(keys, values):
                     try:
                         symbol = key.replace(self.redis_key_prefix, "")
-                        value = self.redis_client.get(key)
                         if value:
-                            pos_data = json.loads(value)
+                            pos_data = (orjson or json).loads(value)
                             # Handle potential None values loaded back if NaN was saved
                             for k, v in pos_data.items():
                                 if (
@@ -291,11 +371,7 @@ class PositionManager:
         for symbol, position in self.positions.items():
             if position.quantity != 0:
                 current_price = current_prices.get(symbol)
-                if (
-                    current_price is not None
-                    and not math.isnan(current_price)
-                    and not math.isinf(current_price)
-                ):
+                if current_price is not None and math.isfinite(current_price):
                     total_value += position.quantity * current_price
                 else:
                     log.warning(
@@ -304,6 +380,6 @@ class PositionManager:
 
         # Placeholder for adding free quote currency balance
         log.debug(
-            f"Calculated portfolio asset value: {total_value:.2f} {quote_currency}"
+            "Calculated portfolio asset value: %.2f %s", total_value, quote_currency
         )
         return total_value
@@ -1,6 +1,6 @@
 """Risk management helpers for validating trade signals."""
 
-import math  # For isnan/isinf
+import math  # For isfinite
 from typing import Dict, Optional, Tuple
 
 # --- FIX: Use relative imports ---
@@ -29,7 +29,7 @@ class RiskController:
 
     def update_portfolio_value(self, current_value: float):
         """Updates portfolio value and checks drawdown."""
-        if math.isnan(current_value) or math.isinf(current_value):
+        if not math.isfinite(current_value):
             log.error(
                 f"Invalid current portfolio value received: {current_value}. Skipping drawdown check."
             )
@@ -69,7 +69,7 @@ class RiskController:
             return signal
 
         # Check for invalid inputs
-        if math.isnan(current_portfolio_value) or math.isinf(current_portfolio_value):
+        if not math.isfinite(current_portfolio_value):
             log.error(
                 f"[{signal.symbol}] Cannot validate trade: Invalid portfolio value {current_portfolio_value}."
             )
@@ -110,13 +110,10 @@ class RiskController:
             and signal.quantity is not None
         ):
             # Validate inputs
-            if (
-                math.isnan(signal.stop_loss_price)
-                or math.isnan(signal.price)
-                or math.isnan(signal.quantity)
-                or math.isinf(signal.stop_loss_price)
-                or math.isinf(signal.price)
-                or math.isinf(signal.quantity)
+            if not (
+                math.isfinite(signal.stop_loss_price)
+                and math.isfinite(signal.price)
+                and math.isfinite(signal.quantity)
             ):
                 log.error(
                     f"[{signal.symbol}] Cannot calculate risk: Invalid signal parameters (SL, price, or qty)."
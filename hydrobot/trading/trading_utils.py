@@ -56,7 +56,7 @@ def format_quantity(symbol: str, quantity: float) -> Optional[float]:
     """Formats the order quantity according to exchange precision rules (rounds DOWN)."""
     market = get_market_info(symbol)
     # Ensure quantity is valid number first
-    if math.isnan(quantity) or math.isinf(quantity):
+    if not math.isfinite(quantity):
         log.error(f"[{symbol}] Invalid quantity for formatting: {quantity}")
         return None
 
@@ -101,7 +101,7 @@ def format_price(symbol: str, price: float) -> Optional[float]:
     """Formats the order price according to exchange precision rules."""
     market = get_market_info(symbol)
     # Ensure price is valid number
-    if math.isnan(price) or math.isinf(price):
+    if not math.isfinite(price):
         log.error(f"[{symbol}] Invalid price for formatting: {price}")
         return None
 
@@ -151,11 +151,7 @@ def check_min_order_size(
         log.warning(f"[{symbol}] Limits info not found. Assuming OK.")
         return True
     # Ensure inputs are valid
-    if (
-        math.isnan(quantity)
-        or math.isinf(quantity)
-        or (price is not None and (math.isnan(price) or math.isinf(price)))
-    ):
+    if not (math.isfinite(quantity) and (price is None or math.isfinite(price))):
         log.error(
             f"[{symbol}] Invalid inputs for min size check: Qty={quantity}, Price={price}"
         )
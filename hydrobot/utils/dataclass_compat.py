@@ -0,0 +1,30 @@
+"""``dataclass(slots=True)`` for the Python 3.9 baseline.
+
+``slots=True`` only exists from Python 3.10, and a hand-written ``__slots__``
+clashes with field defaults stored on the class. ``add_slots`` rebuilds an
+already processed dataclass with one slot per field, the way 3.10 does.
+"""
+
+import dataclasses
+from typing import Type, TypeVar
+
+T = TypeVar("T")
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Return a copy of dataclass ``cls`` whose instances use ``__slots__``.
+
+    Apply above ``@dataclass``. Methods of ``cls`` must not use zero-argument
+    ``super()``, which would still refer to the original class.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__, not on the class
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
@@ -0,0 +1,23 @@
+"""Optional numba support for the compiled kernels.
+
+numba is an optional speedup. Without it, ``njit`` leaves functions as plain
+Python, so kernel modules import and produce the same results, only slower.
+"""
+
+from typing import Any
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """Fallback for ``numba.njit`` that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+else:
+    NUMBA_AVAILABLE = True
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -1,13 +1,18 @@
 """Redis utilities for real-time updates and message passing."""
 
 import json
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 try:
     import aioredis  # type: ignore
 except ImportError:  # pragma: no cover - optional
     aioredis = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional
+    orjson = None
+
 from hydrobot.utils.logger_setup import get_logger
 
 log = get_logger(__name__)
@@ -24,6 +29,20 @@ if TYPE_CHECKING:
     from hydrobot.config.settings import RedisSettings
 
 
+def encode_message(data: Dict[str, Any]) -> Union[str, bytes]:
+    """Serialize a pub/sub message, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data)
+
+
+def decode_message(payload: Union[str, bytes]) -> Dict[str, Any]:
+    """Deserialize a pub/sub message, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 class RedisPublisher:
     """Handles publishing updates to Redis channels."""
 
@@ -73,7 +92,7 @@ class RedisPublisher:
                 if not await self.connect():
                     return False
 
-            message = json.dumps(data)
+            message = encode_message(data)
             await self.redis.publish(channel, message)
             return True
 
@@ -75,6 +75,16 @@ class TradingBotApp:
             config=self.config, position_manager=self.position_manager
         )
 
+        # Predictor Service and its logger (only when model inference is configured)
+        predictor = None
+        prediction_logger = None
+        if self.config.model_inference:
+            from hydrobot.database.db_utils import PredictionLogger
+            from hydrobot.models.predictor import PredictorService
+
+            predictor = PredictorService()
+            prediction_logger = PredictionLogger()
+
         # Trading Manager (needs all other components)
         self.trading_manager = TradingManager(
             config=self.config,
@@ -82,6 +92,8 @@ class TradingBotApp:
             position_manager=self.position_manager,
             risk_controller=self.risk_controller,
             order_executor=self.order_executor,
+            predictor=predictor,
+            prediction_logger=prediction_logger,
             # market_data_stream=self.market_data_stream
         )
         log.info("All components instantiated.")
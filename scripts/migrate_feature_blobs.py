@@ -0,0 +1,80 @@
+"""Move prediction features into the feature_blobs table.
+
+Databases created before feature deduplication store each prediction's
+features inline in ``model_predictions.features``. The current schema keeps
+them once per distinct set in ``feature_blobs`` and references them through
+``model_predictions.features_id``. ``Base.metadata.create_all`` does not alter
+existing tables, so run this once against such a database:
+
+    python -m scripts.migrate_feature_blobs
+
+It creates ``feature_blobs``, adds ``features_id``, fills it from the old
+column and then drops ``features``. Running it again is a no-op.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from hydrobot.database import db_utils
+from hydrobot.database.models import FeatureBlob, ModelPrediction
+
+BATCH_SIZE = 1000
+
+
+def migrate(engine: Engine) -> int:
+    """Migrate ``engine``'s database; returns the number of rows moved."""
+    columns = {
+        c["name"] for c in inspect(engine).get_columns(ModelPrediction.__tablename__)
+    }
+    if "features" not in columns:
+        return 0
+
+    moved = 0
+    with Session(engine) as session, session.begin():
+        FeatureBlob.__table__.create(session.connection(), checkfirst=True)
+        if "features_id" not in columns:
+            session.execute(
+                text(
+                    "ALTER TABLE model_predictions ADD COLUMN features_id INTEGER "
+                    "REFERENCES feature_blobs (id)"
+                )
+            )
+
+        rows = session.execute(
+            text(
+                "SELECT id, features FROM model_predictions "
+                "WHERE features IS NOT NULL AND features_id IS NULL"
+            )
+        ).all()
+        update = text(
+            "UPDATE model_predictions SET features_id = :features_id WHERE id = :id"
+        )
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = []
+            for row_id, features in rows[start : start + BATCH_SIZE]:
+                # Pre-JSON-column databases hold the features as a JSON string
+                if isinstance(features, str):
+                    features = json.loads(features)
+                if isinstance(features, dict):
+                    batch.append((row_id, features))
+            if not batch:
+                continue
+            feature_ids = db_utils._feature_ids(session, [f for _, f in batch])
+            params: List[Dict[str, Any]] = [
+                {"id": row_id, "features_id": features_id}
+                for (row_id, _), features_id in zip(batch, feature_ids)
+            ]
+            session.execute(update, params)
+            moved += len(params)
+
+        session.execute(text("ALTER TABLE model_predictions DROP COLUMN features"))
+    return moved
+
+
+if __name__ == "__main__":
+    count = migrate(db_utils.get_engine())
+    print(f"Moved features of {count} prediction(s) into feature_blobs.")
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+import pytest
+
+import backtest
+
+pytest.importorskip("pyarrow")
+
+
+def write_prices(path, price):
+    pd.DataFrame(
+        {"timestamp": ["2024-01-01 00:00", "2024-01-01 00:01"], "close": [price] * 2}
+    ).to_csv(path, index=False)
+
+
+def test_price_cache_is_kept_per_symbol(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(backtest, "CACHE_DIR", str(cache_dir))
+    btc = tmp_path / "binance_BTCUSDT.csv"
+    eth = tmp_path / "binance_ETHUSDT.csv"
+    write_prices(btc, 100.0)
+    write_prices(eth, 10.0)
+    # Same mtime and size must not make the two symbols share a cache entry
+    os.utime(eth, ns=(os.stat(btc).st_atime_ns, os.stat(btc).st_mtime_ns))
+
+    assert backtest.load_price_data(str(btc))["close"].iloc[0] == 100.0
+    assert backtest.load_price_data(str(eth))["close"].iloc[0] == 10.0
+    assert backtest.load_price_data(str(btc))["close"].iloc[0] == 100.0
+    assert len(os.listdir(cache_dir)) == 2
+
+    write_prices(btc, 200.0)
+    os.utime(btc, ns=(0, os.stat(btc).st_mtime_ns + 1))
+    assert backtest.load_price_data(str(btc))["close"].iloc[0] == 200.0
+    cached = sorted(os.listdir(cache_dir))
+    assert len(cached) == 2
+    assert cached[1].startswith("binance_ETHUSDT_")
@@ -159,6 +159,28 @@ def test_momentum_strategy_signal_generation():
     assert signal.action in ["BUY", "SELL", "HOLD"]
 
 
+def test_momentum_strategy_prices_empty_book_from_last_trade():
+    """An empty order book falls back to the last trade price."""
+    global_config = AppSettings(
+        exchange=ExchangeAPISettings(name="binanceus"),
+        trading=TradingSettings(symbols=["BTC/USDT"], default_trade_amount_usd=10.0),
+    )
+    strategy = MomentumStrategy(
+        MomentumStrategySettings(short_window=2, long_window=3), global_config
+    )
+    strategy.set_symbol("BTC/USDT")
+    for price in (100.0, 101.0, 102.0, 103.0):
+        strategy.on_market_update({"last_trade": price})
+
+    signal = strategy.generate_signal({"last_trade": 103.0, "asks": [], "bids": []})
+    assert signal.action == "BUY"
+    assert signal.price == 103.0
+    assert abs(signal.quantity - 10.0 / 103.0) < 1e-12
+
+    # Without any price the order cannot be sized
+    assert strategy.generate_signal({"asks": []}).action == "HOLD"
+
+
 def test_mean_reversion_strategy_signal_generation():
     """Ensure MeanReversionStrategy reacts to price extremes."""
     global_config = AppSettings(
@@ -0,0 +1,40 @@
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+from hydrobot.database.models import FeatureBlob, ModelPrediction
+from scripts.migrate_feature_blobs import migrate
+
+
+def test_inline_features_move_to_shared_blobs(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE model_predictions (id INTEGER PRIMARY KEY, "
+                "model_name VARCHAR NOT NULL, symbol VARCHAR NOT NULL, "
+                "timestamp DATETIME NOT NULL, prediction INTEGER NOT NULL, "
+                "confidence FLOAT NOT NULL, features VARCHAR, "
+                "was_profitable BOOLEAN, actual_pnl FLOAT)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO model_predictions (model_name, symbol, timestamp, "
+                "prediction, confidence, features) VALUES "
+                "('rf', 'BTC/USDT', '2024-01-01', 1, 0.9, :f)"
+            ),
+            [{"f": '{"a": 1, "b": 2}'}, {"f": '{"b": 2, "a": 1}'}, {"f": None}],
+        )
+
+    assert migrate(engine) == 2
+    assert migrate(engine) == 0
+
+    columns = {c["name"] for c in inspect(engine).get_columns("model_predictions")}
+    assert "features" not in columns
+    with Session(engine) as session:
+        blobs = session.execute(select(FeatureBlob.id, FeatureBlob.payload)).all()
+        assert [payload for _, payload in blobs] == [{"a": 1, "b": 2}]
+        ids = session.execute(
+            select(ModelPrediction.features_id).order_by(ModelPrediction.id)
+        ).scalars()
+        assert list(ids) == [blobs[0].id, blobs[0].id, None]
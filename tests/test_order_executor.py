@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import pytest
+
+from hydrobot.config.settings import settings
+from hydrobot.strategies.base_strategy import Signal
+from hydrobot.trading.order_executor import OrderExecutor
+
+
+class RecordingPositions:
+    def __init__(self):
+        self.fills = []
+
+    def update_position_on_fill(self, symbol, quantity, price, timestamp):
+        self.fills.append((symbol, quantity, price))
+
+
+class FakeExchange:
+    def __init__(self, created=None, fetched=None, stream=()):
+        self.has = {"createOrderWs": False, "watchOrders": True}
+        self.created = created
+        self.fetched = fetched or {}
+        self.stream = list(stream)
+
+    async def create_order(self, *args):
+        return self.created
+
+    async def fetch_order(self, order_id, symbol=None):
+        return self.fetched[order_id]
+
+    async def watch_orders(self):
+        if not self.stream:
+            await asyncio.Event().wait()
+        item = self.stream.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+SIGNAL = Signal(action="BUY", symbol="BTC/USDT", price=100.0, quantity=1.0)
+
+
+def order(status, filled, average=100.0, order_id="1"):
+    return {
+        "id": order_id,
+        "symbol": "BTC/USDT",
+        "side": "buy",
+        "status": status,
+        "filled": filled,
+        "average": average,
+        "timestamp": 1000,
+    }
+
+
+def make_executor(exchange):
+    positions = RecordingPositions()
+    executor = OrderExecutor(settings, positions)
+    executor.simulate_orders = False
+    executor.is_initialized = True
+    executor.exchange = exchange
+    return executor, positions
+
+
+def test_repeated_terminal_update_is_applied_once():
+    executor, positions = make_executor(FakeExchange())
+    executor._apply_fill(order("open", 0.4))
+    executor._apply_fill(order("closed", 1.0))
+    executor._apply_fill(order("closed", 1.0))
+    assert positions.fills == [("BTC/USDT", 0.4, 100.0), ("BTC/USDT", 0.6, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_stream_and_rest_results_are_not_double_counted():
+    exchange = FakeExchange(created=order("closed", 1.0))
+    executor, positions = make_executor(exchange)
+    executor._apply_fill(order("closed", 1.0))
+    await executor.execute_signal(SIGNAL, {})
+    assert positions.fills == [("BTC/USDT", 1.0, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_fill_without_price_is_deferred_until_refetched():
+    exchange = FakeExchange(fetched={"1": order("closed", 1.0)})
+    executor, positions = make_executor(exchange)
+    executor._apply_fill(order("closed", 1.0, average=None))
+    assert positions.fills == []
+    await asyncio.gather(*executor._refetch_tasks)
+    assert positions.fills == [("BTC/USDT", 1.0, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_missed_fills_are_reconciled_after_resubscribing(monkeypatch):
+    exchange = FakeExchange(
+        created=order("open", 0.0),
+        fetched={"1": order("closed", 1.0)},
+        stream=[RuntimeError("disconnected")],
+    )
+    executor, positions = make_executor(exchange)
+    await executor.execute_signal(SIGNAL, {})
+    assert positions.fills == []
+
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: sleep(0))
+    task = asyncio.create_task(executor._watch_fills())
+    for _ in range(10):
+        await sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert positions.fills == [("BTC/USDT", 1.0, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_bookkeeping_error_after_placement_is_not_an_order_error():
+    exchange = FakeExchange(created=order("closed", 1.0))
+    executor, positions = make_executor(exchange)
+
+    def fail(*args):
+        raise KeyError("position store")
+
+    positions.update_position_on_fill = fail
+    with pytest.raises(KeyError):
+        await executor.execute_signal(SIGNAL, {})
+
+
+@pytest.mark.asyncio
+async def test_simulated_batch_applies_every_fill(monkeypatch):
+    executor, positions = make_executor(FakeExchange())
+    executor.simulate_orders = True
+    # Every order lands in the same millisecond
+    monkeypatch.setattr(time, "time_ns", lambda: 1_792_109_744_078_000_000)
+    symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT"]
+    signals = [
+        Signal(action="BUY", symbol=symbol, order_type="MARKET", quantity=1.0)
+        for symbol in symbols
+    ]
+    prices = {symbol: 10.0 * (i + 1) for i, symbol in enumerate(symbols)}
+
+    results = await executor.execute_signals_batch(signals, prices)
+
+    assert len({result["id"] for result in results}) == len(symbols)
+    assert sorted(positions.fills) == sorted(
+        (symbol, 1.0, prices[symbol]) for symbol in symbols
+    )
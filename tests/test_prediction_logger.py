@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from hydrobot.database import db_utils
+from hydrobot.database.models import Base, FeatureBlob
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    batches = []
+
+    def record(predictions):
+        batches.append([p["symbol"] for p in predictions])
+        return True
+
+    monkeypatch.setattr(db_utils, "log_predictions", record)
+    return batches
+
+
+def log(logger, symbol):
+    logger.log("model", symbol, 1, 0.9, {"rsi": 50.0})
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_without_waiting(batches):
+    logger = db_utils.PredictionLogger(flush_interval=60, batch_size=2)
+    await logger.start()
+    try:
+        for symbol in ("A", "B", "C"):
+            log(logger, symbol)
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        assert batches == [["A", "B"]]
+    finally:
+        await logger.stop()
+    assert batches == [["A", "B"], ["C"]]
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_rows_queued_before_start(batches):
+    logger = db_utils.PredictionLogger()
+    log(logger, "A")
+    log(logger, "B")
+    await logger.stop()
+    assert batches == [["A", "B"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_the_logger(monkeypatch):
+    batches = []
+
+    def record(predictions):
+        if any(p["symbol"] == "BAD" for p in predictions):
+            raise TypeError("unserializable features")
+        batches.append([p["symbol"] for p in predictions])
+        return True
+
+    monkeypatch.setattr(db_utils, "log_predictions", record)
+    logger = db_utils.PredictionLogger(flush_interval=60, batch_size=1)
+    await logger.start()
+    try:
+        log(logger, "BAD")
+        log(logger, "A")
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        assert not logger._task.done()
+    finally:
+        await logger.stop()
+    assert batches == [["A"]]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    database = SimpleNamespace(URL=f"sqlite:///{tmp_path / 'bot.db'}", ECHO=False)
+    monkeypatch.setattr(db_utils, "settings", SimpleNamespace(database=database))
+    db_utils.get_engine.cache_clear()
+    engine = db_utils.get_engine()
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+    db_utils.get_engine.cache_clear()
+
+
+def test_numpy_features_share_a_blob_with_python_numbers(engine):
+    predictions = [
+        dict(
+            model_name="model",
+            symbol="BTC/USDT",
+            prediction=1,
+            confidence=0.9,
+            features=features,
+        )
+        for features in (
+            {"rsi": np.float64(55.0), "spread": np.float32(0.5), "n": np.int64(3)},
+            {"rsi": 55.0, "spread": 0.5, "n": 3},
+        )
+    ]
+    with Session(engine) as session:
+        assert db_utils.log_predictions(predictions, session)
+        session.commit()
+        assert session.scalar(select(func.count()).select_from(FeatureBlob)) == 1
+        payload = session.scalar(select(FeatureBlob.payload))
+    assert payload == {"rsi": 55.0, "spread": 0.5, "n": 3}
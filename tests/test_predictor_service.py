@@ -0,0 +1,98 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+predictor = pytest.importorskip("hydrobot.models.predictor")
+
+
+class ThresholdModel:
+    """Predicts class 1 when the first feature is positive."""
+
+    classes_ = np.array([0, 1])
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        up = (X[:, 0] > 0).astype(float)
+        return np.column_stack([1 - up, up])
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = ThresholdModel()
+    metadata = {"feature_index": pd.Index(["a", "b"])}
+    monkeypatch.setattr(predictor, "load_model_and_metadata", lambda: (model, metadata))
+    return model
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_model_call(model):
+    service = predictor.PredictorService(flush_interval=0.05)
+    await service.start()
+    try:
+        results = await asyncio.gather(
+            service.predict("BTC/USDT", np.array([1.0, 0.0])),
+            service.predict("ETH/USDT", {"b": 5.0, "a": -1.0}),
+            service.predict("SOL/USDT", {"a": 1.0}),
+        )
+    finally:
+        await service.stop()
+    assert results == [(1, 1.0), (0, 0.0), None]
+    assert model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_answers_queued_requests(model):
+    service = predictor.PredictorService()
+    pending = asyncio.ensure_future(service.predict("BTC/USDT", {"a": 2.0, "b": 0.0}))
+    await asyncio.sleep(0)
+    await service.stop()
+    assert await pending == (1, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_bad_rows_do_not_stop_the_service(model):
+    service = predictor.PredictorService(flush_interval=0.01)
+    await service.start()
+    try:
+        bad = await asyncio.wait_for(
+            asyncio.gather(
+                service.predict("BTC/USDT", {"a": "n/a", "b": 0.0}),
+                service.predict("ETH/USDT", [[1.0], [2.0, 3.0]]),
+                service.predict("SOL/USDT", {"a": 1.0, "b": 0.0}),
+            ),
+            timeout=1,
+        )
+        good = await asyncio.wait_for(
+            service.predict("BTC/USDT", {"a": 1.0, "b": 0.0}), timeout=1
+        )
+    finally:
+        await service.stop()
+    assert bad == [None, None, (1, 1.0)]
+    assert good == (1, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_failed_model_call_answers_every_request(model):
+    def fail(X):
+        raise RuntimeError("model exploded")
+
+    model.predict_proba = fail
+    service = predictor.PredictorService(flush_interval=0.01)
+    await service.start()
+    try:
+        first = await asyncio.wait_for(
+            service.predict("BTC/USDT", {"a": 1.0, "b": 0.0}), timeout=1
+        )
+        del model.predict_proba
+        second = await asyncio.wait_for(
+            service.predict("BTC/USDT", {"a": 1.0, "b": 0.0}), timeout=1
+        )
+    finally:
+        await service.stop()
+    assert first is None
+    assert second == (1, 1.0)
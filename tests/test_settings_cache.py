@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from hydrobot.config import settings as config
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "hydrobot" / "config-test.pkl")
+
+
+def test_settings_cache_round_trip(cache_path):
+    config._store_cached_settings(cache_path, config.settings)
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+    assert os.stat(os.path.dirname(cache_path)).st_mode & 0o777 == 0o700
+    assert config._load_cached_settings(cache_path) == config.settings
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_settings_cache_writable_by_others_is_not_unpickled(cache_path):
+    config._store_cached_settings(cache_path, config.settings)
+    os.chmod(cache_path, 0o666)
+    assert config._load_cached_settings(cache_path) is None
+
+    os.chmod(cache_path, 0o600)
+    os.chmod(os.path.dirname(cache_path), 0o777)
+    assert config._load_cached_settings(cache_path) is None
+
+
+def test_config_mirror_follows_content_not_mtime(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(config, "CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("value: 1\n")
+    assert config._read_config_file(str(config_file)) == {"value": 1}
+    assert config._read_config_file(str(config_file)) == {"value": 1}
+
+    # A replacement with an older mtime (cp -p, git checkout, backups)
+    config_file.write_text("value: 7\n")
+    os.utime(config_file, (0, 0))
+    assert config._read_config_file(str(config_file)) == {"value": 7}
+    assert len(os.listdir(tmp_path / "cache")) == 1
@@ -0,0 +1,34 @@
+import numpy as np
+
+from hydrobot.strategies import _kernels
+
+PRICES = 30000 + np.cumsum(np.random.default_rng(0).normal(size=1003))
+
+
+def test_welford_push_matches_numpy_window():
+    buf, state = np.zeros(20), np.zeros(4)
+    for p in PRICES:
+        _kernels.welford_push(buf, state, p)
+    window = PRICES[-20:]
+    _, mean, std, _, _ = _kernels.mean_reversion_signal(state, 20, 1.5, PRICES[-1])
+    np.testing.assert_allclose([mean, std], [window.mean(), window.std()], rtol=1e-9)
+
+
+def test_sum_push_tracks_window_mean():
+    buf, state = np.zeros(7), np.zeros(3)
+    for p in PRICES:
+        _kernels.sum_push(buf, state, p)
+    _, vwap, _ = _kernels.vwap_signal(state, 0.002, PRICES[-1])
+    np.testing.assert_allclose(vwap, PRICES[-7:].mean())
+
+
+def test_dual_sum_push_tracks_both_windows():
+    for short, long in [(5, 13), (13, 5)]:
+        buf, state = np.zeros(max(short, long)), np.zeros(4)
+        for p in PRICES:
+            _kernels.dual_sum_push(buf, state, p, short, long)
+        action, short_ma, long_ma = _kernels.crossover_signal(state, short, long)
+        np.testing.assert_allclose(short_ma, PRICES[-short:].mean())
+        np.testing.assert_allclose(long_ma, PRICES[-long:].mean())
+        expected = _kernels.BUY if short_ma > long_ma else _kernels.SELL
+        assert action == expected
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hydrobot.data_ingestion import _ta_numba
+
+CLOSE = np.array([101, 102, 101, 101, 104, 105, 106, 105, 106, 107] * 3, dtype=float)
+
+
+def test_ema_matches_sma_seeded_pandas():
+    out = _ta_numba.ema(CLOSE, 5)
+    seeded = pd.Series(CLOSE).copy()
+    seeded.iloc[:5] = np.nan
+    seeded.iloc[4] = CLOSE[:5].mean()
+    expected = seeded.ewm(span=5, adjust=False).mean().to_numpy()
+    assert np.isnan(out[:4]).all()
+    np.testing.assert_allclose(out[4:], expected[4:])
+
+
+def test_rsi_bounds_and_warmup():
+    out = _ta_numba.rsi(CLOSE, 14)
+    assert np.isnan(out[:14]).all()
+    assert ((out[14:] >= 0) & (out[14:] <= 100)).all()
+
+
+def test_macd_histogram_is_line_minus_signal():
+    line, signal, hist = _ta_numba.macd(CLOSE, 3, 5, 2)
+    valid = ~np.isnan(signal)
+    assert valid.any()
+    np.testing.assert_allclose(hist[valid], line[valid] - signal[valid])
+
+
+def _pandas_ta_rsi(close, length):
+    # pandas_ta.rsi without talib: rma() is ewm(alpha=1/length, adjust=True)
+    negative = pd.Series(close).diff()
+    positive = negative.copy()
+    positive[positive < 0] = 0
+    negative[negative > 0] = 0
+    pos = positive.ewm(alpha=1.0 / length, min_periods=length).mean()
+    neg = negative.ewm(alpha=1.0 / length, min_periods=length).mean()
+    return (100 * pos / (pos + neg.abs())).to_numpy()
+
+
+def test_rsi_matches_pandas_ta_rma_from_first_bar():
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(size=300))
+    np.testing.assert_allclose(
+        _ta_numba.rsi(close, 14), _pandas_ta_rsi(close, 14), rtol=1e-10
+    )
+
+
+def test_live_kernels_match_pandas_ta():
+    ta = pytest.importorskip("pandas_ta")
+    close = 100 + np.cumsum(np.random.default_rng(1).normal(size=300))
+    series = pd.Series(close)
+
+    np.testing.assert_allclose(
+        _ta_numba.rsi(close, 14), ta.rsi(series, length=14, talib=False), rtol=1e-10
+    )
+    np.testing.assert_allclose(
+        _ta_numba.ema(close, 10), ta.ema(series, length=10, talib=False), rtol=1e-10
+    )
+    line, signal, hist = _ta_numba.macd(close, 12, 26, 9)
+    expected = ta.macd(series, fast=12, slow=26, signal=9, talib=False)
+    np.testing.assert_allclose(line, expected.iloc[:, 0], rtol=1e-10)
+    np.testing.assert_allclose(hist, expected.iloc[:, 1], rtol=1e-10)
+    np.testing.assert_allclose(signal, expected.iloc[:, 2], rtol=1e-10)
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pandas_ta")
+
+from hydrobot.data_ingestion import technicals  # noqa: E402
+
+COLUMNS = (
+    "sma_fast",
+    "sma_slow",
+    "ema_fast",
+    "ema_slow",
+    "rsi_value",
+    "macd_line",
+    "macd_signal",
+    "macd_hist",
+)
+
+
+def _period(fast, slow):
+    return SimpleNamespace(fast_period=fast, slow_period=slow)
+
+
+@pytest.fixture
+def indicator_settings(monkeypatch):
+    indicators = SimpleNamespace(
+        sma=_period(5, 20),
+        ema=_period(8, 21),
+        rsi=SimpleNamespace(period=14),
+        macd=SimpleNamespace(fast_period=12, slow_period=26, signal_period=9),
+    )
+    monkeypatch.setattr(technicals, "settings", SimpleNamespace(indicators=indicators))
+
+
+def test_incremental_matches_live_batch_indicators(indicator_settings):
+    close = 100 + np.cumsum(np.random.default_rng(2).normal(size=300))
+    df = pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1.0}
+    )
+    batch = technicals.calculate_indicators(df.copy(), live=True)
+
+    state = {}
+    rows = [
+        technicals.update_indicators_incremental(state, {"close": c}) for c in close
+    ]
+    incremental = pd.DataFrame(rows, dtype=float)
+
+    for column in COLUMNS:
+        np.testing.assert_allclose(
+            incremental[column], batch[column], rtol=1e-9, atol=1e-9, err_msg=column
+        )
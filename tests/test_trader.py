@@ -0,0 +1,111 @@
+import pytest
+
+from hydrobot.config.settings import settings
+from hydrobot.strategies.base_strategy import Signal
+from hydrobot.trader import TradingManager
+
+
+class RecordingStrategy:
+    def __init__(self):
+        self.predictions = []
+
+    def generate_signal(self, market_data, model_prediction=None):
+        self.predictions.append(model_prediction)
+        return Signal(symbol="BTC/USDT")
+
+    def get_name(self):
+        return "recording"
+
+
+class Strategies:
+    def __init__(self, strategy):
+        self.strategy = strategy
+
+    def get_strategy_for_symbol(self, symbol, market_regime):
+        return self.strategy
+
+
+class Positions:
+    def get_total_portfolio_value(self, prices):
+        return 1000.0
+
+
+class RejectAll:
+    def validate_trade(self, signal, portfolio_value, prices):
+        return None
+
+
+class FakePredictor:
+    model_name = "fake_model"
+
+    def __init__(self, result=(1, 0.8)):
+        self.result = result
+        self.requests = []
+
+    async def predict(self, symbol, features):
+        self.requests.append((symbol, features))
+        return self.result
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.rows = []
+
+    def log(self, model_name, symbol, prediction, confidence, features):
+        self.rows.append((model_name, symbol, prediction, confidence, features))
+
+
+FEATURES = {"rsi": 55.0, "spread": 0.01}
+
+
+def make_manager(predictor=None, prediction_logger=None):
+    strategy = RecordingStrategy()
+    manager = TradingManager(
+        settings,
+        Strategies(strategy),
+        Positions(),
+        RejectAll(),
+        order_executor=None,
+        predictor=predictor,
+        prediction_logger=prediction_logger,
+    )
+    return manager, strategy
+
+
+@pytest.mark.asyncio
+async def test_trade_cycle_passes_model_prediction_to_strategy():
+    predictor = FakePredictor()
+    manager, strategy = make_manager(predictor)
+    await manager._run_trade_cycle("BTC/USDT", {"features": FEATURES})
+    assert predictor.requests == [("BTC/USDT", FEATURES)]
+    assert strategy.predictions == [{"prediction": 1, "confidence": 0.8}]
+
+
+@pytest.mark.asyncio
+async def test_trade_cycle_without_features_or_predictor_skips_prediction():
+    predictor = FakePredictor()
+    manager, strategy = make_manager(predictor)
+    await manager._run_trade_cycle("BTC/USDT", {"last_trade": 100.0})
+    assert predictor.requests == []
+
+    manager, strategy = make_manager()
+    await manager._run_trade_cycle("BTC/USDT", {"features": FEATURES})
+    assert strategy.predictions == [None]
+
+
+@pytest.mark.asyncio
+async def test_trade_cycle_logs_model_prediction():
+    prediction_logger = RecordingLogger()
+    manager, _ = make_manager(FakePredictor(), prediction_logger)
+    await manager._run_trade_cycle("BTC/USDT", {"features": FEATURES})
+    await manager._run_trade_cycle("BTC/USDT", {"last_trade": 100.0})
+    assert prediction_logger.rows == [("fake_model", "BTC/USDT", 1, 0.8, FEATURES)]
+
+
+@pytest.mark.asyncio
+async def test_failed_prediction_is_not_logged():
+    prediction_logger = RecordingLogger()
+    manager, strategy = make_manager(FakePredictor(result=None), prediction_logger)
+    await manager._run_trade_cycle("BTC/USDT", {"features": FEATURES})
+    assert prediction_logger.rows == []
+    assert strategy.predictions == [None]